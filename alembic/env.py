@@ -1,4 +1,3 @@
-import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config, pool
@@ -6,16 +5,16 @@ from sqlmodel import SQLModel
 
 from alembic import context
 
+import app.models  # noqa: F401 - registers every table on SQLModel.metadata
 from app.core.config import settings
-from app.models import (
-    User, Organization, League, Team, Player, Game, Post
-)
 
 config = context.config
 
-config.set_main_option("sqlalchemy.url", settings.database_url)
+# ConfigParser treats "%" as interpolation, which URL-encoded passwords use.
+config.set_main_option("sqlalchemy.url", settings.database_url.replace("%", "%%"))
 
-if config.config_file_name is not None:
+# init_db() passes in its own connection; the app has already configured logging.
+if config.config_file_name is not None and "connection" not in config.attributes:
     fileConfig(config.config_file_name)
 
 target_metadata = SQLModel.metadata
@@ -28,6 +27,19 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        render_as_batch=url.startswith("sqlite"),
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection) -> None:
+    # SQLite can't ALTER most constraints in place; batch mode rebuilds the table.
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=connection.dialect.name == "sqlite",
     )
 
     with context.begin_transaction():
@@ -35,6 +47,11 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -42,12 +59,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+        do_run_migrations(connection)
 
 
 if context.is_offline_mode():
@@ -1,13 +1,554 @@
-import copy
-import functools
+import asyncio
 import hashlib
 import json
-from typing import Any, Callable
+import logging
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Awaitable, Callable, NamedTuple
 
-from cachetools import TTLCache
+from cachetools import TLRUCache
+from fastapi import Response
+from prometheus_client import Counter, Gauge
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.background import BackgroundTask
 
-list_cache = TTLCache(maxsize=1000, ttl=60)
-entity_cache = TTLCache(maxsize=5000, ttl=120)
+from app.core.compression import accepted_encoding_var, encoded_etag, precompress
+from app.core.config import settings
+from app.core.responses import render_json
+from app.db import pin_to_primary
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """Storage interface used by the list and entity caches."""
+
+    def get(self, key: str) -> Any | None:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, tags: list[str] | None = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> None:
+        raise NotImplementedError
+
+    def delete_tags(self, tags: list[str]) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+def key_prefix(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+def approximate_size(value: Any) -> int:
+    """Rough in-memory weight of a cached value, in bytes."""
+    body = getattr(value, "body", None)
+    if isinstance(body, bytes):
+        return len(body) + sum(len(variant) for _, variant in getattr(value, "encoded", ()))
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+CACHE_HITS = Counter("cache_hits_total", "Cache lookups that found an entry", ["cache", "tier", "prefix"])
+CACHE_MISSES = Counter("cache_misses_total", "Cache lookups that found nothing", ["cache", "tier", "prefix"])
+CACHE_SETS = Counter("cache_sets_total", "Entries written to the cache", ["cache", "tier", "prefix"])
+CACHE_EVICTIONS = Counter(
+    "cache_evictions_total", "Entries dropped by the cache itself", ["cache", "prefix", "reason"]
+)
+CACHE_INVALIDATIONS = Counter(
+    "cache_invalidations_total", "Entries removed by an explicit invalidation", ["cache", "prefix"]
+)
+CACHE_ENTRIES = Gauge("cache_entries", "Entries currently held in the worker's cache", ["cache", "prefix"])
+CACHE_BYTES = Gauge("cache_bytes", "Approximate bytes held in the worker's cache", ["cache", "prefix"])
+
+
+class _IndexedTLRUCache(TLRUCache):
+    """TLRUCache that reports every key it drops and why: deleted, evicted or expired."""
+
+    def __init__(self, max_bytes: int, ttl_for: Callable[[str], float], on_remove: Callable[[str, str], None]):
+        super().__init__(maxsize=max_bytes, ttu=lambda key, value, now: now + ttl_for(key), getsizeof=approximate_size)
+        self._on_remove = on_remove
+        self._reason = "deleted"
+
+    def __delitem__(self, key):
+        try:
+            super().__delitem__(key)
+        finally:
+            self._on_remove(key, self._reason)
+
+    def popitem(self):
+        self._reason = "evicted"
+        try:
+            return super().popitem()
+        finally:
+            self._reason = "deleted"
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, _ in expired:
+            self._on_remove(key, "expired")
+        return expired
+
+
+class LocalBackend(CacheBackend):
+    """In-process TTL cache. Fast, but private to a single worker.
+
+    Capacity is a byte budget rather than an entry count: every entry is
+    weighed with approximate_size and least recently used entries are
+    evicted once the total would exceed ``max_bytes``.
+
+    Keeps a reverse index from tag to keys so a tag invalidation only
+    touches the entries carrying that tag, and reports hit, miss, eviction
+    and size metrics per key prefix.
+
+    Entries live for ``ttl`` seconds, or ``ttl_for(key)`` when given.
+    """
+
+    tier = "local"
+
+    def __init__(
+        self, max_bytes: int, ttl: float, name: str = "list", ttl_for: Callable[[str], float] | None = None
+    ):
+        self.name = name
+        self._cache = _IndexedTLRUCache(
+            max_bytes=max_bytes, ttl_for=ttl_for or (lambda key: ttl), on_remove=self._on_remove
+        )
+        self._lock = threading.RLock()
+        self._tag_keys: dict[str, set[str]] = {}
+        self._key_tags: dict[str, tuple[str, ...]] = {}
+        self._sizes: dict[str, int] = {}
+
+    def _on_remove(self, key: str, reason: str) -> None:
+        if self._forget(key) and reason != "deleted":
+            CACHE_EVICTIONS.labels(self.name, key_prefix(key), reason).inc()
+
+    def _forget(self, key: str) -> bool:
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_keys[tag]
+        size = self._sizes.pop(key, None)
+        if size is None:
+            return False
+        prefix = key_prefix(key)
+        CACHE_ENTRIES.labels(self.name, prefix).dec()
+        CACHE_BYTES.labels(self.name, prefix).dec(size)
+        return True
+
+    def _invalidate(self, key: str) -> None:
+        if key in self._cache:
+            self._cache.pop(key, None)
+            CACHE_INVALIDATIONS.labels(self.name, key_prefix(key)).inc()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            value = self._cache.get(key)
+        (CACHE_MISSES if value is None else CACHE_HITS).labels(self.name, self.tier, key_prefix(key)).inc()
+        return value
+
+    def set(self, key: str, value: Any, tags: list[str] | None = None) -> None:
+        size = approximate_size(value)
+        prefix = key_prefix(key)
+        with self._lock:
+            self._forget(key)
+            try:
+                self._cache[key] = value
+            except ValueError:
+                # A single value larger than the whole budget is never cached.
+                self._cache.pop(key, None)
+                return
+            if key in self._cache:
+                self._sizes[key] = size
+                CACHE_ENTRIES.labels(self.name, prefix).inc()
+                CACHE_BYTES.labels(self.name, prefix).inc(size)
+                if tags:
+                    self._key_tags[key] = tuple(tags)
+                    for tag in tags:
+                        self._tag_keys.setdefault(tag, set()).add(key)
+        CACHE_SETS.labels(self.name, self.tier, prefix).inc()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._invalidate(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for k in [k for k in self._cache.keys() if k.startswith(prefix)]:
+                self._invalidate(k)
+
+    def delete_tags(self, tags: list[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                for k in list(self._tag_keys.get(tag, ())):
+                    self._invalidate(k)
+
+    def clear(self) -> None:
+        self.delete_prefix("")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    @property
+    def currsize(self) -> int:
+        with self._lock:
+            return self._cache.currsize
+
+
+class SQLiteBackend(CacheBackend):
+    """Cache shared by every worker on the host through a single SQLite file.
+
+    Besides the entries themselves, every invalidation is appended to an
+    ordered log so that workers can replay it against their own L1.
+
+    Entries live for ``ttl`` seconds, or ``ttl_for(key)`` when given; ``ttl``
+    must be the longest of those, since it also bounds the log.
+    """
+
+    tier = "shared"
+
+    def __init__(self, path: str, namespace: str, ttl: float, ttl_for: Callable[[str], float] | None = None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self._ttl_for = ttl_for or (lambda key: ttl)
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self._conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, expires_at REAL NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_invalidations ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, namespace TEXT NOT NULL, kind TEXT NOT NULL, "
+            "value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_tags ("
+            "namespace TEXT NOT NULL, tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (namespace, tag, key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_cache_tags_key ON cache_tags (namespace, key)")
+
+    def get(self, key: str) -> Any | None:
+        found = self.get_with_tags(key)
+        return found[0] if found else None
+
+    def get_with_tags(self, key: str) -> tuple[Any, list[str]] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache_entries WHERE namespace = ? AND key = ? AND expires_at > ?",
+                (self.namespace, key, time.time()),
+            ).fetchone()
+            if row is None:
+                CACHE_MISSES.labels(self.namespace, self.tier, key_prefix(key)).inc()
+                return None
+            tags = [t for (t,) in self._conn.execute(
+                "SELECT tag FROM cache_tags WHERE namespace = ? AND key = ?", (self.namespace, key)
+            )]
+        CACHE_HITS.labels(self.namespace, self.tier, key_prefix(key)).inc()
+        return pickle.loads(row[0]), tags
+
+    def set(self, key: str, value: Any, tags: list[str] | None = None) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (self.namespace, key, blob, time.time() + self._ttl_for(key)),
+                )
+                self._conn.execute("DELETE FROM cache_tags WHERE namespace = ? AND key = ?", (self.namespace, key))
+                if tags:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO cache_tags (namespace, tag, key) VALUES (?, ?, ?)",
+                        [(self.namespace, tag, key) for tag in tags],
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        CACHE_SETS.labels(self.namespace, self.tier, key_prefix(key)).inc()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ? AND key = ?", (self.namespace, key))
+            self._publish("key", key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key LIKE ? ESCAPE '\\'",
+                (self.namespace, escaped + "%"),
+            )
+            self._publish("prefix", prefix)
+
+    def delete_tags(self, tags: list[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key IN "
+                    "(SELECT key FROM cache_tags WHERE namespace = ? AND tag = ?)",
+                    (self.namespace, self.namespace, tag),
+                )
+                self._conn.execute("DELETE FROM cache_tags WHERE namespace = ? AND tag = ?", (self.namespace, tag))
+                self._publish("tag", tag)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,))
+            self._conn.execute("DELETE FROM cache_tags WHERE namespace = ?", (self.namespace,))
+            self._publish("prefix", "")
+
+    def last_seq(self) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(seq) FROM cache_invalidations").fetchone()
+        return row[0] or 0
+
+    def invalidations_since(self, seq: int) -> list[tuple[int, str, str]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT seq, kind, value FROM cache_invalidations WHERE seq > ? AND namespace = ? ORDER BY seq",
+                (seq, self.namespace),
+            ).fetchall()
+
+    def _publish(self, kind: str, value: str) -> None:
+        now = time.time()
+        self._conn.execute(
+            "INSERT INTO cache_invalidations (namespace, kind, value, created_at) VALUES (?, ?, ?, ?)",
+            (self.namespace, kind, value, now),
+        )
+        if now - self._last_sweep < self.ttl:
+            return
+        self._last_sweep = now
+        # An L1 entry never outlives the TTL, so older log rows can no longer matter.
+        self._conn.execute("DELETE FROM cache_invalidations WHERE created_at < ?", (now - 2 * self.ttl,))
+        self._conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        self._conn.execute(
+            "DELETE FROM cache_tags WHERE namespace = ? AND key NOT IN "
+            "(SELECT key FROM cache_entries WHERE namespace = ?)",
+            (self.namespace, self.namespace),
+        )
+
+
+class TieredBackend(CacheBackend):
+    """Per-worker L1 in front of a shared L2.
+
+    Before every read the worker replays invalidations published by other
+    workers since its last read, so an invalidation anywhere reaches every L1.
+    """
+
+    def __init__(self, l1: LocalBackend, l2: SQLiteBackend):
+        self.l1 = l1
+        self.l2 = l2
+        self._seen = l2.last_seq()
+        self._sync_lock = threading.Lock()
+
+    def sync(self) -> None:
+        with self._sync_lock:
+            events = self.l2.invalidations_since(self._seen)
+            for seq, kind, value in events:
+                if kind == "key":
+                    self.l1.delete(value)
+                elif kind == "tag":
+                    self.l1.delete_tags([value])
+                else:
+                    self.l1.delete_prefix(value)
+                self._seen = seq
+
+    def get(self, key: str) -> Any | None:
+        self.sync()
+        value = self.l1.get(key)
+        if value is None:
+            found = self.l2.get_with_tags(key)
+            if found is not None:
+                value, tags = found
+                self.l1.set(key, value, tags)
+        return value
+
+    def set(self, key: str, value: Any, tags: list[str] | None = None) -> None:
+        self.l2.set(key, value, tags)
+        self.l1.set(key, value, tags)
+
+    def delete(self, key: str) -> None:
+        self.l1.delete(key)
+        self.l2.delete(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        self.l1.delete_prefix(prefix)
+        self.l2.delete_prefix(prefix)
+
+    def delete_tags(self, tags: list[str]) -> None:
+        self.l1.delete_tags(tags)
+        self.l2.delete_tags(tags)
+
+    def clear(self) -> None:
+        self.l1.clear()
+        self.l2.clear()
+
+
+def build_cache(
+    namespace: str, max_bytes: int, ttl: float, ttl_for: Callable[[str], float] | None = None
+) -> CacheBackend:
+    local = LocalBackend(max_bytes=max_bytes, ttl=ttl, name=namespace, ttl_for=ttl_for)
+    if settings.cache_backend == "sqlite":
+        return TieredBackend(local, SQLiteBackend(settings.cache_sqlite_path, namespace, ttl, ttl_for))
+    return local
+
+
+class CachePolicy(NamedTuple):
+    """Freshness rules for the list pages under one key prefix.
+
+    Until ``soft_ttl`` a page is served as-is. Between ``soft_ttl`` and
+    ``hard_ttl`` it is still served immediately while a refresh runs in the
+    background. Past ``hard_ttl`` the request waits for a recompute.
+
+    ``max_age`` is how long browsers may reuse a page without asking again.
+    It is zero for pages the user's own writes must show up in at once;
+    those clients revalidate every time and get a 304 while nothing changed.
+    """
+
+    soft_ttl: float
+    hard_ttl: float
+    max_age: int = 0
+
+    @property
+    def cache_control(self) -> str:
+        if not self.max_age:
+            return "no-cache"
+        value = f"private, max-age={self.max_age}"
+        if self.hard_ttl > self.max_age:
+            value += f", stale-while-revalidate={int(self.hard_ttl - self.max_age)}"
+        return value
+
+
+DEFAULT_LIST_POLICY = CachePolicy(soft_ttl=60, hard_ttl=60)
+
+# Browse pages where a slightly stale answer beats making the user wait.
+LIST_CACHE_POLICIES: dict[str, CachePolicy] = {
+    "venues": CachePolicy(soft_ttl=60, hard_ttl=600, max_age=60),
+    "leagues": CachePolicy(soft_ttl=60, hard_ttl=600, max_age=60),
+    "sports": CachePolicy(soft_ttl=300, hard_ttl=3600, max_age=300),
+    "channels": CachePolicy(soft_ttl=30, hard_ttl=300, max_age=30),
+}
+
+
+def list_policy(cache_id: str) -> CachePolicy:
+    return LIST_CACHE_POLICIES.get(cache_id.split(":", 1)[0], DEFAULT_LIST_POLICY)
+
+
+list_cache = build_cache(
+    "list",
+    max_bytes=settings.list_cache_max_bytes,
+    ttl=max([DEFAULT_LIST_POLICY.hard_ttl] + [p.hard_ttl for p in LIST_CACHE_POLICIES.values()]),
+    # A page past its policy's hard TTL is never served, so it need not be kept.
+    ttl_for=lambda key: list_policy(key).hard_ttl,
+)
+entity_cache = build_cache("entity", max_bytes=settings.entity_cache_max_bytes, ttl=120)
+auth_cache = build_cache("auth", max_bytes=settings.auth_cache_max_bytes, ttl=settings.auth_cache_ttl_s)
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class _LeaderCancelled(Exception):
+    """Handed to async followers when the leading request was cancelled."""
+
+
+class SingleFlight:
+    """Collapses concurrent computations of the same key into one.
+
+    The first caller for a key runs the computation; callers arriving while
+    it is in flight wait for and share its result (or its exception).
+    ``do`` serves sync handlers running in the threadpool, ``do_async``
+    serves coroutines on the event loop. If an async leader is cancelled,
+    say by a client disconnect, its followers retry and one of them leads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self._async_flights: dict[str, asyncio.Future] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result
+
+    async def do_async(self, key: str, fn: Callable[[], Any]) -> Any:
+        while (future := self._async_flights.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_flights[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Not cancel(): that would cancel every follower along with us.
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._async_flights[key]
+
+
+list_flights = SingleFlight()
+entity_flights = SingleFlight()
 
 
 def cache_key(*args, **kwargs) -> str:
@@ -15,58 +556,261 @@ def cache_key(*args, **kwargs) -> str:
     return hashlib.md5(json.dumps(key_data, default=str, sort_keys=True).encode()).hexdigest()
 
 
-def get_cached_list(cache_id: str) -> dict | None:
-    if cache_id in list_cache:
-        return copy.deepcopy(list_cache[cache_id])
+class CachedPayload(NamedTuple):
+    """A response body encoded once at write time and served as-is on every hit.
+
+    ``encoded`` holds compressed copies of the body by Content-Encoding, so
+    a hit never pays for compression either.
+    """
+
+    body: bytes
+    created_at: float
+    etag: str = ""
+    media_type: str = "application/json"
+    encoded: tuple[tuple[str, bytes], ...] = ()
+
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+    def to_response(self, cache_control: str = "no-cache") -> Response:
+        headers = {"Cache-Control": cache_control}
+        body, etag = self.body, self.etag
+        if self.encoded:
+            headers["Vary"] = "Accept-Encoding"
+            encoding = accepted_encoding_var.get()
+            for name, variant in self.encoded:
+                if name == encoding:
+                    body, etag = variant, encoded_etag(etag, encoding)
+                    headers["Content-Encoding"] = encoding
+                    break
+        if etag:
+            headers["ETag"] = etag
+        return Response(content=body, media_type=self.media_type, headers=headers)
+
+
+def payload_etag(body: bytes) -> str:
+    return '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def encode_payload(result: Any, compress: bool = False) -> CachedPayload:
+    # The same encoder as FastJSONResponse, so a cached body matches a fresh one.
+    body = render_json(result)
+    return CachedPayload(body, time.time(), payload_etag(body), encoded=precompress(body) if compress else ())
+
+
+def _fresh_list_entry(cache_id: str) -> CachedPayload | None:
+    cached = list_cache.get(cache_id)
+    if cached is not None and cached.age() >= list_policy(cache_id).hard_ttl:
+        return None
+    return cached
+
+
+def get_cached_list(cache_id: str) -> Response | None:
+    """Return a ready-to-send response for a cached page.
+
+    Handlers return it directly, so a hit skips response_model validation
+    and JSON encoding entirely.
+    """
+    cached = _fresh_list_entry(cache_id)
+    if cached is not None:
+        return cached.to_response(list_policy(cache_id).cache_control)
     return None
 
 
-def set_cached_list(cache_id: str, result: dict) -> None:
-    list_cache[cache_id] = copy.deepcopy(result)
+def set_cached_list(cache_id: str, result: dict, tags: list[str] | None = None) -> None:
+    list_cache.set(cache_id, encode_payload(result, compress=True), tags)
+
+
+_refresh_lock = threading.Lock()
+_refreshing: set[str] = set()
+
+
+def _refresh_list(cache_id: str, bind: Any, compute: Callable[[Session], Any], tags: list[str] | None) -> None:
+    try:
+        with Session(bind) as session:
+            set_cached_list(cache_id, compute(session), tags)
+    except Exception:
+        logger.exception("Background refresh failed for %s", cache_id)
+    finally:
+        with _refresh_lock:
+            _refreshing.discard(cache_id)
+
+
+def load_cached_list(
+    cache_id: str,
+    session: Session,
+    compute: Callable[[Session], Any],
+    tags: list[str] | None = None,
+) -> Response:
+    """Serve a page from the cache, computing it at most once per key on a miss.
+
+    Concurrent requests that miss on the same key wait for the first one's
+    result instead of running the same queries themselves. A page past its
+    prefix's soft TTL is still served, and one request schedules a refresh
+    on a fresh session after its response has been sent. Fills and
+    refreshes always read from the primary, never a replica.
+    """
+    policy = list_policy(cache_id)
+    cached = _fresh_list_entry(cache_id)
+    if cached is None:
+        def fill() -> CachedPayload:
+            payload = _fresh_list_entry(cache_id)
+            if payload is None:
+                pin_to_primary(session)
+                payload = encode_payload(compute(session), compress=True)
+                list_cache.set(cache_id, payload, tags)
+            return payload
+
+        return list_flights.do(cache_id, fill).to_response(policy.cache_control)
+
+    response = cached.to_response(policy.cache_control)
+    if cached.age() >= policy.soft_ttl:
+        with _refresh_lock:
+            claimed = cache_id not in _refreshing
+            _refreshing.add(cache_id)
+        if claimed:
+            pin_to_primary(session)
+            response.background = BackgroundTask(_refresh_list, cache_id, session.get_bind(), compute, tags)
+    return response
+
+
+async def _refresh_list_async(
+    cache_id: str,
+    bind: Any,
+    sync_session_class: type[Session],
+    compute: Callable[[AsyncSession], Awaitable[Any]],
+    tags: list[str] | None,
+) -> None:
+    try:
+        async with AsyncSession(bind, sync_session_class=sync_session_class, info={"primary": True}) as session:
+            set_cached_list(cache_id, await compute(session), tags)
+    except Exception:
+        logger.exception("Background refresh failed for %s", cache_id)
+    finally:
+        with _refresh_lock:
+            _refreshing.discard(cache_id)
+
+
+async def load_cached_list_async(
+    cache_id: str,
+    session: AsyncSession,
+    compute: Callable[[AsyncSession], Awaitable[Any]],
+    tags: list[str] | None = None,
+) -> Response:
+    """``load_cached_list`` for handlers running on an ``AsyncSession``."""
+    policy = list_policy(cache_id)
+    cached = _fresh_list_entry(cache_id)
+    if cached is None:
+        async def fill() -> CachedPayload:
+            payload = _fresh_list_entry(cache_id)
+            if payload is None:
+                pin_to_primary(session)
+                payload = encode_payload(await compute(session), compress=True)
+                list_cache.set(cache_id, payload, tags)
+            return payload
+
+        return (await list_flights.do_async(cache_id, fill)).to_response(policy.cache_control)
+
+    response = cached.to_response(policy.cache_control)
+    if cached.age() >= policy.soft_ttl:
+        with _refresh_lock:
+            claimed = cache_id not in _refreshing
+            _refreshing.add(cache_id)
+        if claimed:
+            response.background = BackgroundTask(
+                _refresh_list_async, cache_id, session.bind, type(session.sync_session), compute, tags
+            )
+    return response
+
+
+def list_tags(prefix: str, **scopes) -> list[str]:
+    """Tags for a cached page of ``prefix`` filtered by the given entity ids.
+
+    A page scoped to an entity, e.g. ``season=12``, is tagged
+    ``games:season:12``. A page with no entity scope can contain rows from
+    anywhere and is tagged with the whole collection, ``games:*``.
+    """
+    tags = [f"{prefix}:{name}:{value}" for name, value in scopes.items() if value is not None]
+    return tags or [f"{prefix}:*"]
+
+
+def invalidate_list_tags(prefix: str, **scopes) -> None:
+    """Evict the ``prefix`` pages that can contain a row with these entity ids."""
+    tags = [f"{prefix}:*"]
+    tags += [f"{prefix}:{name}:{value}" for name, value in scopes.items() if value is not None]
+    list_cache.delete_tags(tags)
 
 
 def invalidate_list_cache(prefix: str) -> None:
-    keys_to_delete = [k for k in list_cache.keys() if k.startswith(prefix)]
-    for k in keys_to_delete:
-        del list_cache[k]
+    list_cache.delete_prefix(prefix)
+
+
+def invalidate_channel_pages() -> None:
+    """Evict the channel list, featured events and every channel page.
+
+    Channel pages summarize games, seasons and subscriptions across a whole
+    sport, so any write to those can change them.
+    """
+    invalidate_list_tags("channels")
+    invalidate_list_tags("channel_pages")
+
+
+def load_cached_entity(prefix: str, entity_id: int, session: Session, compute: Callable[[Session], Any]) -> Response:
+    """Serve a single object from the entity cache, computing it at most once on a miss.
+
+    ``compute`` returns a read model, never a live ORM object, and the
+    cache keeps only its encoded bytes, so nothing cached is tied to a
+    session. Exceptions such as a 404 are shared with waiting callers but
+    never cached.
+    """
+    key = f"{prefix}:{entity_id}"
+    cached = entity_cache.get(key)
+    if cached is None:
+        def fill() -> CachedPayload:
+            payload = entity_cache.get(key)
+            if payload is None:
+                pin_to_primary(session)
+                payload = encode_payload(compute(session))
+                entity_cache.set(key, payload)
+            return payload
+
+        cached = entity_flights.do(key, fill)
+    return cached.to_response()
+
+
+async def load_cached_entity_async(
+    prefix: str,
+    entity_id: int,
+    session: AsyncSession,
+    compute: Callable[[AsyncSession], Awaitable[Any]],
+) -> Response:
+    """``load_cached_entity`` for handlers running on an ``AsyncSession``."""
+    key = f"{prefix}:{entity_id}"
+    cached = entity_cache.get(key)
+    if cached is None:
+        async def fill() -> CachedPayload:
+            payload = entity_cache.get(key)
+            if payload is None:
+                pin_to_primary(session)
+                payload = encode_payload(await compute(session))
+                entity_cache.set(key, payload)
+            return payload
+
+        cached = await entity_flights.do_async(key, fill)
+    return cached.to_response()
+
+
+def set_cached_entity(prefix: str, entity_id: int, read_model: Any) -> None:
+    """Write-through after an update so the next GET does not hit the database."""
+    key = f"{prefix}:{entity_id}"
+    # A set is not an invalidation: without the delete, other workers'
+    # L1 copies would keep the old entity until they expire.
+    entity_cache.delete(key)
+    entity_cache.set(key, encode_payload(read_model))
 
 
 def invalidate_entity_cache(prefix: str, entity_id: int | None = None) -> None:
-    if entity_id:
-        key = f"{prefix}:{entity_id}"
-        if key in entity_cache:
-            del entity_cache[key]
+    if entity_id is not None:
+        entity_cache.delete(f"{prefix}:{entity_id}")
     else:
-        keys_to_delete = [k for k in entity_cache.keys() if k.startswith(prefix)]
-        for k in keys_to_delete:
-            del entity_cache[k]
-
-
-def cached_list(prefix: str):
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            key = f"{prefix}:{cache_key(*args[1:], **kwargs)}"
-            if key in list_cache:
-                return list_cache[key]
-            result = func(*args, **kwargs)
-            list_cache[key] = result
-            return result
-        return wrapper
-    return decorator
-
-
-def cached_entity(prefix: str):
-    def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            entity_id = kwargs.get("id") or (args[1] if len(args) > 1 else None)
-            key = f"{prefix}:{entity_id}"
-            if key in entity_cache:
-                return entity_cache[key]
-            result = func(*args, **kwargs)
-            if result:
-                entity_cache[key] = result
-            return result
-        return wrapper
-    return decorator
+        entity_cache.delete_prefix(prefix)
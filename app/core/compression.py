@@ -0,0 +1,109 @@
+import gzip
+import zlib
+from contextvars import ContextVar
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+# Preferred first when the client weights them equally.
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+COMPRESSIBLE_TYPES = frozenset({
+    "application/json",
+    "application/problem+json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+    "text/xml",
+})
+
+# On-the-fly compression favours speed; cached bodies are compressed once
+# per fill, so they can afford a denser setting.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+PRECOMPRESS_BROTLI_QUALITY = 9
+
+# The encoding negotiated for the current request, or None. Handlers that
+# serve precompressed bytes read it; CompressionMiddleware sets it.
+accepted_encoding_var: ContextVar[str | None] = ContextVar("accepted_encoding", default=None)
+
+
+def negotiate(accept_encoding: str) -> str | None:
+    """Pick the best supported encoding from an Accept-Encoding header."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        key, _, value = params.strip().partition("=")
+        if key.strip() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+
+    best, best_q = None, 0.0
+    for encoding in ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(content_type: str | None) -> bool:
+    if not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in COMPRESSIBLE_TYPES
+
+
+def compress(body: bytes, encoding: str, precompress: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=PRECOMPRESS_BROTLI_QUALITY if precompress else BROTLI_QUALITY)
+    # mtime=0 keeps the output, and so its ETag, stable for the same body.
+    return gzip.compress(body, compresslevel=9 if precompress else GZIP_LEVEL, mtime=0)
+
+
+def precompress(body: bytes) -> tuple[tuple[str, bytes], ...]:
+    """Every supported encoding of ``body``, or nothing if it is below the size threshold."""
+    if len(body) < settings.compression_min_bytes:
+        return ()
+    return tuple((encoding, compress(body, encoding, precompress=True)) for encoding in ENCODINGS)
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """A distinct strong ETag per encoding; weak ETags already allow any encoding."""
+    if not etag or etag.startswith("W/"):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+class StreamCompressor:
+    """Incremental compressor for responses sent in several body messages."""
+
+    def __init__(self, encoding: str) -> None:
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._compress = self._compressor.process
+            self._finish = self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+            self._compress = self._compressor.compress
+            self._finish = self._compressor.flush
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compress(chunk)
+
+    def finish(self) -> bytes:
+        return self._finish()
@@ -13,12 +13,78 @@ class Settings(BaseSettings):
 
     database_url: str = "sqlite:///./league.db"
 
+    # SQLite tuning applied to every new connection. WAL lets reads run
+    # alongside the writer, and synchronous=NORMAL is safe under WAL: a
+    # power cut can lose the last commits but never corrupts the file.
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size_kib: int = 64 * 1024
+    sqlite_temp_store: str = "MEMORY"
+
+    # Comma-separated read replica URLs. GET requests read from a healthy
+    # replica; writes, and reads by a client that wrote within
+    # read_after_write_window_s, stay on the primary.
+    database_replica_urls: str = ""
+    read_after_write_window_s: float = 5.0
+    replica_health_check_interval_s: int = 15
+
+    # Flag a request that runs one statement shape more than this many
+    # times, the usual sign of an N+1 query. "log" warns, "raise" fails the
+    # request (meant for dev and tests). 0 turns the check off.
+    sql_repeat_threshold: int = 0
+    sql_repeat_action: str = "log"
+
+    # Statements slower than this are logged with their redacted parameters,
+    # and the first time a statement shape is slow, with its query plan.
+    # 0 turns the log off.
+    slow_query_threshold_ms: float = 250
+    slow_query_explain: bool = True
+
+    # ?total=estimate serves a list's row count from a per-worker cache for
+    # this long (PostgreSQL answers unfiltered counts from table statistics).
+    count_estimate_ttl_s: float = 60
+
+    # Debug aid for connection leaks: remember where each pooled connection
+    # was checked out, warn when one is held longer than the threshold, and
+    # periodically log the ones that never came back.
+    db_pool_debug: bool = False
+    db_pool_hold_warning_s: float = 5.0
+
+    # Responses with a compressible content type are gzipped (and brotli'd
+    # when the brotli package is installed) from this size up. Cached list
+    # pages store their compressed bodies next to the raw ones.
+    compression_min_bytes: int = 1024
+
     # IMPORTANT: override in production via env var SECRET_KEY
     secret_key: str = "CHANGE_ME_IN_PROD"
     access_token_exp_minutes: int = 60 * 24 * 7  # 7 days
 
     cors_origins: str = "*"  # comma-separated origins, or "*" for dev
 
+    # "local" keeps caches private to each worker; "sqlite" adds a shared L2
+    # file so entries and invalidations are seen by every worker on the host.
+    cache_backend: str = "local"
+    cache_sqlite_path: str = "./league-cache.db"
+
+    # Per-worker memory budgets for the in-process caches, in bytes.
+    list_cache_max_bytes: int = 64 * 1024 * 1024
+    entity_cache_max_bytes: int = 32 * 1024 * 1024
+    auth_cache_max_bytes: int = 4 * 1024 * 1024
+
+    # How long a verified token and its user snapshot are reused before the
+    # JWT is checked and the user loaded again. Profile changes and
+    # deactivation evict the user right away, in every worker with the
+    # sqlite cache backend; non-GET requests always reload the user.
+    auth_cache_ttl_s: float = 30
+
+    # Comma-separated GET paths requested at startup to prefill the caches.
+    # Leave empty to skip the warm-up.
+    cache_warmup_paths: str = "/sports,/channels,/channels/featured/events,/venues,/leagues"
+    # A warm-up request slower than this is abandoned and counted as failed.
+    cache_warmup_timeout_s: float = 10
+
 
 settings = Settings()
 
@@ -0,0 +1,294 @@
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.compression import (
+    StreamCompressor,
+    accepted_encoding_var,
+    compress,
+    encoded_etag,
+    is_compressible,
+    negotiate,
+)
+from app.core.config import settings
+from app.core.logging import generate_request_id, request_id_var
+from app.core.query_stats import QueryStats, observe_request, query_stats_var
+from app.core.timing import RequestTimings, observe_spans, request_timings_var
+from app.routers.metrics import REQUEST_COUNT, REQUEST_LATENCY, REQUESTS_IN_PROGRESS, RESPONSE_SIZE
+
+
+def etag_matches(etag: bytes, if_none_match: bytes) -> bool:
+    """Weak comparison of an ETag against an If-None-Match header value."""
+    if if_none_match.strip() == b"*":
+        return True
+    etag = etag.removeprefix(b"W/")
+    return any(candidate.strip().removeprefix(b"W/") == etag for candidate in if_none_match.split(b","))
+
+
+class ConditionalGetMiddleware:
+    """Answer GET/HEAD requests with 304 when the response ETag matches If-None-Match.
+
+    Handlers that serve cached bytes set the ETag themselves, so a match
+    costs no queries and no serialization here; the body is just not sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = next((value for name, value in scope["headers"] if name == b"if-none-match"), None)
+        if if_none_match is None:
+            await self.app(scope, receive, send)
+            return
+
+        not_modified = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal not_modified
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = message.get("headers", [])
+                etag = next((value for name, value in headers if name == b"etag"), None)
+                if etag is not None and etag_matches(etag, if_none_match):
+                    not_modified = True
+                    headers = [(n, v) for n, v in headers if n not in (b"content-length", b"content-type")]
+                    await send({"type": "http.response.start", "status": 304, "headers": headers})
+                    return
+            elif message["type"] == "http.response.body" and not_modified:
+                if not message.get("more_body", False):
+                    await send({"type": "http.response.body", "body": b""})
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class CompressionMiddleware:
+    """Compress response bodies the client accepts, gzip or brotli.
+
+    Only allowlisted content types at or above ``compression_min_bytes``
+    are compressed. Responses that already carry a Content-Encoding, such
+    as cached pages served precompressed, pass through untouched. Strong
+    ETags get an encoding suffix so each variant validates on its own.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate(accept_encoding) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        compressor: StreamCompressor | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if "content-encoding" in headers or not is_compressible(headers.get("content-type")):
+                    await send(message)
+                else:
+                    # Hold the headers until the first body chunk shows the size.
+                    start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = MutableHeaders(scope=start)
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < settings.compression_min_bytes:
+                    await send(start)
+                    await send(message)
+                    start = None
+                    return
+                headers["Content-Encoding"] = encoding
+                if "etag" in headers:
+                    headers["ETag"] = encoded_etag(headers["etag"], encoding)
+                if not more_body:
+                    body = compress(body, encoding)
+                    headers["Content-Length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    start = None
+                    return
+                del headers["Content-Length"]
+                compressor = StreamCompressor(encoding)
+                await send(start)
+
+            chunk = compressor.compress(body)
+            if not more_body:
+                chunk += compressor.finish()
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        token = accepted_encoding_var.set(encoding)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            accepted_encoding_var.reset(token)
+
+
+class QueryStatsMiddleware:
+    """Count the SQL each request runs, report it in Server-Timing and per-route histograms."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = query_stats_var.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            query_stats_var.reset(token)
+            # Label by route template, not path, to keep cardinality bounded.
+            route = scope.get("route")
+            if route is not None:
+                observe_request(stats, scope["method"], route.path)
+
+
+class TimingMiddleware:
+    """Collect the request's timing spans for Server-Timing and per-route histograms.
+
+    Sits outside QueryStatsMiddleware and folds its entries into the same
+    Server-Timing header, so the db entry and the spans arrive together.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = request_timings_var.set(timings)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                existing = headers.get("server-timing")
+                entries = timings.server_timing()
+                headers["Server-Timing"] = f"{existing}, {entries}" if existing else entries
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_timings_var.reset(token)
+            route = scope.get("route")
+            if route is not None:
+                observe_spans(timings, scope["method"], route.path)
+
+
+class RequestMetricsMiddleware:
+    """Count, time and size every HTTP response for the http_* metrics.
+
+    Requests are labelled by route template, so ``/games/1`` and
+    ``/games/2`` share one series; paths that match no route share
+    ``unmatched``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        body_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, body_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                body_size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            in_progress.dec()
+            route = scope.get("route")
+            endpoint = route.path if route is not None else "unmatched"
+            REQUEST_COUNT.labels(method, endpoint, str(status_code)).inc()
+            REQUEST_LATENCY.labels(method, endpoint).observe(elapsed)
+            RESPONSE_SIZE.labels(method, endpoint).observe(body_size)
+
+
+SECURITY_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("X-XSS-Protection", "1; mode=block"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+)
+HSTS_HEADER = ("Strict-Transport-Security", "max-age=31536000; includeSubDomains")
+
+
+class RequestIdMiddleware:
+    """Tag each request with an id for the logs and add the security headers.
+
+    The id comes from the client's X-Request-ID or is generated, and is
+    echoed back. Only ``http.response.start`` is touched, so bodies,
+    including streamed ones, pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.headers = SECURITY_HEADERS + ((HSTS_HEADER,) if settings.environment == "production" else ())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client_id = next((value for name, value in scope["headers"] if name == b"x-request-id"), None)
+        request_id = client_id.decode("latin-1") if client_id else generate_request_id()
+        token = request_id_var.set(request_id)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                for name, value in self.headers:
+                    headers[name] = value
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(token)
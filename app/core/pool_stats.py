@@ -0,0 +1,151 @@
+import logging
+import threading
+import time
+import traceback
+import weakref
+
+from prometheus_client import REGISTRY, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event, pool
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Time to get a connection from the pool, including waiting for one",
+    ["pool"],
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+
+POOL_WAITING = Gauge(
+    "db_pool_checkout_waiting",
+    "Callers currently waiting for a pooled connection",
+    ["pool"],
+)
+
+# Debug mode: where each connection currently out of the pool was taken.
+_checkouts: dict[int, tuple[float, str, str]] = {}
+_checkouts_lock = threading.Lock()
+
+
+# The latest pool under each name; engine.dispose() replaces the pool object.
+_pools: dict[str, weakref.ref] = {}
+_pools_lock = threading.Lock()
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout and registers the pool for the size gauges.
+
+    The name comes from the engine's ``pool_logging_name``. In debug mode
+    each checkout also records where in the application it happened.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        with _pools_lock:
+            _pools[self.pool_name] = weakref.ref(self)
+
+    @property
+    def pool_name(self) -> str:
+        return self.logging_name or "default"
+
+    def connect(self):
+        waiting = POOL_WAITING.labels(self.pool_name)
+        waiting.inc()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        finally:
+            waiting.dec()
+            POOL_CHECKOUT_SECONDS.labels(self.pool_name).observe(time.perf_counter() - started)
+        if settings.db_pool_debug:
+            with _checkouts_lock:
+                _checkouts[id(connection.dbapi_connection)] = (time.monotonic(), checkout_site(), self.pool_name)
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, pool.QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, pool.AsyncAdaptedQueuePool):
+    pass
+
+
+class PoolCollector:
+    """Read checked-out, overflow and size straight from the pools at scrape time."""
+
+    def collect(self):
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "Connections currently checked out", labels=["pool"])
+        overflow = GaugeMetricFamily(
+            "db_pool_overflow", "Connections open beyond pool_size (negative while the pool is filling)", labels=["pool"]
+        )
+        size = GaugeMetricFamily("db_pool_size", "Configured pool_size", labels=["pool"])
+        with _pools_lock:
+            pools = [(name, ref()) for name, ref in _pools.items()]
+        for name, p in pools:
+            if p is None:
+                continue
+            checked_out.add_metric([name], p.checkedout())
+            overflow.add_metric([name], p.overflow())
+            size.add_metric([name], p.size())
+        yield checked_out
+        yield overflow
+        yield size
+
+
+REGISTRY.register(PoolCollector())
+
+
+def checkout_site() -> str:
+    """The innermost application frames that led to this checkout."""
+    frames = [
+        f for f in traceback.extract_stack()[:-1]
+        if "site-packages" not in f.filename and f.filename != __file__ and "/lib/python" not in f.filename
+    ]
+    return " <- ".join(f"{f.filename}:{f.lineno} in {f.name}" for f in reversed(frames[-4:])) or "unknown"
+
+
+@event.listens_for(pool.Pool, "close")
+def _forget_closed(dbapi_connection, connection_record) -> None:
+    # Invalidated connections are closed and check in without their DBAPI connection.
+    with _checkouts_lock:
+        _checkouts.pop(id(dbapi_connection), None)
+
+
+@event.listens_for(pool.Pool, "checkin")
+def _record_checkin(dbapi_connection, connection_record) -> None:
+    if dbapi_connection is None:
+        return
+    with _checkouts_lock:
+        checkout = _checkouts.pop(id(dbapi_connection), None)
+    if checkout is None:
+        return
+    started, site, pool_name = checkout
+    held = time.monotonic() - started
+    if held > settings.db_pool_hold_warning_s:
+        logger.warning(
+            "Connection held %.1fs", held, extra={"pool": pool_name, "held_s": round(held, 3), "checkout_site": site}
+        )
+
+
+def long_held_connections(threshold_s: float | None = None) -> list[dict]:
+    """Connections still checked out after ``threshold_s``, oldest first, with where they were taken."""
+    threshold_s = settings.db_pool_hold_warning_s if threshold_s is None else threshold_s
+    now = time.monotonic()
+    with _checkouts_lock:
+        checkouts = list(_checkouts.values())
+    held = [
+        {"pool": pool_name, "held_s": round(now - started, 3), "checkout_site": site}
+        for started, site, pool_name in checkouts
+        if now - started > threshold_s
+    ]
+    return sorted(held, key=lambda c: c["held_s"], reverse=True)
+
+
+def report_long_held_connections() -> None:
+    """Log connections that have not come back; run periodically in debug mode."""
+    for connection in long_held_connections():
+        logger.warning("Connection not returned after %.1fs", connection["held_s"], extra=connection)
@@ -0,0 +1,169 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.logging import request_id_var
+
+logger = logging.getLogger(__name__)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250, 500),
+)
+
+DB_TIME_PER_REQUEST = Histogram(
+    "db_time_per_request_seconds",
+    "Time spent executing SQL per HTTP request",
+    ["method", "route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+class RepeatedQueryError(RuntimeError):
+    """Raised in strict mode when a request repeats one statement too often."""
+
+
+class QueryStats:
+    """SQL executed while serving one request."""
+
+    def __init__(self, scope: dict | None = None) -> None:
+        self.scope = scope or {}
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    @property
+    def route(self) -> str | None:
+        route = self.scope.get("route")
+        return route.path if route is not None else None
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries"'
+
+
+query_stats_var: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\bIN \([^()]*\)", re.IGNORECASE)
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with whitespace and expanded IN lists normalized.
+
+    Values are already bound as parameters, so two statements with the same
+    shape differ only in their parameters.
+    """
+    return _IN_LIST.sub("IN (...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """Keep numbers, booleans and NULLs; hide every other value behind its type."""
+    if isinstance(parameters, dict):
+        return {k: redact_parameters(v) for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(v) for v in parameters]
+    if parameters is None or isinstance(parameters, (bool, int, float)):
+        return parameters
+    return f"<{type(parameters).__name__}>"
+
+
+_explained_shapes: set[str] = set()
+_explained_lock = threading.Lock()
+_MAX_EXPLAINED_SHAPES = 10_000
+_EXPLAIN_PREFIX = {"sqlite": "EXPLAIN QUERY PLAN "}
+
+
+def explain(conn, statement: str, parameters: Any) -> list[str] | None:
+    """The query plan, on the same connection and with the same parameters.
+
+    It runs inside the request's transaction, so it is wrapped in a
+    savepoint: on PostgreSQL a failed statement would otherwise abort the
+    whole transaction.
+    """
+    if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return None
+    prefix = _EXPLAIN_PREFIX.get(conn.dialect.name, "EXPLAIN ")
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            plan = [str(row[-1]) for row in cursor.fetchall()]
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            plan = [f"EXPLAIN failed: {e}"]
+        cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        return plan
+    except Exception as e:
+        return [f"EXPLAIN failed: {e}"]
+    finally:
+        cursor.close()
+
+
+def _log_slow_query(conn, statement: str, parameters: Any, executemany: bool, elapsed: float) -> None:
+    stats = query_stats_var.get()
+    shape = statement_shape(statement)
+    plan = None
+    if settings.slow_query_explain and not executemany:
+        with _explained_lock:
+            first_time = shape not in _explained_shapes and len(_explained_shapes) < _MAX_EXPLAINED_SHAPES
+            _explained_shapes.add(shape)
+        if first_time:
+            plan = explain(conn, statement, parameters)
+
+    logger.warning("Slow query", extra={
+        "event": "slow_query",
+        "duration_ms": round(elapsed * 1000, 2),
+        "statement": shape,
+        "parameters": redact_parameters(parameters),
+        "route": stats.route if stats is not None else None,
+        "request_id": request_id_var.get(),
+        "plan": plan,
+    })
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+    stats = query_stats_var.get()
+    if stats is None:
+        return
+    shape = statement_shape(statement)
+    stats.count += 1
+    stats.shapes[shape] += 1
+
+    threshold = settings.sql_repeat_threshold
+    if threshold and stats.shapes[shape] == threshold + 1:
+        message = f"Statement repeated more than {threshold} times in one request (likely N+1): {shape}"
+        if settings.sql_repeat_action == "raise":
+            raise RepeatedQueryError(message)
+        logger.warning(message, extra={"statement": shape, "threshold": threshold})
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats = query_stats_var.get()
+    if stats is not None:
+        stats.duration += elapsed
+    if settings.slow_query_threshold_ms and elapsed * 1000 >= settings.slow_query_threshold_ms:
+        _log_slow_query(conn, statement, parameters, executemany, elapsed)
+
+
+def observe_request(stats: QueryStats, method: str, route: str) -> None:
+    DB_QUERIES_PER_REQUEST.labels(method, route).observe(stats.count)
+    DB_TIME_PER_REQUEST.labels(method, route).observe(stats.duration)
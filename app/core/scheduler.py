@@ -7,7 +7,9 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from sqlmodel import Session, select
 
-from app.db import engine
+from app.core.config import settings
+from app.core.pool_stats import report_long_held_connections
+from app.db import RoutingSession, replicas
 from app.models import League, Notification, NotificationType, Registration, RegistrationStatus, Season
 
 logger = logging.getLogger(__name__)
@@ -16,7 +18,7 @@ scheduler: AsyncIOScheduler | None = None
 
 
 def check_registration_deadlines():
-    with Session(engine) as session:
+    with RoutingSession() as session:
         now = datetime.utcnow()
         reminder_window_start = now + timedelta(hours=24)
         reminder_window_end = now + timedelta(hours=48)
@@ -100,6 +102,22 @@ def start_scheduler():
             name="Check registration deadlines and send reminders",
             replace_existing=True
         )
+        if replicas.replicas:
+            scheduler.add_job(
+                replicas.check_health,
+                trigger=IntervalTrigger(seconds=settings.replica_health_check_interval_s),
+                id="check_replica_health",
+                name="Eject unhealthy read replicas",
+                replace_existing=True
+            )
+        if settings.db_pool_debug:
+            scheduler.add_job(
+                report_long_held_connections,
+                trigger=IntervalTrigger(seconds=max(1, int(settings.db_pool_hold_warning_s))),
+                id="report_long_held_connections",
+                name="Log pooled connections that were never returned",
+                replace_existing=True
+            )
         scheduler.start()
         logger.info("Background scheduler started")
     except Exception as e:
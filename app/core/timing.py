@@ -0,0 +1,108 @@
+import functools
+import inspect
+import threading
+import time
+from contextvars import ContextVar
+
+from prometheus_client import Histogram
+
+REQUEST_SPAN_SECONDS = Histogram(
+    "request_span_seconds",
+    "Time spent per request in each named span (auth, engine, render, ...)",
+    ["method", "route", "span"],
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+class RequestTimings:
+    """Time per span name accumulated while serving one request.
+
+    The spans cover only what is wrapped in ``span``:
+
+      auth    token check and user load in the current-user dependencies
+      engine  game engine calls
+      render  JSON encoding of a response body, or of a cache fill
+
+    "render" is the encode alone. FastAPI's response_model validation and
+    dump run before it and are not counted, so for an uncached handler it
+    understates serialization. Neither are dependencies other than auth,
+    routing or middleware. db plus the spans therefore falls short of
+    "total"; the gap is that untimed work.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.spans: dict[str, float] = {}
+        # Sync dependencies and handlers run in the threadpool.
+        self._lock = threading.Lock()
+
+    def add(self, name: str, elapsed: float) -> None:
+        with self._lock:
+            self.spans[name] = self.spans.get(name, 0.0) + elapsed
+
+    def server_timing(self) -> str:
+        entries = [f"{name};dur={elapsed * 1000:.2f}" for name, elapsed in self.spans.items()]
+        entries.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.2f}")
+        return ", ".join(entries)
+
+
+request_timings_var: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+# Names of the spans open in the current context, so a span nested in one
+# of the same name (an engine method calling another) is not counted twice.
+_open_spans: ContextVar[frozenset[str]] = ContextVar("open_spans", default=frozenset())
+
+
+class span:
+    """Time a block or a function into the current request's timings.
+
+        with span("engine"):
+            ...
+
+        @span("auth")
+        async def get_current_user_async(...): ...
+
+    Outside a request, or inside a span of the same name, it does nothing.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._timings: RequestTimings | None = None
+
+    def __enter__(self) -> "span":
+        timings = request_timings_var.get()
+        open_spans = _open_spans.get()
+        if timings is None or self.name in open_spans:
+            return self
+        self._timings = timings
+        self._token = _open_spans.set(open_spans | {self.name})
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._timings is None:
+            return
+        self._timings.add(self.name, time.perf_counter() - self._started)
+        _open_spans.reset(self._token)
+        self._timings = None
+
+    def __call__(self, func):
+        # A fresh span per call: one decorated function may run concurrently.
+        name = self.name
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def observe_spans(timings: RequestTimings, method: str, route: str) -> None:
+    for name, elapsed in timings.spans.items():
+        REQUEST_SPAN_SECONDS.labels(method, route, name).observe(elapsed)
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+warmup_status: dict[str, Any] = {"state": "pending", "warmed": [], "failed": []}
+
+
+def warmup_paths() -> list[str]:
+    return [p.strip() for p in settings.cache_warmup_paths.split(",") if p.strip()]
+
+
+async def warm_caches(app: Any, paths: list[str]) -> None:
+    """Prefill the caches by sending the hot GET requests through the app itself.
+
+    Going through the real handlers means every entry lands under exactly
+    the key, tags and encoding a client request would produce. A failing
+    or slow path is logged and skipped; that page just fills on its first
+    request. The state always ends in "done", "failed" or "skipped", so
+    /health never stays unhealthy because of the warm-up.
+    """
+    if not paths:
+        warmup_status.update(state="skipped", warmed=[], failed=[])
+        return
+
+    warmup_status.update(state="running", warmed=[], failed=[])
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://warmup") as client:
+            for path in paths:
+                try:
+                    response = await asyncio.wait_for(client.get(path), settings.cache_warmup_timeout_s)
+                    response.raise_for_status()
+                except asyncio.TimeoutError:
+                    logger.warning("Cache warm-up timed out for %s", path)
+                    warmup_status["failed"].append(path)
+                except Exception:
+                    logger.exception("Cache warm-up failed for %s", path)
+                    warmup_status["failed"].append(path)
+                else:
+                    warmup_status["warmed"].append(path)
+    finally:
+        # Cut short by shutdown counts as failed too.
+        complete = not warmup_status["failed"] and len(warmup_status["warmed"]) == len(paths)
+        warmup_status["state"] = "done" if complete else "failed"
+    logger.info("Cache warm-up finished: %d warmed, %d failed", len(warmup_status["warmed"]), len(warmup_status["failed"]))
+
+
+def start_warmup(app: Any, paths: list[str]) -> asyncio.Task:
+    """Schedule ``warm_caches`` and mark the warm-up as running right away.
+
+    The task only gets its first step on a later turn of the event loop;
+    the app may already be serving /health by then.
+    """
+    if paths:
+        warmup_status.update(state="running", warmed=[], failed=[])
+    return asyncio.create_task(warm_caches(app, paths))
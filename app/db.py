@@ -1,30 +1,302 @@
-from collections.abc import Generator
+import hashlib
+import itertools
+import logging
+import threading
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
+from typing import Any
 
-from sqlalchemy import pool
-from sqlmodel import Session, SQLModel, create_engine
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from cachetools import TTLCache
+from fastapi import Request
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.core.pool_stats import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+
+logger = logging.getLogger(__name__)
 
 is_sqlite = settings.database_url.startswith("sqlite")
 
+
+def async_database_url(url: str) -> str:
+    """Map the sync DATABASE_URL onto the matching asyncio driver."""
+    scheme, _, rest = url.partition("://")
+    backend = scheme.split("+", 1)[0]
+    if backend == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    if backend in ("postgres", "postgresql"):
+        return f"postgresql+asyncpg://{rest}"
+    return url
+
+
+def is_sqlite_memory(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def check_database_url(url: str) -> None:
+    """Refuse settings the sync and async engines cannot share.
+
+    Each engine opening an in-memory SQLite URL gets its own private
+    database, so the async routers would see an empty one.
+    """
+    if url.startswith("sqlite") and (is_sqlite_memory(url) or url.endswith(":memory:")):
+        raise ValueError(
+            f"DATABASE_URL={url!r} is an in-memory SQLite database, which the sync and async "
+            "engines cannot share; use a file, e.g. sqlite:///./league.db"
+        )
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+    cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    # A negative cache_size is a budget in KiB rather than in pages.
+    cursor.execute(f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kib)}")
+    cursor.execute(f"PRAGMA temp_store={settings.sqlite_temp_store}")
+    cursor.close()
+
+
+def create_sqlite_engine(url: str, **kwargs) -> Engine:
+    if not is_sqlite_memory(url):
+        kwargs.setdefault("poolclass", InstrumentedQueuePool)
+    sqlite_engine = create_engine(url, echo=False, connect_args={"check_same_thread": False}, **kwargs)
+    event.listen(sqlite_engine, "connect", apply_sqlite_pragmas)
+    return sqlite_engine
+
+
+def create_async_sqlite_engine(url: str, **kwargs) -> AsyncEngine:
+    # aiosqlite defaults to NullPool; pooling keeps the pragmas and page
+    # cache of each connection instead of reopening the file per session.
+    sqlite_engine = create_async_engine(
+        async_database_url(url), echo=False, poolclass=InstrumentedAsyncQueuePool, **kwargs
+    )
+    event.listen(sqlite_engine.sync_engine, "connect", apply_sqlite_pragmas)
+    return sqlite_engine
+
+
+# async_engine is used by the read-heavy routers so their queries wait on
+# the event loop instead of holding one of Starlette's threadpool workers.
+#
+# SQLite allows one writer at a time. Writes go through a single pooled
+# connection, so concurrent writers queue for it instead of failing with
+# "database is locked"; reads use the regular pool and, under WAL, never
+# wait for the writer.
+writer_pool_args = {"pool_size": 1, "max_overflow": 0, "pool_timeout": 30}
+
+check_database_url(settings.database_url)
+
+# Each pool is named for the db_pool_* metrics.
 if is_sqlite:
-    connect_args = {"check_same_thread": False}
-    engine = create_engine(settings.database_url, echo=False, connect_args=connect_args)
+    engine = create_sqlite_engine(settings.database_url, pool_logging_name="reader")
+    async_engine = create_async_sqlite_engine(settings.database_url, pool_logging_name="async_reader")
+    writer_engine = create_sqlite_engine(settings.database_url, pool_logging_name="writer", **writer_pool_args)
+    async_writer_engine = create_async_sqlite_engine(
+        settings.database_url, pool_logging_name="async_writer", **writer_pool_args
+    )
 else:
     engine = create_engine(
         settings.database_url,
         echo=False,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name="reader",
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=300,
+    )
+    async_engine = create_async_engine(
+        async_database_url(settings.database_url),
+        echo=False,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name="async_reader",
         pool_size=10,
         max_overflow=20,
         pool_pre_ping=True,
         pool_recycle=300,
     )
+    writer_engine, async_writer_engine = engine, async_engine
+
+
+class Replica:
+    def __init__(self, url: str, name: str = "replica") -> None:
+        self.url = url
+        self.healthy = True
+        if url.startswith("sqlite"):
+            self.engine = create_sqlite_engine(url, pool_logging_name=name)
+            self.async_engine = create_async_sqlite_engine(url, pool_logging_name=f"async_{name}")
+        else:
+            self.engine = create_engine(
+                url, echo=False, poolclass=InstrumentedQueuePool, pool_logging_name=name,
+                pool_size=5, max_overflow=10, pool_pre_ping=True, pool_recycle=300,
+            )
+            self.async_engine = create_async_engine(
+                async_database_url(url), echo=False, poolclass=InstrumentedAsyncQueuePool,
+                pool_logging_name=f"async_{name}", pool_size=5, max_overflow=10, pool_pre_ping=True, pool_recycle=300,
+            )
+
+
+class ReplicaSet:
+    """Read replicas, handed out round-robin while they pass health checks."""
+
+    def __init__(self, urls: list[str]) -> None:
+        self.replicas = [Replica(url, f"replica{i}") for i, url in enumerate(urls)]
+        self._counter = itertools.count()
+
+    def pick(self) -> Replica | None:
+        healthy = [r for r in self.replicas if r.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._counter) % len(healthy)]
+
+    def check_health(self) -> None:
+        """Eject replicas that fail a trivial query and readmit recovered ones."""
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    conn.exec_driver_sql("SELECT 1")
+            except Exception as e:
+                if replica.healthy:
+                    logger.warning("Ejecting read replica %d: %s", self.replicas.index(replica), e)
+                replica.healthy = False
+            else:
+                if not replica.healthy:
+                    logger.info("Read replica %d is healthy again", self.replicas.index(replica))
+                replica.healthy = True
+
+
+replicas = ReplicaSet([u.strip() for u in settings.database_replica_urls.split(",") if u.strip()])
+
+# Clients that committed a write recently. Their reads stay on the primary
+# until replication has had time to catch up. This is per worker, so a
+# client bouncing between workers can still see replica lag.
+_recent_writers: TTLCache = TTLCache(maxsize=10_000, ttl=settings.read_after_write_window_s)
+_recent_writers_lock = threading.Lock()
+
+
+def client_key(request: Request | None) -> str | None:
+    if request is None:
+        return None
+    authorization = request.headers.get("authorization")
+    if authorization:
+        return hashlib.sha256(authorization.encode()).hexdigest()
+    return request.client.host if request.client else None
+
+
+def wrote_recently(key: str | None) -> bool:
+    if key is None:
+        return False
+    with _recent_writers_lock:
+        return key in _recent_writers
+
+
+class RoutingSession(Session):
+    """Sends reads to a replica or ``engine`` and flushes and DML to ``writer_engine``.
+
+    Once a session has written, every later statement stays on the writer,
+    so a request always reads its own writes. Sessions marked ``primary``
+    (non-GET requests) and clients that wrote within the read-after-write
+    window never read from a replica.
+    """
+
+    def engines(self) -> tuple[Engine, Engine]:
+        return engine, writer_engine
+
+    def replica_engine(self, replica: Replica) -> Engine:
+        return replica.engine
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        reader, writer = self.engines()
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["wrote"] = True
+        if self.info.get("wrote"):
+            return writer
+        if "replica" not in self.info:
+            # One replica per session, so a request reads a single snapshot.
+            stay_on_primary = self.info.get("primary") or wrote_recently(self.info.get("client_key"))
+            self.info["replica"] = None if stay_on_primary else replicas.pick()
+        replica = self.info["replica"]
+        return self.replica_engine(replica) if replica else reader
+
+
+class AsyncRoutingSession(RoutingSession):
+    """The sync half of an ``AsyncSession`` routed like ``RoutingSession``."""
+
+    def engines(self) -> tuple[Engine, Engine]:
+        return async_engine.sync_engine, async_writer_engine.sync_engine
+
+    def replica_engine(self, replica: Replica) -> Engine:
+        return replica.async_engine.sync_engine
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _remember_writer(session: Session) -> None:
+    key = session.info.get("client_key")
+    if key is not None and session.info.get("wrote"):
+        with _recent_writers_lock:
+            _recent_writers[key] = True
+
+
+def pin_to_primary(session: Session | AsyncSession) -> None:
+    """Send the session's remaining reads to the primary.
+
+    For results that outlive the request, such as shared cache entries: a
+    lagging replica would otherwise write old rows back into the cache
+    right after a write invalidated them.
+    """
+    session.info["primary"] = True
+    session.info["replica"] = None
+
+
+def routing_info(request: Request | None) -> dict:
+    if request is None:
+        return {}
+    return {"client_key": client_key(request), "primary": request.method not in ("GET", "HEAD")}
+
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+# The migration that matches what SQLModel.metadata.create_all() used to build.
+BASELINE_REVISION = "0001"
+
+# pg_advisory_xact_lock key that serializes init_db() across workers.
+MIGRATION_LOCK_KEY = 0x6C65616775650001
 
 
 def init_db() -> None:
-    SQLModel.metadata.create_all(engine)
+    """Upgrade the database to the latest migration.
+
+    Databases created before migrations existed have the baseline tables but
+    no alembic_version row; they are stamped at the baseline first so only
+    the later revisions run.
+
+    Every worker calls this at startup. On PostgreSQL the first one to take
+    an advisory lock migrates while the rest wait, then find nothing to do.
+    """
+    config = AlembicConfig(str(ALEMBIC_INI))
+    with writer_engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        config.attributes["connection"] = connection
+        inspector = inspect(connection)
+        if inspector.has_table("user") and not inspector.has_table("alembic_version"):
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, "head")
+
+
+def get_session(request: Request = None) -> Generator[Session, None, None]:
+    with RoutingSession(info=routing_info(request)) as session:
+        yield session
 
 
-def get_session() -> Generator[Session, None, None]:
-    with Session(engine) as session:
+async def get_async_session(request: Request = None) -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(sync_session_class=AsyncRoutingSession, info=routing_info(request)) as session:
         yield session
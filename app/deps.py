@@ -1,9 +1,18 @@
+import hashlib
+import time
+from itertools import chain
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, make_transient_to_detached
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
+from app.core.cache import auth_cache
+from app.core.timing import span
+from app.db import get_async_session, get_session
 from app.models import User
 from app.security import decode_token
 
@@ -11,54 +20,182 @@ from app.security import decode_token
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
 
-def get_db() -> Session:
-    return next(get_session())
+# Older name for get_session. It used to return next(get_session()), which
+# never closed the session and leaked its connection; as an alias, FastAPI
+# runs the generator to completion like any other dependency.
+get_db = get_session
 
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    session: Session = Depends(get_session),
-) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+def token_cache_key(token: str) -> str:
+    return f"token:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def user_cache_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def user_id_from_token(token: str | None) -> int | None:
+    if not token:
+        return None
+    key = token_cache_key(token)
+    cached = auth_cache.get(key)
+    if cached is not None:
+        user_id, expires_at = cached
+        # The cache can outlive the token; never accept it past its exp.
+        return user_id if expires_at is None or expires_at > time.time() else None
     try:
         payload = decode_token(token)
         subject = payload.get("sub")
         if subject is None:
-            raise credentials_exception
+            return None
         user_id = int(subject)
     except (JWTError, ValueError):
-        raise credentials_exception
+        return None
+    auth_cache.set(key, (user_id, payload.get("exp")))
+    return user_id
+
+
+def cached_user(user_id: int) -> User | None:
+    """A detached ``User`` rebuilt from the cached snapshot, ready for ``merge(load=False)``.
 
+    The snapshot has no password hash; once merged, reading it loads it
+    from the database like any expired attribute.
+    """
+    snapshot = auth_cache.get(user_cache_key(user_id))
+    if snapshot is None:
+        return None
+    # The constructor skips validation, which would reject the missing hash.
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+def cache_user(user: User) -> None:
+    # The sqlite backend pickles entries to disk; keep credentials out of them.
+    auth_cache.set(user_cache_key(user.id), user.model_dump(exclude={"hashed_password"}))
+
+
+def load_user(session: Session, user_id: int) -> User | None:
+    """The user behind a token, from the auth cache when the request allows it.
+
+    Writes are evicted from this worker's cache, and from every worker's
+    through the invalidation log with CACHE_BACKEND=sqlite. With the local
+    backend other workers keep the snapshot for up to AUTH_CACHE_TTL_S, so
+    non-GET requests, which routing already sends to the primary, always
+    re-read the user: a deactivated account cannot write in the meantime.
+    """
+    user = None if session.info.get("primary") else cached_user(user_id)
+    if user is not None:
+        # Attach without a SELECT, so handlers can still modify and commit it.
+        return session.merge(user, load=False)
     user = session.exec(select(User).where(User.id == user_id)).first()
+    if user is not None:
+        cache_user(user)
+    return user
+
+
+async def load_user_async(session: AsyncSession, user_id: int) -> User | None:
+    user = None if session.info.get("primary") else cached_user(user_id)
+    if user is not None:
+        return await session.merge(user, load=False)
+    user = (await session.exec(select(User).where(User.id == user_id))).first()
+    if user is not None:
+        cache_user(user)
+    return user
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    changed = {obj.id for obj in chain(session.dirty, session.deleted) if isinstance(obj, User)}
+    if changed:
+        session.info.setdefault("changed_user_ids", set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_users(session: Session) -> None:
+    for user_id in session.info.pop("changed_user_ids", ()):
+        auth_cache.delete(user_cache_key(user_id))
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session: Session) -> None:
+    session.info.pop("changed_user_ids", None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _evict_on_bulk_user_change(orm_execute_state: ORMExecuteState) -> None:
+    # Bulk UPDATE/DELETE statements bypass the flush, and their rows are unknown.
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and orm_execute_state.bind_mapper is not None:
+        if orm_execute_state.bind_mapper.class_ is User:
+            auth_cache.delete_prefix("user:")
+
+
+def credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+@span("auth")
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    session: Session = Depends(get_session),
+) -> User:
+    user_id = user_id_from_token(token)
+    if user_id is None:
+        raise credentials_exception()
+
+    user = load_user(session, user_id)
+    if not user or not user.is_active:
+        raise credentials_exception()
+    return user
+
+
+@span("auth")
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_async_session),
+) -> User:
+    user_id = user_id_from_token(token)
+    if user_id is None:
+        raise credentials_exception()
+
+    user = await load_user_async(session, user_id)
     if not user or not user.is_active:
-        raise credentials_exception
+        raise credentials_exception()
     return user
 
 
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/auth/token", auto_error=False)
 
 
+@span("auth")
 def get_current_user_optional(
     token: str | None = Depends(oauth2_scheme_optional),
     session: Session = Depends(get_session),
 ) -> User | None:
-    if not token:
-        return None
-    try:
-        payload = decode_token(token)
-        subject = payload.get("sub")
-        if subject is None:
-            return None
-        user_id = int(subject)
-    except (JWTError, ValueError):
+    user_id = user_id_from_token(token)
+    if user_id is None:
         return None
 
-    user = session.exec(select(User).where(User.id == user_id)).first()
+    user = load_user(session, user_id)
     if not user or not user.is_active:
         return None
     return user
 
+
+@span("auth")
+async def get_current_user_optional_async(
+    token: str | None = Depends(oauth2_scheme_optional),
+    session: AsyncSession = Depends(get_async_session),
+) -> User | None:
+    user_id = user_id_from_token(token)
+    if user_id is None:
+        return None
+
+    user = await load_user_async(session, user_id)
+    if not user or not user.is_active:
+        return None
+    return user
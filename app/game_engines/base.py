@@ -2,8 +2,30 @@ from abc import ABC, abstractmethod
 from typing import Any
 import json
 
+from app.core.timing import span
+
+# Public engine methods, timed as the request's "engine" span.
+TIMED_METHODS = (
+    "create_initial_state",
+    "validate_move",
+    "apply_move",
+    "check_winner",
+    "is_game_over",
+    "get_valid_moves",
+    "get_player_view",
+    "serialize_state",
+    "deserialize_state",
+)
+
 
 class GameEngine(ABC):
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in TIMED_METHODS:
+            method = cls.__dict__.get(name)
+            if method is not None:
+                setattr(cls, name, span("engine")(method))
     
     @abstractmethod
     def create_initial_state(self) -> dict:
@@ -29,8 +51,10 @@ class GameEngine(ABC):
     def get_valid_moves(self, state: dict, player: int) -> list[dict]:
         pass
     
+    @span("engine")
     def serialize_state(self, state: dict) -> str:
         return json.dumps(state)
     
+    @span("engine")
     def deserialize_state(self, state_str: str) -> dict:
         return json.loads(state_str)
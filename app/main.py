@@ -1,14 +1,24 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
 from app.core.limiter import limiter
-from app.core.logging import generate_request_id, request_id_var, setup_logging
+from app.core.middleware import (
+    CompressionMiddleware,
+    ConditionalGetMiddleware,
+    QueryStatsMiddleware,
+    RequestIdMiddleware,
+    RequestMetricsMiddleware,
+    TimingMiddleware,
+)
+from app.core.responses import FastJSONResponse
+from app.core.logging import setup_logging
 from app.core.scheduler import start_scheduler, stop_scheduler
+from app.core.warmup import start_warmup, warmup_paths, warmup_status
 from app.db import init_db
 from app.routers import (
     ai,
@@ -36,15 +46,22 @@ from app.routers import (
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
+async def lifespan(app: FastAPI):
     setup_logging()
     init_db()
     start_scheduler()
+    warmup = start_warmup(app, warmup_paths())
     yield
+    warmup.cancel()
     stop_scheduler()
 
 
-app = FastAPI(title=settings.app_name, version="0.1.0", lifespan=lifespan)
+app = FastAPI(
+    title=settings.app_name,
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
 app.state.limiter = limiter
 
 if settings.environment == "production":
@@ -62,33 +79,27 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-
-@app.middleware("http")
-async def add_request_id_and_security_headers(request: Request, call_next):
-    request_id = request.headers.get("X-Request-ID") or generate_request_id()
-    request_id_var.set(request_id)
-
-    response: Response = await call_next(request)
-
-    response.headers["X-Request-ID"] = request_id
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-    if settings.environment == "production":
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-    return response
-
+# Inside ConditionalGetMiddleware, so If-None-Match is checked against the
+# ETag of the encoding actually sent.
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(ConditionalGetMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(TimingMiddleware)
+app.add_middleware(RequestMetricsMiddleware)
+# Outermost, so the request id is set for everything below it.
+app.add_middleware(RequestIdMiddleware)
 
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
 @app.get("/health")
-def health():
-    return {"ok": True}
+def health(response: Response):
+    # Report unhealthy until the warm-up has filled the caches, so a load
+    # balancer only sends traffic once the hot pages are served from memory.
+    warming = warmup_status["state"] == "running"
+    if warming:
+        response.status_code = 503
+    return {"ok": not warming, "cache_warmup": warmup_status}
 
 
 from app.routers import metrics, realtime
@@ -2,6 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import Index, UniqueConstraint
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -205,6 +206,7 @@ class VenueFollow(Timestamped, table=True):
 
 class UserFollow(Timestamped, table=True):
     __tablename__ = "user_follow"
+    __table_args__ = (UniqueConstraint("follower_id", "following_id", name="uq_user_follow_follower_following"),)
     
     id: int | None = Field(default=None, primary_key=True)
     follower_id: int = Field(foreign_key="user.id", index=True)
@@ -339,6 +341,8 @@ class GameBase(SQLModel):
 
 
 class Game(GameBase, Timestamped, table=True):
+    __table_args__ = (Index("ix_game_season_status_start", "season_id", "status", "start_time"),)
+
     id: int | None = Field(default=None, primary_key=True)
     season_id: int = Field(foreign_key="season.id", index=True)
     home_team_id: int | None = Field(default=None, foreign_key="team.id", index=True)
@@ -450,6 +454,8 @@ class Reaction(Timestamped, table=True):
 
 
 class Notification(Timestamped, table=True):
+    __table_args__ = (Index("ix_notification_user_read_created", "user_id", "is_read", "created_at"),)
+
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id", index=True)
     notification_type: NotificationType = Field(index=True)
@@ -463,6 +469,7 @@ class Notification(Timestamped, table=True):
 
 class OnlineGame(Timestamped, table=True):
     __tablename__ = "online_game"
+    __table_args__ = (Index("ix_online_game_status_type_created", "status", "game_type", "created_at"),)
 
     id: int | None = Field(default=None, primary_key=True)
     game_type: OnlineGameType = Field(index=True)
@@ -484,6 +491,7 @@ class OnlineGame(Timestamped, table=True):
 
 class OnlineGameMatch(Timestamped, table=True):
     __tablename__ = "online_game_match"
+    __table_args__ = (Index("ix_online_game_match_type_searching_created", "game_type", "is_searching", "created_at"),)
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id", index=True)
@@ -566,6 +574,9 @@ class Channel(Timestamped, table=True):
 
 class ChannelFeedEntry(Timestamped, table=True):
     __tablename__ = "channel_feed_entry"
+    __table_args__ = (
+        Index("ix_channel_feed_entry_channel_pinned_priority_created", "channel_id", "is_pinned", "priority", "created_at"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     channel_id: int = Field(foreign_key="channel.id", index=True)
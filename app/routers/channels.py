@@ -2,9 +2,12 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from sqlmodel import Session, select, func, col
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
-from app.deps import get_current_user, get_current_user_optional
+from app.core.cache import cache_key, invalidate_list_tags, list_tags, load_cached_list_async
+from app.core.responses import FastJSONResponse
+from app.db import get_async_session, get_session
+from app.deps import get_current_user, get_current_user_async, get_current_user_optional_async
 from app.models import (
     Channel, ChannelFeedEntry, ChannelSubscription, ChannelContentType,
     Sport, SportCategory, User, League, Season, Game, GameStatus,
@@ -130,40 +133,59 @@ def get_sport_category_for_channel(slug: str) -> SportCategory | list[SportCateg
 
 
 @router.get("", response_model=ChannelListResponse)
-def list_channels(
-    session: Session = Depends(get_session),
-    current_user: User | None = Depends(get_current_user_optional),
+async def list_channels(
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User | None = Depends(get_current_user_optional_async),
     skip: int = 0,
     limit: int = 20,
     active_only: bool = True
 ):
+    # Subscription flags are per user, so only the anonymous listing is shared.
+    if current_user is None:
+        cache_id = f"channels:{cache_key(skip=skip, limit=limit, active_only=active_only)}"
+        return await load_cached_list_async(
+            cache_id,
+            session,
+            lambda s: build_channel_list(s, None, skip, limit, active_only),
+            list_tags("channels"),
+        )
+    return await build_channel_list(session, current_user, skip, limit, active_only)
+
+
+async def build_channel_list(
+    session: AsyncSession,
+    current_user: User | None,
+    skip: int,
+    limit: int,
+    active_only: bool
+) -> ChannelListResponse:
     query = select(Channel)
     if active_only:
         query = query.where(Channel.is_active == True)
     query = query.offset(skip).limit(limit)
     
-    channels = session.exec(query).all()
-    total = session.exec(select(func.count(Channel.id)).where(Channel.is_active == True)).one()
+    channels = (await session.exec(query)).all()
+    total = (await session.exec(select(func.count(Channel.id)).where(Channel.is_active == True))).one()
     
     now = datetime.utcnow()
     next_14_days = now + timedelta(days=14)
     
     items = []
     for channel in channels:
-        sub_count = session.exec(
+        sub_count = (await session.exec(
             select(func.count(ChannelSubscription.id))
             .where(ChannelSubscription.channel_id == channel.id)
-        ).one()
+        )).one()
         
-        live_count = session.exec(
+        live_count = (await session.exec(
             select(func.count(Game.id))
             .join(Season)
             .join(League)
             .where(League.sport_id == channel.sport_id)
             .where(Game.status == GameStatus.in_progress)
-        ).one()
+        )).one()
         
-        upcoming_count = session.exec(
+        upcoming_count = (await session.exec(
             select(func.count(Game.id))
             .join(Season)
             .join(League)
@@ -171,22 +193,22 @@ def list_channels(
             .where(Game.status == GameStatus.scheduled)
             .where(Game.start_time >= now)
             .where(Game.start_time <= next_14_days)
-        ).one()
+        )).one()
         
-        open_seasons_count = session.exec(
+        open_seasons_count = (await session.exec(
             select(func.count(Season.id))
             .join(League)
             .where(League.sport_id == channel.sport_id)
             .where(Season.registration_open == True)
-        ).one()
+        )).one()
         
         is_subscribed = False
         if current_user:
-            sub = session.exec(
+            sub = (await session.exec(
                 select(ChannelSubscription)
                 .where(ChannelSubscription.channel_id == channel.id)
                 .where(ChannelSubscription.user_id == current_user.id)
-            ).first()
+            )).first()
             is_subscribed = sub is not None
         
         items.append(ChannelResponse(
@@ -209,50 +231,64 @@ def list_channels(
 
 
 @router.get("/{slug}", response_model=ChannelDetailResponse)
-def get_channel(
+async def get_channel(
     slug: str,
-    session: Session = Depends(get_session),
-    current_user: User | None = Depends(get_current_user_optional)
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User | None = Depends(get_current_user_optional_async)
 ):
-    channel = session.exec(
+    # The page differs per viewer only in is_subscribed, so it is cached
+    # once per slug for each value of that flag.
+    is_subscribed = False
+    if current_user:
+        sub = (await session.exec(
+            select(ChannelSubscription.id)
+            .join(Channel, Channel.id == ChannelSubscription.channel_id)
+            .where(Channel.slug == slug)
+            .where(ChannelSubscription.user_id == current_user.id)
+        )).first()
+        is_subscribed = sub is not None
+
+    cache_id = f"channel_detail:{cache_key(slug=slug, is_subscribed=is_subscribed)}"
+    return await load_cached_list_async(
+        cache_id,
+        session,
+        lambda s: build_channel_detail(s, slug, is_subscribed),
+        # channel_pages:* groups every channel page for invalidate_channel_pages.
+        list_tags("channel_detail", slug=slug) + list_tags("channel_pages"),
+    )
+
+
+async def build_channel_detail(session: AsyncSession, slug: str, is_subscribed: bool) -> ChannelDetailResponse:
+    channel = (await session.exec(
         select(Channel).where(Channel.slug == slug)
-    ).first()
+    )).first()
     
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
     
-    sport = session.get(Sport, channel.sport_id)
+    sport = await session.get(Sport, channel.sport_id)
     if not sport:
         raise HTTPException(status_code=404, detail="Sport not found")
     
-    sub_count = session.exec(
+    sub_count = (await session.exec(
         select(func.count(ChannelSubscription.id))
         .where(ChannelSubscription.channel_id == channel.id)
-    ).one()
-    
-    is_subscribed = False
-    if current_user:
-        sub = session.exec(
-            select(ChannelSubscription)
-            .where(ChannelSubscription.channel_id == channel.id)
-            .where(ChannelSubscription.user_id == current_user.id)
-        ).first()
-        is_subscribed = sub is not None
+    )).one()
     
-    live_games = session.exec(
+    live_games = (await session.exec(
         select(Game)
         .join(Season)
         .join(League)
         .where(League.sport_id == sport.id)
         .where(Game.status == GameStatus.in_progress)
         .limit(10)
-    ).all()
+    )).all()
     
     live_events = []
     for game in live_games:
-        season = session.get(Season, game.season_id)
-        league = session.get(League, season.league_id) if season else None
-        venue = session.get(Venue, league.venue_id) if league else None
+        season = await session.get(Season, game.season_id)
+        league = await session.get(League, season.league_id) if season else None
+        venue = await session.get(Venue, league.venue_id) if league else None
         live_events.append(LiveEventResponse(
             id=game.id,
             event_type="game",
@@ -266,7 +302,7 @@ def get_channel(
     now = datetime.utcnow()
     next_14_days = now + timedelta(days=14)
     
-    upcoming_games = session.exec(
+    upcoming_games = (await session.exec(
         select(Game)
         .join(Season)
         .join(League)
@@ -276,13 +312,13 @@ def get_channel(
         .where(Game.start_time <= next_14_days)
         .order_by(Game.start_time)
         .limit(10)
-    ).all()
+    )).all()
     
     upcoming_events = []
     for game in upcoming_games:
-        season = session.get(Season, game.season_id)
-        league = session.get(League, season.league_id) if season else None
-        venue = session.get(Venue, league.venue_id) if league else None
+        season = await session.get(Season, game.season_id)
+        league = await session.get(League, season.league_id) if season else None
+        venue = await session.get(Venue, league.venue_id) if league else None
         upcoming_events.append(UpcomingEventResponse(
             id=game.id,
             event_type="game",
@@ -293,17 +329,17 @@ def get_channel(
             registration_open=False
         ))
     
-    open_seasons = session.exec(
+    open_seasons = (await session.exec(
         select(Season)
         .join(League)
         .where(League.sport_id == sport.id)
         .where(Season.registration_open == True)
         .limit(5)
-    ).all()
+    )).all()
     
     for season in open_seasons:
-        league = session.get(League, season.league_id)
-        venue = session.get(Venue, league.venue_id) if league else None
+        league = await session.get(League, season.league_id)
+        venue = await session.get(Venue, league.venue_id) if league else None
         upcoming_events.append(UpcomingEventResponse(
             id=season.id,
             event_type="season",
@@ -315,22 +351,22 @@ def get_channel(
             spots_available=league.max_participants if league else None
         ))
     
-    total_leagues = session.exec(
+    total_leagues = (await session.exec(
         select(func.count(League.id)).where(League.sport_id == sport.id)
-    ).one()
+    )).one()
     
-    total_venues = session.exec(
+    total_venues = (await session.exec(
         select(func.count(func.distinct(VenueSport.venue_id)))
         .where(VenueSport.sport_id == sport.id)
-    ).one()
+    )).one()
     
-    recent_results = session.exec(
+    recent_results = (await session.exec(
         select(func.count(Game.id))
         .join(Season)
         .join(League)
         .where(League.sport_id == sport.id)
         .where(Game.status == GameStatus.final)
-    ).one()
+    )).one()
     
     stats = ChannelStatsResponse(
         subscriber_count=sub_count,
@@ -366,16 +402,16 @@ def get_channel(
 
 
 @router.get("/{slug}/feed", response_model=ChannelFeedResponse)
-def get_channel_feed(
+async def get_channel_feed(
     slug: str,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     skip: int = 0,
     limit: int = 20,
     content_type: str | None = None
 ):
-    channel = session.exec(
+    channel = (await session.exec(
         select(Channel).where(Channel.slug == slug)
-    ).first()
+    )).first()
     
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
@@ -391,14 +427,14 @@ def get_channel_feed(
         col(ChannelFeedEntry.created_at).desc()
     ).offset(skip).limit(limit)
     
-    entries = session.exec(query).all()
+    entries = (await session.exec(query)).all()
     
     total_query = select(func.count(ChannelFeedEntry.id)).where(
         ChannelFeedEntry.channel_id == channel.id
     )
     if content_type:
         total_query = total_query.where(ChannelFeedEntry.content_type == content_type)
-    total = session.exec(total_query).one()
+    total = (await session.exec(total_query)).one()
     
     items = [
         ChannelFeedEntryResponse(
@@ -476,6 +512,9 @@ def subscribe_to_channel(
     session.add(new_sub)
     session.commit()
     session.refresh(new_sub)
+    invalidate_list_tags("channel_detail", slug=slug)
+    # subscriber_count is on the channel list too.
+    invalidate_list_tags("channels")
     
     return SubscriptionResponse(
         id=new_sub.id,
@@ -513,28 +552,31 @@ def unsubscribe_from_channel(
     
     session.delete(sub)
     session.commit()
+    invalidate_list_tags("channel_detail", slug=slug)
+    # subscriber_count is on the channel list too.
+    invalidate_list_tags("channels")
     
     return {"message": "Unsubscribed successfully"}
 
 
 @router.get("/{slug}/subscription", response_model=SubscriptionResponse | None)
-def get_subscription(
+async def get_subscription(
     slug: str,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
 ):
-    channel = session.exec(
+    channel = (await session.exec(
         select(Channel).where(Channel.slug == slug)
-    ).first()
+    )).first()
     
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
     
-    sub = session.exec(
+    sub = (await session.exec(
         select(ChannelSubscription)
         .where(ChannelSubscription.channel_id == channel.id)
         .where(ChannelSubscription.user_id == current_user.id)
-    ).first()
+    )).first()
     
     if not sub:
         return None
@@ -599,23 +641,23 @@ class VenuesListResponse(BaseModel):
 
 
 @router.get("/{slug}/schedule", response_model=ScheduleResponse)
-def get_channel_schedule(
+async def get_channel_schedule(
     slug: str,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     days_ahead: int = Query(default=14, ge=1, le=30)
 ):
-    channel = session.exec(select(Channel).where(Channel.slug == slug)).first()
+    channel = (await session.exec(select(Channel).where(Channel.slug == slug))).first()
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
     
-    sport = session.get(Sport, channel.sport_id)
+    sport = await session.get(Sport, channel.sport_id)
     if not sport:
         raise HTTPException(status_code=404, detail="Sport not found")
     
     now = datetime.utcnow()
     end_date = now + timedelta(days=days_ahead)
     
-    upcoming_games = session.exec(
+    upcoming_games = (await session.exec(
         select(Game)
         .join(Season)
         .join(League)
@@ -625,14 +667,14 @@ def get_channel_schedule(
         .where(Game.start_time <= end_date)
         .order_by(Game.start_time)
         .limit(50)
-    ).all()
+    )).all()
     
     days: dict[str, list[ScheduleEventResponse]] = {}
     
     for game in upcoming_games:
-        season = session.get(Season, game.season_id)
-        league = session.get(League, season.league_id) if season else None
-        venue = session.get(Venue, league.venue_id) if league else None
+        season = await session.get(Season, game.season_id)
+        league = await session.get(League, season.league_id) if season else None
+        venue = await session.get(Venue, league.venue_id) if league else None
         
         if game.start_time:
             day_label = game.start_time.strftime("%A, %b %d")
@@ -661,17 +703,17 @@ def get_channel_schedule(
             days[day_label] = []
         days[day_label].append(event)
     
-    open_seasons = session.exec(
+    open_seasons = (await session.exec(
         select(Season)
         .join(League)
         .where(League.sport_id == sport.id)
         .where(Season.registration_open == True)
         .limit(10)
-    ).all()
+    )).all()
     
     for season in open_seasons:
-        league = session.get(League, season.league_id)
-        venue = session.get(Venue, league.venue_id) if league else None
+        league = await session.get(League, season.league_id)
+        venue = await session.get(Venue, league.venue_id) if league else None
         
         if season.start_date:
             day_label = season.start_date.strftime("%A, %b %d")
@@ -696,25 +738,25 @@ def get_channel_schedule(
             days[day_label] = []
         days[day_label].append(event)
     
-    return ScheduleResponse(days=days)
+    return FastJSONResponse(ScheduleResponse(days=days))
 
 
 @router.get("/{slug}/results", response_model=ResultsListResponse)
-def get_channel_results(
+async def get_channel_results(
     slug: str,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     skip: int = 0,
     limit: int = 10
 ):
-    channel = session.exec(select(Channel).where(Channel.slug == slug)).first()
+    channel = (await session.exec(select(Channel).where(Channel.slug == slug))).first()
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
     
-    sport = session.get(Sport, channel.sport_id)
+    sport = await session.get(Sport, channel.sport_id)
     if not sport:
         raise HTTPException(status_code=404, detail="Sport not found")
     
-    completed_games = session.exec(
+    completed_games = (await session.exec(
         select(Game)
         .join(Season)
         .join(League)
@@ -723,13 +765,13 @@ def get_channel_results(
         .order_by(col(Game.end_time).desc())
         .offset(skip)
         .limit(limit)
-    ).all()
+    )).all()
     
     items = []
     for game in completed_games:
-        season = session.get(Season, game.season_id)
-        league = session.get(League, season.league_id) if season else None
-        venue = session.get(Venue, league.venue_id) if league else None
+        season = await session.get(Season, game.season_id)
+        league = await session.get(League, season.league_id) if season else None
+        venue = await session.get(Venue, league.venue_id) if league else None
         
         date_label = game.end_time.strftime("%b %d") if game.end_time else "Completed"
         
@@ -744,52 +786,52 @@ def get_channel_results(
             highlight=None
         ))
     
-    total = session.exec(
+    total = (await session.exec(
         select(func.count(Game.id))
         .join(Season)
         .join(League)
         .where(League.sport_id == sport.id)
         .where(Game.status == GameStatus.final)
-    ).one()
+    )).one()
     
     return ResultsListResponse(items=items, total=total)
 
 
 @router.get("/{slug}/venues", response_model=VenuesListResponse)
-def get_channel_venues(
+async def get_channel_venues(
     slug: str,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     skip: int = 0,
     limit: int = 10
 ):
-    channel = session.exec(select(Channel).where(Channel.slug == slug)).first()
+    channel = (await session.exec(select(Channel).where(Channel.slug == slug))).first()
     if not channel:
         raise HTTPException(status_code=404, detail="Channel not found")
     
-    sport = session.get(Sport, channel.sport_id)
+    sport = await session.get(Sport, channel.sport_id)
     if not sport:
         raise HTTPException(status_code=404, detail="Sport not found")
     
-    venue_sports = session.exec(
+    venue_sports = (await session.exec(
         select(VenueSport)
         .where(VenueSport.sport_id == sport.id)
         .offset(skip)
         .limit(limit)
-    ).all()
+    )).all()
     
     items = []
     for vs in venue_sports:
-        venue = session.get(Venue, vs.venue_id)
+        venue = await session.get(Venue, vs.venue_id)
         if not venue:
             continue
         
-        league_count = session.exec(
+        league_count = (await session.exec(
             select(func.count(League.id))
             .where(League.venue_id == venue.id)
             .where(League.sport_id == sport.id)
-        ).one()
+        )).one()
         
-        next_game = session.exec(
+        next_game = (await session.exec(
             select(Game)
             .join(Season)
             .join(League)
@@ -799,7 +841,7 @@ def get_channel_venues(
             .where(Game.start_time >= datetime.utcnow())
             .order_by(Game.start_time)
             .limit(1)
-        ).first()
+        )).first()
         
         next_event = None
         if next_game and next_game.start_time:
@@ -815,9 +857,9 @@ def get_channel_venues(
             next_event=next_event
         ))
     
-    total = session.exec(
+    total = (await session.exec(
         select(func.count(VenueSport.id)).where(VenueSport.sport_id == sport.id)
-    ).one()
+    )).one()
     
     return VenuesListResponse(items=items, total=total)
 
@@ -858,22 +900,27 @@ SPORT_EMOJIS = {
 
 
 @router.get("/featured/events", response_model=FeaturedEventsResponse)
-def get_featured_events(
-    session: Session = Depends(get_session),
+async def get_featured_events(
+    session: AsyncSession = Depends(get_async_session),
     limit: int = Query(6, ge=1, le=20),
 ):
+    cache_id = f"channels:{cache_key(featured_limit=limit)}"
+    return await load_cached_list_async(cache_id, session, lambda s: build_featured_events(s, limit), list_tags("channels"))
+
+
+async def build_featured_events(session: AsyncSession, limit: int) -> FeaturedEventsResponse:
     now = datetime.utcnow()
     next_7_days = now + timedelta(days=7)
     
     live_events: list[FeaturedEventResponse] = []
     upcoming_events: list[FeaturedEventResponse] = []
     
-    live_games = session.exec(
+    live_games = (await session.exec(
         select(OnlineGame)
         .where(OnlineGame.status == OnlineGameStatus.in_progress)
         .order_by(col(OnlineGame.created_at).desc())
         .limit(limit)
-    ).all()
+    )).all()
     
     for game in live_games:
         game_type = game.game_type.value if hasattr(game.game_type, 'value') else str(game.game_type)
@@ -890,22 +937,22 @@ def get_featured_events(
             is_featured=game.is_ranked
         ))
     
-    live_league_games = session.exec(
+    live_league_games = (await session.exec(
         select(Game)
         .where(Game.status == GameStatus.in_progress)
         .order_by(col(Game.start_time).desc())
         .limit(limit)
-    ).all()
+    )).all()
     
     for game in live_league_games:
-        season = session.get(Season, game.season_id)
+        season = await session.get(Season, game.season_id)
         if not season:
             continue
-        league = session.get(League, season.league_id)
+        league = await session.get(League, season.league_id)
         if not league:
             continue
-        sport = session.get(Sport, league.sport_id)
-        venue = session.get(Venue, league.venue_id)
+        sport = await session.get(Sport, league.sport_id)
+        venue = await session.get(Venue, league.venue_id)
         
         sport_name = sport.name.lower() if sport else "sport"
         live_events.append(FeaturedEventResponse(
@@ -922,24 +969,24 @@ def get_featured_events(
             starts_at=game.start_time,
         ))
     
-    upcoming_games = session.exec(
+    upcoming_games = (await session.exec(
         select(Game)
         .where(Game.status == GameStatus.scheduled)
         .where(Game.start_time >= now)
         .where(Game.start_time <= next_7_days)
         .order_by(Game.start_time)
         .limit(limit)
-    ).all()
+    )).all()
     
     for game in upcoming_games:
-        season = session.get(Season, game.season_id)
+        season = await session.get(Season, game.season_id)
         if not season:
             continue
-        league = session.get(League, season.league_id)
+        league = await session.get(League, season.league_id)
         if not league:
             continue
-        sport = session.get(Sport, league.sport_id)
-        venue = session.get(Venue, league.venue_id)
+        sport = await session.get(Sport, league.sport_id)
+        venue = await session.get(Venue, league.venue_id)
         
         sport_name = sport.name.lower() if sport else "sport"
         upcoming_events.append(FeaturedEventResponse(
@@ -956,19 +1003,19 @@ def get_featured_events(
             starts_at=game.start_time,
         ))
     
-    open_tournaments = session.exec(
+    open_tournaments = (await session.exec(
         select(Tournament)
         .where(Tournament.status == TournamentStatus.registration)
         .order_by(col(Tournament.created_at).desc())
         .limit(limit)
-    ).all()
+    )).all()
     
     for tournament in open_tournaments:
         game_type = tournament.game_type.value if hasattr(tournament.game_type, 'value') else str(tournament.game_type)
-        participant_count = session.exec(
+        participant_count = (await session.exec(
             select(func.count()).select_from(TournamentParticipant)
             .where(TournamentParticipant.tournament_id == tournament.id)
-        ).one()
+        )).one()
         upcoming_events.append(FeaturedEventResponse(
             id=tournament.id,
             event_type="tournament",
@@ -982,20 +1029,20 @@ def get_featured_events(
             is_featured=True
         ))
     
-    total_live = session.exec(
+    total_live = (await session.exec(
         select(func.count(OnlineGame.id))
         .where(OnlineGame.status == OnlineGameStatus.in_progress)
-    ).one() + session.exec(
+    )).one() + (await session.exec(
         select(func.count(Game.id))
         .where(Game.status == GameStatus.in_progress)
-    ).one()
+    )).one()
     
-    total_upcoming = session.exec(
+    total_upcoming = (await session.exec(
         select(func.count(Game.id))
         .where(Game.status == GameStatus.scheduled)
         .where(Game.start_time >= now)
         .where(Game.start_time <= next_7_days)
-    ).one()
+    )).one()
     
     return FeaturedEventsResponse(
         live=live_events[:limit],
@@ -4,11 +4,13 @@ from sqlmodel import Session, func, select
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import Comment, NotificationType, Post, Reaction, ReactionType, User
-from app.schemas import CommentCreate, CommentRead, CommentUpdate, PaginatedResponse, ReactionCreate, ReactionRead, paginate
+from app.schemas import CommentCreate, CommentRead, CommentUpdate, PaginatedResponse, ReactionCreate, ReactionRead, SortKey, TotalMode, count_total, keyset_paginate, page_rows, paginate
 from app.routers.notifications import create_notification, parse_and_notify_mentions
 
 router = APIRouter(prefix="/comments", tags=["comments"])
 
+COMMENT_ORDER = (SortKey(Comment.created_at), SortKey(Comment.id))
+
 
 @router.post("", response_model=CommentRead, status_code=status.HTTP_201_CREATED)
 def create_comment(
@@ -86,6 +88,8 @@ def list_post_comments(
     post_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
     post = session.get(Post, post_id)
@@ -96,16 +100,17 @@ def list_post_comments(
         Comment.post_id == post_id,
         Comment.is_deleted == False
     )
-    total = session.exec(count_stmt).one()
+    total = count_total(session, count_stmt, total_mode)
 
     stmt = select(Comment).where(
         Comment.post_id == post_id,
         Comment.is_deleted == False
-    ).order_by(Comment.created_at.asc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+    )
+    stmt = keyset_paginate(stmt, COMMENT_ORDER, page, page_size, cursor)
+    rows, next_cursor = page_rows(session.exec(stmt).all(), COMMENT_ORDER, page_size)
 
-    items = [CommentRead.model_validate(c) for c in session.exec(stmt).all()]
-    return paginate(items, total, page, page_size)
+    items = [CommentRead.model_validate(c) for c in rows]
+    return paginate(items, total, None if cursor else page, page_size, next_cursor)
 
 
 @router.patch("/{comment_id}", response_model=CommentRead)
@@ -2,59 +2,78 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, func, select
-
-from app.core.cache import cache_key, get_cached_list, invalidate_list_cache, set_cached_list
-from app.db import get_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import (
+    cache_key,
+    invalidate_channel_pages,
+    invalidate_entity_cache,
+    invalidate_list_tags,
+    list_tags,
+    load_cached_entity_async,
+    load_cached_list_async,
+    set_cached_entity,
+)
+from app.db import get_async_session, get_session
 from app.deps import get_current_user
 from app.models import Game, GameStatus, League, NotificationType, Registration, RegistrationStatus, ScoreSubmission, Season, User, VenueMember, VenueRole
-from app.schemas import GameCreate, GameRead, GameUpdate, PaginatedResponse, ScoreSubmissionCreate, ScoreSubmissionRead, paginate
+from app.schemas import GameCreate, GameRead, GameUpdate, PaginatedResponse, ScoreSubmissionCreate, ScoreSubmissionRead, SortKey, TotalMode, count_total_async, keyset_paginate, page_rows, paginate
 from app.schemas import GameStatus as GameStatusSchema
 from app.routers.notifications import create_notification, notify_league_participants
 
 router = APIRouter(prefix="/games", tags=["games"])
 
+GAME_ORDER = (
+    SortKey(Game.start_time, descending=True),
+    SortKey(Game.created_at, descending=True),
+    SortKey(Game.id, descending=True),
+)
+
 
 @router.get("", response_model=PaginatedResponse[GameRead])
-def list_games(
+async def list_games(
     season_id: int | None = None,
     status_filter: GameStatusSchema | None = Query(None, alias="status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    session: Session = Depends(get_session)
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
+    session: AsyncSession = Depends(get_async_session)
 ):
     status_val = status_filter.value if status_filter else None
-    cache_id = f"games:{cache_key(season_id=season_id, status=status_val, page=page, page_size=page_size)}"
-    cached = get_cached_list(cache_id)
-    if cached is not None:
-        return cached
+    cache_id = f"games:{cache_key(season_id=season_id, status=status_val, page=page, page_size=page_size, total=total_mode.value, cursor=cursor)}"
+
+    async def load(session: AsyncSession) -> dict:
+        stmt = select(Game)
+        count_stmt = select(func.count()).select_from(Game)
 
-    stmt = select(Game)
-    count_stmt = select(func.count()).select_from(Game)
+        if season_id is not None:
+            stmt = stmt.where(Game.season_id == season_id)
+            count_stmt = count_stmt.where(Game.season_id == season_id)
+        if status_filter is not None:
+            stmt = stmt.where(Game.status == status_filter.value)
+            count_stmt = count_stmt.where(Game.status == status_filter.value)
 
-    if season_id is not None:
-        stmt = stmt.where(Game.season_id == season_id)
-        count_stmt = count_stmt.where(Game.season_id == season_id)
-    if status_filter is not None:
-        stmt = stmt.where(Game.status == status_filter.value)
-        count_stmt = count_stmt.where(Game.status == status_filter.value)
+        total = await count_total_async(session, count_stmt, total_mode)
 
-    total = session.exec(count_stmt).one()
+        stmt = keyset_paginate(stmt, GAME_ORDER, page, page_size, cursor)
+        rows, next_cursor = page_rows((await session.exec(stmt)).all(), GAME_ORDER, page_size)
 
-    stmt = stmt.order_by(Game.start_time.desc().nullslast(), Game.created_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        items = [GameRead.model_validate(game) for game in rows]
+        return paginate(items, total, None if cursor else page, page_size, next_cursor)
 
-    items = [GameRead.model_validate(game) for game in session.exec(stmt).all()]
-    result = paginate(items, total, page, page_size)
-    set_cached_list(cache_id, result)
-    return result
+    return await load_cached_list_async(cache_id, session, load, list_tags("games", season=season_id))
 
 
 @router.get("/{game_id}", response_model=GameRead)
-def get_game(game_id: int, session: Session = Depends(get_session)):
-    game = session.get(Game, game_id)
-    if not game:
-        raise HTTPException(status_code=404, detail="Game not found")
-    return game
+async def get_game(game_id: int, session: AsyncSession = Depends(get_async_session)):
+    async def load(session: AsyncSession) -> GameRead:
+        game = await session.get(Game, game_id)
+        if not game:
+            raise HTTPException(status_code=404, detail="Game not found")
+        return GameRead.model_validate(game)
+
+    return await load_cached_entity_async("games", game_id, session, load)
 
 
 @router.post("", response_model=GameRead, status_code=status.HTTP_201_CREATED)
@@ -95,7 +114,9 @@ def create_game(
         )
         session.commit()
 
-    invalidate_list_cache("games:")
+    invalidate_list_tags("games", season=game.season_id)
+    invalidate_list_tags("standings", season=game.season_id)
+    invalidate_channel_pages()
     return game
 
 
@@ -133,7 +154,10 @@ def update_game(
     session.commit()
     session.refresh(game)
 
-    invalidate_list_cache("games:")
+    set_cached_entity("games", game.id, GameRead.model_validate(game))
+    invalidate_list_tags("games", season=game.season_id)
+    invalidate_list_tags("standings", season=game.season_id)
+    invalidate_channel_pages()
     return game
 
 
@@ -159,9 +183,13 @@ def delete_game(
     if not member:
         raise HTTPException(status_code=403, detail="Not authorized to delete this game")
 
+    season_id = game.season_id
     session.delete(game)
     session.commit()
-    invalidate_list_cache("games:")
+    invalidate_list_tags("games", season=season_id)
+    invalidate_list_tags("standings", season=season_id)
+    invalidate_channel_pages()
+    invalidate_entity_cache("games", game_id)
 
 
 @router.post("/{game_id}/scores", response_model=ScoreSubmissionRead, status_code=status.HTTP_201_CREATED)
@@ -220,19 +248,19 @@ def submit_score(
 
 
 @router.get("/{game_id}/scores", response_model=list[ScoreSubmissionRead])
-def list_score_submissions(
+async def list_score_submissions(
     game_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    game = session.get(Game, game_id)
+    game = await session.get(Game, game_id)
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    submissions = session.exec(
+    submissions = (await session.exec(
         select(ScoreSubmission)
         .where(ScoreSubmission.game_id == game_id)
         .order_by(ScoreSubmission.created_at.desc())
-    ).all()
+    )).all()
 
     return [ScoreSubmissionRead.model_validate(s) for s in submissions]
 
@@ -302,7 +330,10 @@ def verify_score(
         )
 
     session.commit()
-    invalidate_list_cache("games:")
+    invalidate_list_tags("games", season=game.season_id)
+    invalidate_list_tags("standings", season=game.season_id)
+    invalidate_channel_pages()
+    invalidate_entity_cache("games", game_id)
     return submission
 
 
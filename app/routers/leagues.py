@@ -1,11 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, func, select
 
-from app.core.cache import cache_key, get_cached_list, invalidate_list_cache, set_cached_list
+from app.core.cache import (
+    cache_key,
+    invalidate_channel_pages,
+    invalidate_entity_cache,
+    invalidate_list_tags,
+    list_tags,
+    load_cached_entity,
+    load_cached_list,
+    set_cached_entity,
+)
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import League, NotificationType, Sport, User, Venue, VenueFollow, VenueMember, VenueRole
-from app.schemas import LeagueCreate, LeagueRead, LeagueUpdate, PaginatedResponse, paginate
+from app.schemas import LeagueCreate, LeagueRead, LeagueUpdate, PaginatedResponse, TotalMode, paginate, trim_page
 from app.utils.geo import haversine_distance
 from app.routers.notifications import create_notification
 
@@ -22,64 +31,64 @@ def list_leagues(
     radius_miles: float = Query(50, ge=1, le=500, description="Search radius in miles"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
-    cache_id = f"leagues:{cache_key(venue_id=venue_id, sport_id=sport_id, is_active=is_active, page=page, page_size=page_size)}"
-    if latitude is None and longitude is None:
-        cached = get_cached_list(cache_id)
-        if cached is not None:
-            return cached
-
-    stmt = select(League)
-    count_stmt = select(func.count()).select_from(League)
-
-    if venue_id is not None:
-        stmt = stmt.where(League.venue_id == venue_id)
-        count_stmt = count_stmt.where(League.venue_id == venue_id)
-    if sport_id is not None:
-        stmt = stmt.where(League.sport_id == sport_id)
-        count_stmt = count_stmt.where(League.sport_id == sport_id)
-    if is_active is not None:
-        stmt = stmt.where(League.is_active == is_active)
-        count_stmt = count_stmt.where(League.is_active == is_active)
-
-    all_leagues = list(session.exec(stmt).all())
-    leagues_with_distance: list[tuple] = []
-
-    if latitude is not None and longitude is not None:
-        for league in all_leagues:
-            venue = session.get(Venue, league.venue_id)
-            if venue and venue.latitude is not None and venue.longitude is not None:
-                dist = haversine_distance(latitude, longitude, venue.latitude, venue.longitude)
-                if dist <= radius_miles:
-                    leagues_with_distance.append((league, round(dist, 1)))
-        leagues_with_distance.sort(key=lambda x: x[1])
-    else:
-        leagues_with_distance = [(league, None) for league in all_leagues]
-
-    total = len(leagues_with_distance)
-    start = (page - 1) * page_size
-    end = start + page_size
-    page_leagues = leagues_with_distance[start:end]
-
-    items = []
-    for league, dist in page_leagues:
-        league_data = LeagueRead.model_validate(league)
-        league_data.distance_miles = dist
-        items.append(league_data)
-    result = paginate(items, total, page, page_size)
-    
+    cache_id = f"leagues:{cache_key(venue_id=venue_id, sport_id=sport_id, is_active=is_active, page=page, page_size=page_size, total=total_mode.value)}"
+
+    def load(session: Session) -> dict:
+        stmt = select(League)
+        count_stmt = select(func.count()).select_from(League)
+
+        if venue_id is not None:
+            stmt = stmt.where(League.venue_id == venue_id)
+            count_stmt = count_stmt.where(League.venue_id == venue_id)
+        if sport_id is not None:
+            stmt = stmt.where(League.sport_id == sport_id)
+            count_stmt = count_stmt.where(League.sport_id == sport_id)
+        if is_active is not None:
+            stmt = stmt.where(League.is_active == is_active)
+            count_stmt = count_stmt.where(League.is_active == is_active)
+
+        all_leagues = list(session.exec(stmt).all())
+        leagues_with_distance: list[tuple] = []
+
+        if latitude is not None and longitude is not None:
+            for league in all_leagues:
+                venue = session.get(Venue, league.venue_id)
+                if venue and venue.latitude is not None and venue.longitude is not None:
+                    dist = haversine_distance(latitude, longitude, venue.latitude, venue.longitude)
+                    if dist <= radius_miles:
+                        leagues_with_distance.append((league, round(dist, 1)))
+            leagues_with_distance.sort(key=lambda x: x[1])
+        else:
+            leagues_with_distance = [(league, None) for league in all_leagues]
+
+        total = len(leagues_with_distance) if total_mode != TotalMode.none else None
+        start = (page - 1) * page_size
+        page_leagues, has_more = trim_page(leagues_with_distance[start:start + page_size + 1], page_size)
+
+        items = []
+        for league, dist in page_leagues:
+            league_data = LeagueRead.model_validate(league)
+            league_data.distance_miles = dist
+            items.append(league_data)
+        return paginate(items, total, page, page_size, has_more=has_more)
+
     if latitude is None and longitude is None:
-        set_cached_list(cache_id, result)
-    return result
+        return load_cached_list(cache_id, session, load, list_tags("leagues", venue=venue_id, sport=sport_id))
+    return load(session)
 
 
 @router.get("/{league_id}", response_model=LeagueRead)
 def get_league(league_id: int, session: Session = Depends(get_session)):
-    league = session.get(League, league_id)
-    if not league:
-        raise HTTPException(status_code=404, detail="League not found")
-    return league
+    def load(session: Session) -> LeagueRead:
+        league = session.get(League, league_id)
+        if not league:
+            raise HTTPException(status_code=404, detail="League not found")
+        return LeagueRead.model_validate(league)
+
+    return load_cached_entity("leagues", league_id, session, load)
 
 
 @router.post("", response_model=LeagueRead, status_code=status.HTTP_201_CREATED)
@@ -128,7 +137,8 @@ def create_league(
             )
     session.commit()
 
-    invalidate_list_cache("leagues:")
+    invalidate_list_tags("leagues", venue=league.venue_id, sport=league.sport_id)
+    invalidate_channel_pages()
     return league
 
 
@@ -161,7 +171,9 @@ def update_league(
     session.commit()
     session.refresh(league)
 
-    invalidate_list_cache("leagues:")
+    set_cached_entity("leagues", league.id, LeagueRead.model_validate(league))
+    invalidate_list_tags("leagues", venue=league.venue_id, sport=league.sport_id)
+    invalidate_channel_pages()
     return league
 
 
@@ -179,6 +191,10 @@ def delete_league(
     if venue.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Only venue owner can delete leagues")
 
+    venue_id = league.venue_id
+    sport_id = league.sport_id
     session.delete(league)
     session.commit()
-    invalidate_list_cache("leagues:")
+    invalidate_list_tags("leagues", venue=venue_id, sport=sport_id)
+    invalidate_channel_pages()
+    invalidate_entity_cache("leagues", league_id)
@@ -1,5 +1,11 @@
 from fastapi import APIRouter, Response
-from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+# These modules register their cache_*, db_* and request_span_* metrics on the same default registry.
+import app.core.cache  # noqa: F401
+import app.core.pool_stats  # noqa: F401
+import app.core.query_stats  # noqa: F401
+import app.core.timing  # noqa: F401
 
 router = APIRouter(tags=["metrics"])
 
@@ -15,6 +21,19 @@ REQUEST_LATENCY = Histogram(
     ["method", "endpoint"]
 )
 
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"]
+)
+
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size",
+    ["method", "endpoint"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+)
+
 AI_REQUEST_COUNT = Counter(
     "ai_requests_total",
     "Total AI API requests",
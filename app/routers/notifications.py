@@ -1,21 +1,30 @@
+from itertools import chain
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import event
 from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
-from app.deps import get_current_user
+from app.core.cache import cache_key, invalidate_list_tags, list_tags, load_cached_list_async
+from app.db import get_async_session, get_session
+from app.deps import get_current_user, get_current_user_async
 from app.models import Notification, NotificationType, User
-from app.schemas import NotificationRead, PaginatedResponse, paginate
+from app.schemas import NotificationRead, PaginatedResponse, SortKey, TotalMode, count_total_async, keyset_paginate, page_rows, paginate
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
+NOTIFICATION_ORDER = (SortKey(Notification.created_at, descending=True), SortKey(Notification.id, descending=True))
+
 
 @router.get("", response_model=PaginatedResponse[NotificationRead])
-def list_notifications(
+async def list_notifications(
     unread_only: bool = Query(False),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
 ):
     stmt = select(Notification).where(Notification.user_id == current_user.id)
     count_stmt = select(func.count()).select_from(Notification).where(
@@ -26,28 +35,33 @@ def list_notifications(
         stmt = stmt.where(Notification.is_read == False)
         count_stmt = count_stmt.where(Notification.is_read == False)
 
-    total = session.exec(count_stmt).one()
+    total = await count_total_async(session, count_stmt, total_mode)
 
-    stmt = stmt.order_by(Notification.created_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+    stmt = keyset_paginate(stmt, NOTIFICATION_ORDER, page, page_size, cursor)
+    rows, next_cursor = page_rows((await session.exec(stmt)).all(), NOTIFICATION_ORDER, page_size)
 
-    items = [NotificationRead.model_validate(n) for n in session.exec(stmt).all()]
-    return paginate(items, total, page, page_size)
+    items = [NotificationRead.model_validate(n) for n in rows]
+    return paginate(items, total, None if cursor else page, page_size, next_cursor)
 
 
 @router.get("/unread-count")
-def get_unread_count(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+async def get_unread_count(
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
 ):
-    count = session.exec(
-        select(func.count()).select_from(Notification).where(
-            Notification.user_id == current_user.id,
-            Notification.is_read == False
-        )
-    ).one()
+    user_id = current_user.id
+
+    async def load(session: AsyncSession) -> dict:
+        count = (await session.exec(
+            select(func.count()).select_from(Notification).where(
+                Notification.user_id == user_id,
+                Notification.is_read == False
+            )
+        )).one()
+        return {"unread_count": count}
 
-    return {"unread_count": count}
+    cache_id = f"notifications:{cache_key(unread_count=user_id)}"
+    return await load_cached_list_async(cache_id, session, load, list_tags("notifications", user=user_id))
 
 
 @router.post("/{notification_id}/read", response_model=NotificationRead)
@@ -111,6 +125,27 @@ def delete_notification(
     session.commit()
 
 
+# Notifications are written from many routers and the scheduler, usually
+# without committing themselves, so cached counts are dropped on commit.
+@event.listens_for(Session, "after_flush")
+def _collect_notified_users(session, flush_context):
+    users = session.info.setdefault("notified_user_ids", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Notification):
+            users.add(obj.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_unread_counts(session):
+    for user_id in session.info.pop("notified_user_ids", ()):
+        invalidate_list_tags("notifications", user=user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_notified_users(session):
+    session.info.pop("notified_user_ids", None)
+
+
 def create_notification(
     session: Session,
     user_id: int,
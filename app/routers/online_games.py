@@ -2,9 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from starlette import status as http_status
 from pydantic import BaseModel
 from sqlmodel import Session, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
-from app.deps import get_current_user, get_current_user_optional
+from app.core.cache import invalidate_channel_pages
+from app.core.responses import FastJSONResponse
+from app.db import get_async_session, get_session
+from app.deps import get_current_user, get_current_user_async, get_current_user_optional_async
 from app.game_engines import (
     BattleshipEngine,
     CheckersEngine,
@@ -19,10 +22,12 @@ from app.models import (
     OnlineGameType,
     User,
 )
-from app.schemas import PaginatedResponse, paginate
+from app.schemas import PaginatedResponse, SortKey, TotalMode, count_total_async, keyset_paginate, page_rows, paginate
 
 router = APIRouter(prefix="/online-games", tags=["online-games"])
 
+ONLINE_GAME_ORDER = (SortKey(OnlineGame.created_at, descending=True), SortKey(OnlineGame.id, descending=True))
+
 
 def get_engine(game_type: OnlineGameType) -> GameEngine:
     engines = {
@@ -153,14 +158,16 @@ def create_game(
 
 
 @router.get("", response_model=PaginatedResponse[GameResponse])
-def list_games(
+async def list_games(
     game_type: OnlineGameType | None = None,
     status: OnlineGameStatus | None = None,
     my_games: bool = Query(False),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    session: Session = Depends(get_session),
-    current_user: User | None = Depends(get_current_user_optional)
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User | None = Depends(get_current_user_optional_async)
 ):
     if my_games and not current_user:
         raise HTTPException(
@@ -189,12 +196,10 @@ def list_games(
             (OnlineGame.player2_id == current_user.id)
         )
     
-    total = session.exec(count_stmt).one()
+    total = await count_total_async(session, count_stmt, total_mode)
     
-    stmt = stmt.order_by(OnlineGame.created_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-    
-    games = session.exec(stmt).all()
+    stmt = keyset_paginate(stmt, ONLINE_GAME_ORDER, page, page_size, cursor)
+    games, next_cursor = page_rows((await session.exec(stmt)).all(), ONLINE_GAME_ORDER, page_size)
     
     items = [
         GameResponse(
@@ -211,14 +216,14 @@ def list_games(
         for g in games
     ]
     
-    return paginate(items, total, page, page_size)
+    return paginate(items, total, None if cursor else page, page_size, next_cursor)
 
 
 @router.get("/available")
-def list_available_games(
+async def list_available_games(
     game_type: OnlineGameType | None = None,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
 ):
     stmt = select(OnlineGame).where(
         OnlineGame.status == OnlineGameStatus.waiting,
@@ -229,7 +234,7 @@ def list_available_games(
         stmt = stmt.where(OnlineGame.game_type == game_type)
     
     stmt = stmt.order_by(OnlineGame.created_at.desc()).limit(20)
-    games = session.exec(stmt).all()
+    games = (await session.exec(stmt)).all()
     
     return [
         {
@@ -269,6 +274,8 @@ def join_game(
     session.add(game)
     session.commit()
     session.refresh(game)
+    # Featured events list the online games in progress.
+    invalidate_channel_pages()
     
     return GameResponse(
         id=game.id,
@@ -328,16 +335,16 @@ def challenge_player(
 
 
 @router.get("/challenges", response_model=list[ChallengeResponse])
-def list_challenges(
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+async def list_challenges(
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
 ):
     stmt = select(OnlineGame).where(
         OnlineGame.status == OnlineGameStatus.waiting,
         OnlineGame.challenged_user_id == current_user.id
     ).order_by(OnlineGame.created_at.desc())
     
-    games = session.exec(stmt).all()
+    games = (await session.exec(stmt)).all()
     
     return [
         ChallengeResponse(
@@ -375,6 +382,7 @@ def accept_challenge(
     session.add(game)
     session.commit()
     session.refresh(game)
+    invalidate_channel_pages()
     
     return GameResponse(
         id=game.id,
@@ -413,12 +421,12 @@ def decline_challenge(
 
 
 @router.get("/{game_id}", response_model=GameStateResponse)
-def get_game_state(
+async def get_game_state(
     game_id: int,
-    session: Session = Depends(get_session),
-    current_user: User = Depends(get_current_user)
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async)
 ):
-    game = session.get(OnlineGame, game_id)
+    game = await session.get(OnlineGame, game_id)
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     
@@ -444,7 +452,8 @@ def get_game_state(
     else:
         board_state = state
     
-    return GameStateResponse(
+    # Polled by every client in a game: serialize the model directly.
+    return FastJSONResponse(GameStateResponse(
         id=game.id,
         game_type=game.game_type.value,
         status=game.status.value,
@@ -454,16 +463,16 @@ def get_game_state(
         valid_moves=valid_moves,
         is_your_turn=is_your_turn,
         winner_id=game.winner_id
-    )
+    ))
 
 
 @router.get("/{game_id}/spectate", response_model=SpectatorGameResponse)
-def spectate_game(
+async def spectate_game(
     game_id: int,
-    session: Session = Depends(get_session),
-    current_user: User | None = Depends(get_current_user_optional)
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User | None = Depends(get_current_user_optional_async)
 ):
-    game = session.get(OnlineGame, game_id)
+    game = await session.get(OnlineGame, game_id)
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     
@@ -478,7 +487,7 @@ def spectate_game(
     else:
         board_state = state
     
-    return SpectatorGameResponse(
+    return FastJSONResponse(SpectatorGameResponse(
         id=game.id,
         game_type=game.game_type.value,
         status=game.status.value,
@@ -488,7 +497,7 @@ def spectate_game(
         player2_id=game.player2_id,
         winner_id=game.winner_id,
         is_ranked=game.is_ranked
-    )
+    ))
 
 
 @router.post("/{game_id}/move")
@@ -538,6 +547,8 @@ def make_move(
     session.add(game)
     session.commit()
     session.refresh(game)
+    if game.status == OnlineGameStatus.completed:
+        invalidate_channel_pages()
     
     is_your_turn = (
         game.status == OnlineGameStatus.in_progress and 
@@ -584,6 +595,7 @@ def resign_game(
     
     session.add(game)
     session.commit()
+    invalidate_channel_pages()
     
     return {"message": "You have resigned", "winner_id": game.winner_id}
 
@@ -633,6 +645,7 @@ def search_for_match(
         session.add(game)
         session.commit()
         session.refresh(game)
+        invalidate_channel_pages()
         
         return MatchmakingResponse(
             status="matched",
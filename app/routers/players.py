@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, func, select
 
-from app.core.cache import cache_key, get_cached_list, invalidate_list_cache, set_cached_list
+from app.core.cache import cache_key, invalidate_list_tags, list_tags, load_cached_list
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import League, Player, Team, User, VenueMember, VenueRole
-from app.schemas import PaginatedResponse, PlayerCreate, PlayerRead, PlayerUpdate, paginate
+from app.schemas import PaginatedResponse, PlayerCreate, PlayerRead, PlayerUpdate, TotalMode, count_total, paginate, trim_page
 
 router = APIRouter(prefix="/players", tags=["players"])
 
@@ -15,29 +15,29 @@ def list_players(
     team_id: int | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
-    cache_id = f"players:{cache_key(team_id=team_id, page=page, page_size=page_size)}"
-    cached = get_cached_list(cache_id)
-    if cached is not None:
-        return cached
+    cache_id = f"players:{cache_key(team_id=team_id, page=page, page_size=page_size, total=total_mode.value)}"
 
-    stmt = select(Player)
-    count_stmt = select(func.count()).select_from(Player)
+    def load(session: Session) -> dict:
+        stmt = select(Player)
+        count_stmt = select(func.count()).select_from(Player)
 
-    if team_id is not None:
-        stmt = stmt.where(Player.team_id == team_id)
-        count_stmt = count_stmt.where(Player.team_id == team_id)
+        if team_id is not None:
+            stmt = stmt.where(Player.team_id == team_id)
+            count_stmt = count_stmt.where(Player.team_id == team_id)
 
-    total = session.exec(count_stmt).one()
+        total = count_total(session, count_stmt, total_mode)
 
-    stmt = stmt.order_by(Player.last_name, Player.first_name)
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        stmt = stmt.order_by(Player.last_name, Player.first_name)
+        stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
+        rows, has_more = trim_page(session.exec(stmt).all(), page_size)
 
-    items = [PlayerRead.model_validate(player) for player in session.exec(stmt).all()]
-    result = paginate(items, total, page, page_size)
-    set_cached_list(cache_id, result)
-    return result
+        items = [PlayerRead.model_validate(player) for player in rows]
+        return paginate(items, total, page, page_size, has_more=has_more)
+
+    return load_cached_list(cache_id, session, load, list_tags("players", team=team_id))
 
 
 @router.get("/{player_id}", response_model=PlayerRead)
@@ -76,7 +76,7 @@ def create_player(
     session.commit()
     session.refresh(player)
 
-    invalidate_list_cache("players:")
+    invalidate_list_tags("players", team=player.team_id)
     return player
 
 
@@ -113,7 +113,7 @@ def update_player(
     session.commit()
     session.refresh(player)
 
-    invalidate_list_cache("players:")
+    invalidate_list_tags("players", team=player.team_id)
     return player
 
 
@@ -141,6 +141,7 @@ def delete_player(
     if not member and not is_captain:
         raise HTTPException(status_code=403, detail="Not authorized to remove this player")
 
+    team_id = player.team_id
     session.delete(player)
     session.commit()
-    invalidate_list_cache("players:")
+    invalidate_list_tags("players", team=team_id)
@@ -1,15 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, func, select
 
-from app.core.cache import cache_key, get_cached_list, invalidate_list_cache, set_cached_list
+from app.core.cache import (
+    cache_key,
+    invalidate_entity_cache,
+    invalidate_list_tags,
+    list_tags,
+    load_cached_entity,
+    load_cached_list,
+    set_cached_entity,
+)
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import League, NotificationType, Post, User, Venue, VenueMember, VenueRole
-from app.schemas import PaginatedResponse, PostCreate, PostRead, PostUpdate, paginate
+from app.schemas import PaginatedResponse, PostCreate, PostRead, PostUpdate, SortKey, TotalMode, count_total, keyset_paginate, page_rows, paginate
 from app.routers.notifications import notify_league_participants, parse_and_notify_mentions
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
+POST_ORDER = (
+    SortKey(Post.is_pinned, descending=True),
+    SortKey(Post.created_at, descending=True),
+    SortKey(Post.id, descending=True),
+)
+
 
 @router.get("", response_model=PaginatedResponse[PostRead])
 def list_posts(
@@ -19,69 +33,72 @@ def list_posts(
     post_type: str | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
-    cache_id = f"posts:{cache_key(venue_id=venue_id, league_id=league_id, sport_id=sport_id, post_type=post_type, page=page, page_size=page_size)}"
-    cached = get_cached_list(cache_id)
-    if cached is not None:
-        return cached
-
-    stmt = select(Post)
-    count_stmt = select(func.count()).select_from(Post)
-
-    if venue_id is not None:
-        stmt = stmt.where(Post.venue_id == venue_id)
-        count_stmt = count_stmt.where(Post.venue_id == venue_id)
-    if league_id is not None:
-        stmt = stmt.where(Post.league_id == league_id)
-        count_stmt = count_stmt.where(Post.league_id == league_id)
-    if sport_id is not None:
-        stmt = stmt.where(Post.sport_id == sport_id)
-        count_stmt = count_stmt.where(Post.sport_id == sport_id)
-    if post_type is not None:
-        stmt = stmt.where(Post.post_type == post_type)
-        count_stmt = count_stmt.where(Post.post_type == post_type)
-
-    total = session.exec(count_stmt).one()
-
-    stmt = stmt.order_by(Post.is_pinned.desc(), Post.created_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-
-    items = [PostRead.model_validate(post) for post in session.exec(stmt).all()]
-    result = paginate(items, total, page, page_size)
-    set_cached_list(cache_id, result)
-    return result
+    cache_id = f"posts:{cache_key(venue_id=venue_id, league_id=league_id, sport_id=sport_id, post_type=post_type, page=page, page_size=page_size, total=total_mode.value, cursor=cursor)}"
+
+    def load(session: Session) -> dict:
+        stmt = select(Post)
+        count_stmt = select(func.count()).select_from(Post)
+
+        if venue_id is not None:
+            stmt = stmt.where(Post.venue_id == venue_id)
+            count_stmt = count_stmt.where(Post.venue_id == venue_id)
+        if league_id is not None:
+            stmt = stmt.where(Post.league_id == league_id)
+            count_stmt = count_stmt.where(Post.league_id == league_id)
+        if sport_id is not None:
+            stmt = stmt.where(Post.sport_id == sport_id)
+            count_stmt = count_stmt.where(Post.sport_id == sport_id)
+        if post_type is not None:
+            stmt = stmt.where(Post.post_type == post_type)
+            count_stmt = count_stmt.where(Post.post_type == post_type)
+
+        total = count_total(session, count_stmt, total_mode)
+
+        stmt = keyset_paginate(stmt, POST_ORDER, page, page_size, cursor)
+        rows, next_cursor = page_rows(session.exec(stmt).all(), POST_ORDER, page_size)
+
+        items = [PostRead.model_validate(post) for post in rows]
+        return paginate(items, total, None if cursor else page, page_size, next_cursor)
+
+    return load_cached_list(cache_id, session, load, list_tags("posts", venue=venue_id, league=league_id, sport=sport_id))
 
 
 @router.get("/feed", response_model=PaginatedResponse[PostRead])
 def get_bulletin_board(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
-    cache_id = f"posts:feed:{cache_key(page=page, page_size=page_size)}"
-    cached = get_cached_list(cache_id)
-    if cached is not None:
-        return cached
+    cache_id = f"posts:feed:{cache_key(page=page, page_size=page_size, total=total_mode.value, cursor=cursor)}"
 
-    count_stmt = select(func.count()).select_from(Post)
-    total = session.exec(count_stmt).one()
+    def load(session: Session) -> dict:
+        count_stmt = select(func.count()).select_from(Post)
+        total = count_total(session, count_stmt, total_mode)
 
-    stmt = select(Post).order_by(Post.is_pinned.desc(), Post.created_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        stmt = keyset_paginate(select(Post), POST_ORDER, page, page_size, cursor)
+        rows, next_cursor = page_rows(session.exec(stmt).all(), POST_ORDER, page_size)
 
-    items = [PostRead.model_validate(post) for post in session.exec(stmt).all()]
-    result = paginate(items, total, page, page_size)
-    set_cached_list(cache_id, result)
-    return result
+        items = [PostRead.model_validate(post) for post in rows]
+        return paginate(items, total, None if cursor else page, page_size, next_cursor)
+
+    return load_cached_list(cache_id, session, load, list_tags("posts"))
 
 
 @router.get("/{post_id}", response_model=PostRead)
 def get_post(post_id: int, session: Session = Depends(get_session)):
-    post = session.get(Post, post_id)
-    if not post:
-        raise HTTPException(status_code=404, detail="Post not found")
-    return post
+    def load(session: Session) -> PostRead:
+        post = session.get(Post, post_id)
+        if not post:
+            raise HTTPException(status_code=404, detail="Post not found")
+        return PostRead.model_validate(post)
+
+    return load_cached_entity("posts", post_id, session, load)
 
 
 @router.post("", response_model=PostRead, status_code=status.HTTP_201_CREATED)
@@ -141,7 +158,7 @@ def create_post(
     if notifications_pending:
         session.commit()
 
-    invalidate_list_cache("posts:")
+    invalidate_list_tags("posts", venue=post.venue_id, league=post.league_id, sport=post.sport_id)
     return post
 
 
@@ -178,7 +195,8 @@ def update_post(
     session.commit()
     session.refresh(post)
 
-    invalidate_list_cache("posts:")
+    set_cached_entity("posts", post.id, PostRead.model_validate(post))
+    invalidate_list_tags("posts", venue=post.venue_id, league=post.league_id, sport=post.sport_id)
     return post
 
 
@@ -206,6 +224,10 @@ def delete_post(
         else:
             raise HTTPException(status_code=403, detail="Not authorized to delete this post")
 
+    venue_id = post.venue_id
+    league_id = post.league_id
+    sport_id = post.sport_id
     session.delete(post)
     session.commit()
-    invalidate_list_cache("posts:")
+    invalidate_list_tags("posts", venue=venue_id, league=league_id, sport=sport_id)
+    invalidate_entity_cache("posts", post_id)
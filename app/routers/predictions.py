@@ -4,7 +4,7 @@ from sqlmodel import Session, func, select
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import Game, GameStatus, League, NotificationType, Prediction, Registration, RegistrationStatus, Season, Team, User
-from app.schemas import PaginatedResponse, PredictionCreate, PredictionRead, paginate
+from app.schemas import PaginatedResponse, PredictionCreate, PredictionRead, TotalMode, count_total, paginate, trim_page
 from app.routers.notifications import create_notification
 
 router = APIRouter(prefix="/predictions", tags=["predictions"])
@@ -58,21 +58,23 @@ def create_prediction(
 def list_my_predictions(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     count_stmt = select(func.count()).select_from(Prediction).where(
         Prediction.user_id == current_user.id
     )
-    total = session.exec(count_stmt).one()
+    total = count_total(session, count_stmt, total_mode)
 
     stmt = select(Prediction).where(
         Prediction.user_id == current_user.id
     ).order_by(Prediction.created_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+    stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
+    rows, has_more = trim_page(session.exec(stmt).all(), page_size)
 
-    items = [PredictionRead.model_validate(p) for p in session.exec(stmt).all()]
-    return paginate(items, total, page, page_size)
+    items = [PredictionRead.model_validate(p) for p in rows]
+    return paginate(items, total, page, page_size, has_more=has_more)
 
 
 @router.get("/games/{game_id}", response_model=list[PredictionRead])
@@ -1,16 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, func, select
 
-from app.core.cache import cache_key, get_cached_list, invalidate_list_cache, set_cached_list
+from app.core.cache import cache_key, invalidate_list_tags, list_tags, load_cached_list
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import League, Notification, NotificationType, Registration, RegistrationStatus, User, VenueMember, VenueRole
-from app.schemas import PaginatedResponse, RegistrationCreate, RegistrationRead, RegistrationUpdate, paginate
+from app.schemas import PaginatedResponse, RegistrationCreate, RegistrationRead, RegistrationUpdate, SortKey, TotalMode, count_total, keyset_paginate, page_rows, paginate
 from app.models import RegistrationMode
 from app.routers.notifications import create_notification
 
 router = APIRouter(prefix="/registrations", tags=["registrations"])
 
+REGISTRATION_ORDER = (SortKey(Registration.created_at, descending=True), SortKey(Registration.id, descending=True))
+
 
 @router.get("", response_model=PaginatedResponse[RegistrationRead])
 def list_registrations(
@@ -19,35 +21,35 @@ def list_registrations(
     status_filter: RegistrationStatus | None = Query(None, alias="status"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
-    cache_id = f"registrations:{cache_key(league_id=league_id, user_id=user_id, status=status_filter.value if status_filter else None, page=page, page_size=page_size)}"
-    cached = get_cached_list(cache_id)
-    if cached is not None:
-        return cached
+    cache_id = f"registrations:{cache_key(league_id=league_id, user_id=user_id, status=status_filter.value if status_filter else None, page=page, page_size=page_size, total=total_mode.value, cursor=cursor)}"
+
+    def load(session: Session) -> dict:
+        stmt = select(Registration)
+        count_stmt = select(func.count()).select_from(Registration)
 
-    stmt = select(Registration)
-    count_stmt = select(func.count()).select_from(Registration)
+        if league_id is not None:
+            stmt = stmt.where(Registration.league_id == league_id)
+            count_stmt = count_stmt.where(Registration.league_id == league_id)
+        if user_id is not None:
+            stmt = stmt.where(Registration.user_id == user_id)
+            count_stmt = count_stmt.where(Registration.user_id == user_id)
+        if status_filter is not None:
+            stmt = stmt.where(Registration.status == status_filter)
+            count_stmt = count_stmt.where(Registration.status == status_filter)
 
-    if league_id is not None:
-        stmt = stmt.where(Registration.league_id == league_id)
-        count_stmt = count_stmt.where(Registration.league_id == league_id)
-    if user_id is not None:
-        stmt = stmt.where(Registration.user_id == user_id)
-        count_stmt = count_stmt.where(Registration.user_id == user_id)
-    if status_filter is not None:
-        stmt = stmt.where(Registration.status == status_filter)
-        count_stmt = count_stmt.where(Registration.status == status_filter)
+        total = count_total(session, count_stmt, total_mode)
 
-    total = session.exec(count_stmt).one()
+        stmt = keyset_paginate(stmt, REGISTRATION_ORDER, page, page_size, cursor)
+        rows, next_cursor = page_rows(session.exec(stmt).all(), REGISTRATION_ORDER, page_size)
 
-    stmt = stmt.order_by(Registration.created_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        items = [RegistrationRead.model_validate(r) for r in rows]
+        return paginate(items, total, None if cursor else page, page_size, next_cursor)
 
-    items = [RegistrationRead.model_validate(r) for r in session.exec(stmt).all()]
-    result = paginate(items, total, page, page_size)
-    set_cached_list(cache_id, result)
-    return result
+    return load_cached_list(cache_id, session, load, list_tags("registrations", league=league_id, user=user_id))
 
 
 @router.post("", response_model=RegistrationRead, status_code=status.HTTP_201_CREATED)
@@ -95,7 +97,7 @@ def create_registration(
     session.commit()
     session.refresh(registration)
 
-    invalidate_list_cache("registrations:")
+    invalidate_list_tags("registrations", league=registration.league_id, user=registration.user_id)
     return registration
 
 
@@ -166,7 +168,7 @@ def update_registration(
     if notification_created:
         session.commit()
 
-    invalidate_list_cache("registrations:")
+    invalidate_list_tags("registrations", league=registration.league_id, user=registration.user_id)
     return registration
 
 
@@ -196,4 +198,4 @@ def cancel_registration(
     session.add(registration)
     session.commit()
 
-    invalidate_list_cache("registrations:")
+    invalidate_list_tags("registrations", league=registration.league_id, user=registration.user_id)
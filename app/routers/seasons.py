@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, func, select
 
-from app.core.cache import cache_key, get_cached_list, invalidate_list_cache, set_cached_list
+from app.core.cache import cache_key, invalidate_channel_pages, invalidate_list_tags, list_tags, load_cached_list
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import League, Season, User, Venue, VenueMember, VenueRole
-from app.schemas import PaginatedResponse, SeasonCreate, SeasonRead, SeasonUpdate, paginate
+from app.schemas import PaginatedResponse, SeasonCreate, SeasonRead, SeasonUpdate, TotalMode, count_total, paginate, trim_page
 
 router = APIRouter(prefix="/seasons", tags=["seasons"])
 
@@ -16,32 +16,32 @@ def list_seasons(
     is_active: bool | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
-    cache_id = f"seasons:{cache_key(league_id=league_id, is_active=is_active, page=page, page_size=page_size)}"
-    cached = get_cached_list(cache_id)
-    if cached is not None:
-        return cached
+    cache_id = f"seasons:{cache_key(league_id=league_id, is_active=is_active, page=page, page_size=page_size, total=total_mode.value)}"
 
-    stmt = select(Season)
-    count_stmt = select(func.count()).select_from(Season)
+    def load(session: Session) -> dict:
+        stmt = select(Season)
+        count_stmt = select(func.count()).select_from(Season)
 
-    if league_id is not None:
-        stmt = stmt.where(Season.league_id == league_id)
-        count_stmt = count_stmt.where(Season.league_id == league_id)
-    if is_active is not None:
-        stmt = stmt.where(Season.is_active == is_active)
-        count_stmt = count_stmt.where(Season.is_active == is_active)
+        if league_id is not None:
+            stmt = stmt.where(Season.league_id == league_id)
+            count_stmt = count_stmt.where(Season.league_id == league_id)
+        if is_active is not None:
+            stmt = stmt.where(Season.is_active == is_active)
+            count_stmt = count_stmt.where(Season.is_active == is_active)
 
-    total = session.exec(count_stmt).one()
+        total = count_total(session, count_stmt, total_mode)
 
-    stmt = stmt.order_by(Season.start_date.desc().nullslast())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        stmt = stmt.order_by(Season.start_date.desc().nullslast())
+        stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
+        rows, has_more = trim_page(session.exec(stmt).all(), page_size)
 
-    items = [SeasonRead.model_validate(s) for s in session.exec(stmt).all()]
-    result = paginate(items, total, page, page_size)
-    set_cached_list(cache_id, result)
-    return result
+        items = [SeasonRead.model_validate(s) for s in rows]
+        return paginate(items, total, page, page_size, has_more=has_more)
+
+    return load_cached_list(cache_id, session, load, list_tags("seasons", league=league_id))
 
 
 @router.get("/{season_id}", response_model=SeasonRead)
@@ -77,7 +77,9 @@ def create_season(
     session.commit()
     session.refresh(season)
 
-    invalidate_list_cache("seasons:")
+    invalidate_list_tags("seasons", league=season.league_id)
+    invalidate_list_tags("standings", season=season.id)
+    invalidate_channel_pages()
     return season
 
 
@@ -111,5 +113,7 @@ def update_season(
     session.commit()
     session.refresh(season)
 
-    invalidate_list_cache("seasons:")
+    invalidate_list_tags("seasons", league=season.league_id)
+    invalidate_list_tags("standings", season=season.id)
+    invalidate_channel_pages()
     return season
@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, func, select
 
-from app.core.cache import cache_key, get_cached_list, invalidate_list_cache, set_cached_list
+from app.core.cache import cache_key, invalidate_list_tags, list_tags, load_cached_list
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import Sport, User
-from app.schemas import PaginatedResponse, SportCategory, SportCreate, SportRead, paginate
+from app.schemas import PaginatedResponse, SportCategory, SportCreate, SportRead, TotalMode, count_total, paginate, trim_page
 
 router = APIRouter(prefix="/sports", tags=["sports"])
 
@@ -16,32 +16,32 @@ def list_sports(
     is_online: bool | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
-    cache_id = f"sports:{cache_key(category=category.value if category else None, is_online=is_online, page=page, page_size=page_size)}"
-    cached = get_cached_list(cache_id)
-    if cached is not None:
-        return cached
+    cache_id = f"sports:{cache_key(category=category.value if category else None, is_online=is_online, page=page, page_size=page_size, total=total_mode.value)}"
 
-    stmt = select(Sport)
-    count_stmt = select(func.count()).select_from(Sport)
+    def load(session: Session) -> dict:
+        stmt = select(Sport)
+        count_stmt = select(func.count()).select_from(Sport)
 
-    if category:
-        stmt = stmt.where(Sport.category == category)
-        count_stmt = count_stmt.where(Sport.category == category)
-    if is_online is not None:
-        stmt = stmt.where(Sport.is_online == is_online)
-        count_stmt = count_stmt.where(Sport.is_online == is_online)
+        if category:
+            stmt = stmt.where(Sport.category == category)
+            count_stmt = count_stmt.where(Sport.category == category)
+        if is_online is not None:
+            stmt = stmt.where(Sport.is_online == is_online)
+            count_stmt = count_stmt.where(Sport.is_online == is_online)
 
-    total = session.exec(count_stmt).one()
+        total = count_total(session, count_stmt, total_mode)
 
-    stmt = stmt.order_by(Sport.name)
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        stmt = stmt.order_by(Sport.name)
+        stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
+        rows, has_more = trim_page(session.exec(stmt).all(), page_size)
 
-    items = [SportRead.model_validate(s) for s in session.exec(stmt).all()]
-    result = paginate(items, total, page, page_size)
-    set_cached_list(cache_id, result)
-    return result
+        items = [SportRead.model_validate(s) for s in rows]
+        return paginate(items, total, page, page_size, has_more=has_more)
+
+    return load_cached_list(cache_id, session, load, list_tags("sports"))
 
 
 @router.get("/{sport_id}", response_model=SportRead)
@@ -67,5 +67,5 @@ def create_sport(
     session.commit()
     session.refresh(sport)
 
-    invalidate_list_cache("sports:")
+    invalidate_list_tags("sports")
     return sport
@@ -1,19 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db import get_session
+from app.core.cache import cache_key, list_tags, load_cached_list_async
+from app.db import get_async_session
 from app.models import Game, GameStatus, League, Season, Sport, Standing, Team, User
 
 router = APIRouter(prefix="/standings", tags=["standings"])
 
 
-def calculate_standings_wins_losses(session: Session, season_id: int) -> list[dict]:
-    games = session.exec(
+async def calculate_standings_wins_losses(session: AsyncSession, season_id: int) -> list[dict]:
+    games = (await session.exec(
         select(Game).where(
             Game.season_id == season_id,
             Game.status == GameStatus.final
         )
-    ).all()
+    )).all()
 
     team_stats = {}
     player_stats = {}
@@ -67,7 +69,7 @@ def calculate_standings_wins_losses(session: Session, season_id: int) -> list[di
     standings = []
 
     for team_id, stats in team_stats.items():
-        team = session.get(Team, team_id)
+        team = await session.get(Team, team_id)
         games_played = stats["wins"] + stats["losses"] + stats["ties"]
         win_pct = stats["wins"] / games_played if games_played > 0 else 0
         standings.append({
@@ -87,7 +89,7 @@ def calculate_standings_wins_losses(session: Session, season_id: int) -> list[di
         })
 
     for user_id, stats in player_stats.items():
-        user = session.get(User, user_id)
+        user = await session.get(User, user_id)
         games_played = stats["wins"] + stats["losses"] + stats["ties"]
         win_pct = stats["wins"] / games_played if games_played > 0 else 0
         standings.append({
@@ -114,13 +116,13 @@ def calculate_standings_wins_losses(session: Session, season_id: int) -> list[di
     return standings
 
 
-def calculate_standings_stroke_play(session: Session, season_id: int) -> list[dict]:
-    games = session.exec(
+async def calculate_standings_stroke_play(session: AsyncSession, season_id: int) -> list[dict]:
+    games = (await session.exec(
         select(Game).where(
             Game.season_id == season_id,
             Game.status == GameStatus.final
         )
-    ).all()
+    )).all()
 
     player_stats = {}
 
@@ -139,7 +141,7 @@ def calculate_standings_stroke_play(session: Session, season_id: int) -> list[di
 
     standings = []
     for user_id, stats in player_stats.items():
-        user = session.get(User, user_id)
+        user = await session.get(User, user_id)
         avg_strokes = stats["total_strokes"] / stats["rounds"] if stats["rounds"] > 0 else 0
         standings.append({
             "type": "player",
@@ -164,13 +166,13 @@ def calculate_standings_stroke_play(session: Session, season_id: int) -> list[di
     return standings
 
 
-def calculate_standings_points(session: Session, season_id: int) -> list[dict]:
-    games = session.exec(
+async def calculate_standings_points(session: AsyncSession, season_id: int) -> list[dict]:
+    games = (await session.exec(
         select(Game).where(
             Game.season_id == season_id,
             Game.status == GameStatus.final
         )
-    ).all()
+    )).all()
 
     team_stats = {}
     player_stats = {}
@@ -203,7 +205,7 @@ def calculate_standings_points(session: Session, season_id: int) -> list[dict]:
     standings = []
 
     for team_id, stats in team_stats.items():
-        team = session.get(Team, team_id)
+        team = await session.get(Team, team_id)
         standings.append({
             "type": "team",
             "team_id": team_id,
@@ -216,7 +218,7 @@ def calculate_standings_points(session: Session, season_id: int) -> list[dict]:
         })
 
     for user_id, stats in player_stats.items():
-        user = session.get(User, user_id)
+        user = await session.get(User, user_id)
         standings.append({
             "type": "player",
             "team_id": None,
@@ -237,61 +239,62 @@ def calculate_standings_points(session: Session, season_id: int) -> list[dict]:
 
 
 @router.get("/seasons/{season_id}")
-def get_standings(
+async def get_standings(
     season_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    season = session.get(Season, season_id)
-    if not season:
-        raise HTTPException(status_code=404, detail="Season not found")
-
-    league = session.get(League, season.league_id)
-    sport = session.get(Sport, league.sport_id)
-
-    if sport.scoring_type in ["stroke_play"]:
-        standings = calculate_standings_stroke_play(session, season_id)
-    elif sport.scoring_type in ["points", "frames"]:
-        standings = calculate_standings_points(session, season_id)
-    else:
-        standings = calculate_standings_wins_losses(session, season_id)
-
-    return {
-        "season_id": season_id,
-        "season_name": season.name,
-        "league_name": league.name,
-        "sport_name": sport.name,
-        "scoring_type": sport.scoring_type,
-        "standings": standings
-    }
+    async def load(session: AsyncSession) -> dict:
+        season = await session.get(Season, season_id)
+        if not season:
+            raise HTTPException(status_code=404, detail="Season not found")
+
+        league = await session.get(League, season.league_id)
+        sport = await session.get(Sport, league.sport_id)
+
+        if sport.scoring_type in ["stroke_play"]:
+            standings = await calculate_standings_stroke_play(session, season_id)
+        elif sport.scoring_type in ["points", "frames"]:
+            standings = await calculate_standings_points(session, season_id)
+        else:
+            standings = await calculate_standings_wins_losses(session, season_id)
+
+        return {
+            "season_id": season_id,
+            "season_name": season.name,
+            "league_name": league.name,
+            "sport_name": sport.name,
+            "scoring_type": sport.scoring_type,
+            "standings": standings
+        }
+
+    cache_id = f"standings:{cache_key(season_id=season_id)}"
+    return await load_cached_list_async(cache_id, session, load, list_tags("standings", season=season_id))
 
 
 @router.post("/seasons/{season_id}/refresh")
-def refresh_standings(
+async def refresh_standings(
     season_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_async_session)
 ):
-    season = session.get(Season, season_id)
+    season = await session.get(Season, season_id)
     if not season:
         raise HTTPException(status_code=404, detail="Season not found")
 
-    league = session.get(League, season.league_id)
-    sport = session.get(Sport, league.sport_id)
+    league = await session.get(League, season.league_id)
+    sport = await session.get(Sport, league.sport_id)
 
-    session.exec(
-        select(Standing).where(Standing.season_id == season_id)
-    )
-    existing = session.exec(
+    existing = (await session.exec(
         select(Standing).where(Standing.season_id == season_id)
-    ).all()
+    )).all()
     for s in existing:
-        session.delete(s)
+        await session.delete(s)
 
     if sport.scoring_type in ["stroke_play"]:
-        standings_data = calculate_standings_stroke_play(session, season_id)
+        standings_data = await calculate_standings_stroke_play(session, season_id)
     elif sport.scoring_type in ["points", "frames"]:
-        standings_data = calculate_standings_points(session, season_id)
+        standings_data = await calculate_standings_points(session, season_id)
     else:
-        standings_data = calculate_standings_wins_losses(session, season_id)
+        standings_data = await calculate_standings_wins_losses(session, season_id)
 
     for s in standings_data:
         standing = Standing(
@@ -307,6 +310,6 @@ def refresh_standings(
         )
         session.add(standing)
 
-    session.commit()
+    await session.commit()
 
     return {"message": "Standings refreshed", "count": len(standings_data)}
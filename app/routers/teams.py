@@ -1,11 +1,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, func, select
 
-from app.core.cache import cache_key, get_cached_list, invalidate_list_cache, set_cached_list
+from app.core.cache import (
+    cache_key,
+    invalidate_entity_cache,
+    invalidate_list_tags,
+    list_tags,
+    load_cached_entity,
+    load_cached_list,
+    set_cached_entity,
+)
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import League, Team, User, VenueMember, VenueRole
-from app.schemas import PaginatedResponse, TeamCreate, TeamRead, TeamUpdate, paginate
+from app.schemas import PaginatedResponse, TeamCreate, TeamRead, TeamUpdate, TotalMode, count_total, paginate, trim_page
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
@@ -15,37 +23,40 @@ def list_teams(
     league_id: int | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
-    cache_id = f"teams:{cache_key(league_id=league_id, page=page, page_size=page_size)}"
-    cached = get_cached_list(cache_id)
-    if cached is not None:
-        return cached
+    cache_id = f"teams:{cache_key(league_id=league_id, page=page, page_size=page_size, total=total_mode.value)}"
 
-    stmt = select(Team)
-    count_stmt = select(func.count()).select_from(Team)
+    def load(session: Session) -> dict:
+        stmt = select(Team)
+        count_stmt = select(func.count()).select_from(Team)
 
-    if league_id is not None:
-        stmt = stmt.where(Team.league_id == league_id)
-        count_stmt = count_stmt.where(Team.league_id == league_id)
+        if league_id is not None:
+            stmt = stmt.where(Team.league_id == league_id)
+            count_stmt = count_stmt.where(Team.league_id == league_id)
 
-    total = session.exec(count_stmt).one()
+        total = count_total(session, count_stmt, total_mode)
 
-    stmt = stmt.order_by(Team.name)
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        stmt = stmt.order_by(Team.name)
+        stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
+        rows, has_more = trim_page(session.exec(stmt).all(), page_size)
 
-    items = [TeamRead.model_validate(team) for team in session.exec(stmt).all()]
-    result = paginate(items, total, page, page_size)
-    set_cached_list(cache_id, result)
-    return result
+        items = [TeamRead.model_validate(team) for team in rows]
+        return paginate(items, total, page, page_size, has_more=has_more)
+
+    return load_cached_list(cache_id, session, load, list_tags("teams", league=league_id))
 
 
 @router.get("/{team_id}", response_model=TeamRead)
 def get_team(team_id: int, session: Session = Depends(get_session)):
-    team = session.get(Team, team_id)
-    if not team:
-        raise HTTPException(status_code=404, detail="Team not found")
-    return team
+    def load(session: Session) -> TeamRead:
+        team = session.get(Team, team_id)
+        if not team:
+            raise HTTPException(status_code=404, detail="Team not found")
+        return TeamRead.model_validate(team)
+
+    return load_cached_entity("teams", team_id, session, load)
 
 
 @router.post("", response_model=TeamRead, status_code=status.HTTP_201_CREATED)
@@ -73,7 +84,7 @@ def create_team(
     session.commit()
     session.refresh(team)
 
-    invalidate_list_cache("teams:")
+    invalidate_list_tags("teams", league=team.league_id)
     return team
 
 
@@ -109,7 +120,8 @@ def update_team(
     session.commit()
     session.refresh(team)
 
-    invalidate_list_cache("teams:")
+    set_cached_entity("teams", team.id, TeamRead.model_validate(team))
+    invalidate_list_tags("teams", league=team.league_id)
     return team
 
 
@@ -134,6 +146,8 @@ def delete_team(
     if not member:
         raise HTTPException(status_code=403, detail="Not authorized to delete this team")
 
+    league_id = team.league_id
     session.delete(team)
     session.commit()
-    invalidate_list_cache("teams:")
+    invalidate_list_tags("teams", league=league_id)
+    invalidate_entity_cache("teams", team_id)
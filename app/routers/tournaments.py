@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlmodel import Session, func, select
 
+from app.core.cache import invalidate_channel_pages
 from app.db import get_session
 from app.deps import get_current_user, get_current_user_optional
 from app.game_engines import (
@@ -24,7 +25,7 @@ from app.models import (
     TournamentStatus,
     User,
 )
-from app.schemas import PaginatedResponse, paginate
+from app.schemas import PaginatedResponse, TotalMode, count_total, paginate, trim_page
 
 router = APIRouter(prefix="/tournaments", tags=["tournaments"])
 
@@ -101,6 +102,8 @@ def create_tournament(
     session.add(tournament)
     session.commit()
     session.refresh(tournament)
+    # Featured events list the tournaments open for registration.
+    invalidate_channel_pages()
     
     return TournamentResponse(
         id=tournament.id,
@@ -124,6 +127,7 @@ def list_tournaments(
     status_filter: TournamentStatus | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session),
     current_user: User | None = Depends(get_current_user_optional)
 ):
@@ -138,12 +142,12 @@ def list_tournaments(
         stmt = stmt.where(Tournament.status == status_filter)
         count_stmt = count_stmt.where(Tournament.status == status_filter)
     
-    total = session.exec(count_stmt).one()
+    total = count_total(session, count_stmt, total_mode)
     
     stmt = stmt.order_by(Tournament.created_at.desc())
-    stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+    stmt = stmt.offset((page - 1) * page_size).limit(page_size + 1)
     
-    tournaments = session.exec(stmt).all()
+    tournaments, has_more = trim_page(session.exec(stmt).all(), page_size)
     
     items = []
     for t in tournaments:
@@ -168,7 +172,7 @@ def list_tournaments(
             created_at=t.created_at.isoformat()
         ))
     
-    return paginate(items, total, page, page_size)
+    return paginate(items, total, page, page_size, has_more=has_more)
 
 
 @router.get("/{tournament_id}", response_model=TournamentResponse)
@@ -243,6 +247,7 @@ def register_for_tournament(
     
     session.add(participant)
     session.commit()
+    invalidate_channel_pages()
     
     return {"message": "Successfully registered", "seed": count + 1}
 
@@ -352,6 +357,7 @@ def start_tournament(
     tournament.current_round = 1
     session.add(tournament)
     session.commit()
+    invalidate_channel_pages()
     
     all_matches = session.exec(
         select(TournamentMatch).where(
@@ -487,6 +493,7 @@ def start_match(
     match.online_game_id = game.id
     session.add(match)
     session.commit()
+    invalidate_channel_pages()
     
     return {"message": "Match started", "game_id": game.id}
 
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import List
 from pydantic import BaseModel
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select, func
 
 from app.db import get_session
@@ -195,7 +196,12 @@ def follow_user(
         notify_posts=prefs.notify_posts
     )
     session.add(new_follow)
-    session.commit()
+    try:
+        session.commit()
+    except IntegrityError:
+        # A concurrent request created the same follow after our check.
+        session.rollback()
+        raise HTTPException(status_code=409, detail="Already following this user")
     session.refresh(new_follow)
     
     return UserFollowResponse(
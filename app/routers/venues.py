@@ -3,11 +3,20 @@ from pydantic import BaseModel
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlmodel import Session, func, select
 
-from app.core.cache import cache_key, get_cached_list, invalidate_list_cache, set_cached_list
+from app.core.cache import (
+    cache_key,
+    invalidate_channel_pages,
+    invalidate_entity_cache,
+    invalidate_list_tags,
+    list_tags,
+    load_cached_entity,
+    load_cached_list,
+    set_cached_entity,
+)
 from app.db import get_session
 from app.deps import get_current_user
 from app.models import User, Venue, VenueMember, VenueRole, VenueFollow
-from app.schemas import PaginatedResponse, VenueCreate, VenueRead, VenueUpdate, paginate
+from app.schemas import PaginatedResponse, TotalMode, VenueCreate, VenueRead, VenueUpdate, paginate, trim_page
 
 router = APIRouter(prefix="/venues", tags=["venues"])
 
@@ -33,64 +42,63 @@ def list_venues(
     radius_miles: float = Query(50, ge=1, le=500, description="Search radius in miles"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    total_mode: TotalMode = Query(TotalMode.exact, alias="total"),
     session: Session = Depends(get_session)
 ):
-    cache_id = f"venues:{cache_key(city=city, state=state, venue_type=venue_type, page=page, page_size=page_size)}"
-    if latitude is None and longitude is None:
-        cached = get_cached_list(cache_id)
-        if cached is not None:
-            return cached
-
-    stmt = select(Venue)
-    count_stmt = select(func.count()).select_from(Venue)
-
-    if city:
-        stmt = stmt.where(Venue.city == city)
-        count_stmt = count_stmt.where(Venue.city == city)
-    if state:
-        stmt = stmt.where(Venue.state == state)
-        count_stmt = count_stmt.where(Venue.state == state)
-    if venue_type:
-        stmt = stmt.where(Venue.venue_type == venue_type)
-        count_stmt = count_stmt.where(Venue.venue_type == venue_type)
-
-    all_venues = list(session.exec(stmt).all())
-    venues_with_distance: list[tuple] = []
-
-    if latitude is not None and longitude is not None:
-        for v in all_venues:
-            if v.latitude is not None and v.longitude is not None:
-                dist = get_distance_miles(latitude, longitude, v.latitude, v.longitude)
-                if dist <= radius_miles:
-                    venues_with_distance.append((v, round(dist, 1)))
-        venues_with_distance.sort(key=lambda x: x[1])
-    else:
-        venues_with_distance = [(v, None) for v in all_venues]
-
-    total = len(venues_with_distance)
-    start = (page - 1) * page_size
-    end = start + page_size
-    page_venues = venues_with_distance[start:end]
-
-    items = []
-    for venue, dist in page_venues:
-        venue_data = VenueRead.model_validate(venue)
-        venue_data.distance_miles = dist
-        items.append(venue_data)
-    result = paginate(items, total, page, page_size)
+    cache_id = f"venues:{cache_key(city=city, state=state, venue_type=venue_type, page=page, page_size=page_size, total=total_mode.value)}"
+
+    def load(session: Session) -> dict:
+        stmt = select(Venue)
+        count_stmt = select(func.count()).select_from(Venue)
+
+        if city:
+            stmt = stmt.where(Venue.city == city)
+            count_stmt = count_stmt.where(Venue.city == city)
+        if state:
+            stmt = stmt.where(Venue.state == state)
+            count_stmt = count_stmt.where(Venue.state == state)
+        if venue_type:
+            stmt = stmt.where(Venue.venue_type == venue_type)
+            count_stmt = count_stmt.where(Venue.venue_type == venue_type)
+
+        all_venues = list(session.exec(stmt).all())
+        venues_with_distance: list[tuple] = []
+
+        if latitude is not None and longitude is not None:
+            for v in all_venues:
+                if v.latitude is not None and v.longitude is not None:
+                    dist = get_distance_miles(latitude, longitude, v.latitude, v.longitude)
+                    if dist <= radius_miles:
+                        venues_with_distance.append((v, round(dist, 1)))
+            venues_with_distance.sort(key=lambda x: x[1])
+        else:
+            venues_with_distance = [(v, None) for v in all_venues]
+
+        total = len(venues_with_distance) if total_mode != TotalMode.none else None
+        start = (page - 1) * page_size
+        page_venues, has_more = trim_page(venues_with_distance[start:start + page_size + 1], page_size)
+
+        items = []
+        for venue, dist in page_venues:
+            venue_data = VenueRead.model_validate(venue)
+            venue_data.distance_miles = dist
+            items.append(venue_data)
+        return paginate(items, total, page, page_size, has_more=has_more)
 
     if latitude is None and longitude is None:
-        set_cached_list(cache_id, result)
-
-    return result
+        return load_cached_list(cache_id, session, load, list_tags("venues"))
+    return load(session)
 
 
 @router.get("/{venue_id}", response_model=VenueRead)
 def get_venue(venue_id: int, session: Session = Depends(get_session)):
-    venue = session.get(Venue, venue_id)
-    if not venue:
-        raise HTTPException(status_code=404, detail="Venue not found")
-    return venue
+    def load(session: Session) -> VenueRead:
+        venue = session.get(Venue, venue_id)
+        if not venue:
+            raise HTTPException(status_code=404, detail="Venue not found")
+        return VenueRead.model_validate(venue)
+
+    return load_cached_entity("venues", venue_id, session, load)
 
 
 @router.post("", response_model=VenueRead, status_code=status.HTTP_201_CREATED)
@@ -108,7 +116,7 @@ def create_venue(
     session.add(member)
     session.commit()
 
-    invalidate_list_cache("venues:")
+    invalidate_list_tags("venues")
     return venue
 
 
@@ -141,7 +149,10 @@ def update_venue(
     session.commit()
     session.refresh(venue)
 
-    invalidate_list_cache("venues:")
+    set_cached_entity("venues", venue.id, VenueRead.model_validate(venue))
+    invalidate_list_tags("venues")
+    # Channel pages show events by venue name.
+    invalidate_channel_pages()
     return venue
 
 
@@ -160,7 +171,9 @@ def delete_venue(
 
     session.delete(venue)
     session.commit()
-    invalidate_list_cache("venues:")
+    invalidate_list_tags("venues")
+    invalidate_entity_cache("venues", venue_id)
+    invalidate_channel_pages()
 
 
 class VenueFollowCreate(BaseModel):
@@ -1,8 +1,18 @@
+import base64
+import json
+import threading
 from datetime import datetime
 from enum import Enum
-from typing import Generic, TypeVar
+from typing import Any, Generic, NamedTuple, Sequence, TypeVar
 
+from cachetools import TTLCache
+from fastapi import HTTPException, status
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from sqlalchemy import and_, false, or_, text, tuple_
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
 
 
 T = TypeVar("T")
@@ -79,12 +89,22 @@ class LeagueRole(str, Enum):
     participant = "participant"
 
 
+class TotalMode(str, Enum):
+    exact = "exact"
+    estimate = "estimate"
+    none = "none"
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     items: list[T]
-    total: int
-    page: int
+    # None when the request asked for ?total=none.
+    total: int | None
+    page: int | None
     page_size: int
-    pages: int
+    pages: int | None
+    has_more: bool = False
+    # Pass back as ?cursor= for the next page; None on the last page.
+    next_cursor: str | None = None
 
 
 class ErrorDetail(BaseModel):
@@ -643,12 +663,183 @@ class NotificationRead(BaseModel):
     created_at: datetime
 
 
-def paginate(items: list, total: int, page: int, page_size: int) -> dict:
-    pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+def paginate(
+    items: list,
+    total: int | None,
+    page: int | None,
+    page_size: int,
+    next_cursor: str | None = None,
+    has_more: bool | None = None,
+) -> dict:
+    if total is None:
+        pages = None
+    else:
+        pages = (total + page_size - 1) // page_size if page_size > 0 else 0
     return {
         "items": items,
         "total": total,
         "page": page,
         "page_size": page_size,
-        "pages": pages
+        "pages": pages,
+        "has_more": next_cursor is not None if has_more is None else has_more,
+        "next_cursor": next_cursor,
     }
+
+
+def trim_page(rows: Sequence, page_size: int) -> tuple[list, bool]:
+    """Drop the lookahead row of a ``limit(page_size + 1)`` query; report whether it existed."""
+    rows = list(rows)
+    return rows[:page_size], len(rows) > page_size
+
+
+_count_cache: TTLCache = TTLCache(maxsize=10_000, ttl=settings.count_estimate_ttl_s)
+_count_cache_lock = threading.Lock()
+
+
+def _count_cache_key(count_stmt) -> str:
+    compiled = count_stmt.compile()
+    return f"{compiled}|{sorted(compiled.params.items(), key=lambda item: item[0])!r}"
+
+
+def _reltuples_query(count_stmt):
+    """A pg_class statistics lookup for an unfiltered single-table count, else None."""
+    froms = count_stmt.get_final_froms()
+    if count_stmt.whereclause is not None or len(froms) != 1 or not hasattr(froms[0], "name"):
+        return None
+    return text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:name AS regclass)").bindparams(
+        name=froms[0].name
+    )
+
+
+def _count_steps(session: Session | AsyncSession, count_stmt, mode: TotalMode):
+    """The row count as ``mode`` asks for it, as a generator.
+
+    It yields each statement to run and is sent back the statement's scalar
+    result; its return value is the total. ``count_total`` and
+    ``count_total_async`` only differ in how they run the statements.
+    """
+    if mode == TotalMode.none:
+        return None
+    if mode == TotalMode.exact:
+        return (yield count_stmt)
+
+    key = _count_cache_key(count_stmt)
+    with _count_cache_lock:
+        if key in _count_cache:
+            return _count_cache[key]
+    total = None
+    reltuples = _reltuples_query(count_stmt)
+    if reltuples is not None and session.get_bind().dialect.name == "postgresql":
+        total = yield reltuples
+    if total is None or total < 0:
+        # Never analyzed (-1) or not answerable from statistics.
+        total = yield count_stmt
+    with _count_cache_lock:
+        _count_cache[key] = total
+    return total
+
+
+def count_total(session: Session, count_stmt, mode: TotalMode) -> int | None:
+    """The list's row count as ``mode`` asks for it: exact, estimated, or skipped."""
+    steps = _count_steps(session, count_stmt, mode)
+    try:
+        stmt = next(steps)
+        while True:
+            stmt = steps.send(session.scalar(stmt))
+    except StopIteration as done:
+        return done.value
+
+
+async def count_total_async(session: AsyncSession, count_stmt, mode: TotalMode) -> int | None:
+    """``count_total`` for routers on an ``AsyncSession``."""
+    steps = _count_steps(session, count_stmt, mode)
+    try:
+        stmt = next(steps)
+        while True:
+            stmt = steps.send(await session.scalar(stmt))
+    except StopIteration as done:
+        return done.value
+
+
+class SortKey(NamedTuple):
+    """One column of a list's ORDER BY. NULLs always sort last."""
+    column: Any
+    descending: bool = False
+
+
+def encode_cursor(keys: Sequence[SortKey], row: Any) -> str:
+    values = []
+    for key in keys:
+        value = getattr(row, key.column.key)
+        values.append(value.isoformat() if isinstance(value, datetime) else value)
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _cursor_value(key: SortKey, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = key.column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    return value if isinstance(value, python_type) else python_type(value)
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("wrong number of values")
+        return [_cursor_value(key, value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _after(keys: Sequence[SortKey], values: list):
+    """Rows strictly after ``values`` in the order given by ``keys``."""
+    if not keys:
+        return false()
+    key, value = keys[0], values[0]
+    column = key.column
+    nullable = column.expression.nullable
+    if value is None:
+        # NULLs sort last, so only other NULLs can tie and nothing is beyond.
+        return and_(column.is_(None), _after(keys[1:], values[1:]))
+    beyond = column < value if key.descending else column > value
+    if nullable:
+        beyond = or_(beyond, column.is_(None))
+    if len(keys) == 1:
+        return beyond
+    return or_(beyond, and_(column == value, _after(keys[1:], values[1:])))
+
+
+def keyset_paginate(stmt, keys: Sequence[SortKey], page: int, page_size: int, cursor: str | None = None):
+    """Order ``stmt`` by ``keys`` and select one page plus one row.
+
+    With a cursor the page starts right after the row it was taken from, so
+    deep pages cost the same as the first; without one, ``page`` is an
+    offset as before. ``keys`` must end in a unique column such as ``id``.
+    The extra row tells ``page_rows`` whether there is a next page.
+    """
+    order = []
+    for key in keys:
+        clause = key.column.desc() if key.descending else key.column.asc()
+        order.append(clause.nullslast() if key.column.expression.nullable else clause)
+    stmt = stmt.order_by(*order)
+    if cursor:
+        values = decode_cursor(keys, cursor)
+        same_direction = len({key.descending for key in keys}) == 1
+        if same_direction and None not in values and not any(key.column.expression.nullable for key in keys):
+            # A row-value comparison lets the planner seek straight into the index.
+            columns, bound = tuple_(*(key.column for key in keys)), tuple_(*values)
+            stmt = stmt.where(columns < bound if keys[0].descending else columns > bound)
+        else:
+            stmt = stmt.where(_after(keys, values))
+    else:
+        stmt = stmt.offset((page - 1) * page_size)
+    return stmt.limit(page_size + 1)
+
+
+def page_rows(rows: Sequence, keys: Sequence[SortKey], page_size: int) -> tuple[list, str | None]:
+    """Trim the lookahead row and return the page with its ``next_cursor``."""
+    rows, has_more = trim_page(rows, page_size)
+    return rows, encode_cursor(keys, rows[-1]) if has_more else None
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Serialization throughput for the five largest response bodies.
+
+For each payload this times three ways of turning a handler's return value
+into response bytes:
+
+  fastapi    FastAPI's default: validate against the response model, dump
+             to JSON-compatible Python (jsonable_encoder when there is no
+             model), then the stdlib json module in JSONResponse.render
+  to_json    pydantic_core.to_json, what the caches used before
+  fast       FastJSONResponse / render_json, as the app does now
+
+Payloads are synthetic but shaped like the real ones: the chess game state
+comes from the engine, the rest are filled from the response models.
+
+    python scripts/bench_json_responses.py [--rows 100] [--seconds 1]
+"""
+
+import argparse
+import asyncio
+import enum
+import sys
+import time
+import types
+import typing
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.core.responses import FastJSONResponse, render_json
+from app.game_engines import ChessEngine
+from app.routers.channels import ChannelDetailResponse, ScheduleResponse
+from app.routers.online_games import GameStateResponse
+from app.schemas import PaginatedResponse, VenueRead, paginate
+
+NOW = datetime(2024, 6, 1, 18, 30)
+
+
+def fake(annotation, rows: int, i: int = 0):
+    """A value of type ``annotation``, with ``rows`` items in every list."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in (typing.Union, types.UnionType):
+        return fake(next(a for a in args if a is not type(None)), rows, i)
+    if origin is list:
+        return [fake(args[0], rows, j) for j in range(rows)]
+    if origin is dict:
+        return {f"key{j}": fake(args[1] if args else str, rows, j) for j in range(3)}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation(**{
+            name: fake(field.annotation, rows, i) for name, field in annotation.model_fields.items()
+        })
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return list(annotation)[i % len(annotation)]
+    if annotation is datetime:
+        return NOW + timedelta(hours=i)
+    if annotation is date:
+        return NOW.date() + timedelta(days=i)
+    if annotation is bool:
+        return i % 2 == 0
+    if annotation is int:
+        return i + 1
+    if annotation is float:
+        return i * 1.25
+    return f"value {i} " + "x" * 40
+
+
+def payloads(rows: int) -> dict[str, tuple[typing.Any, typing.Any, bool]]:
+    """Endpoint -> (response model, what the handler returns, whether it skips FastAPI's serialization)."""
+    engine = ChessEngine()
+    state = engine.create_initial_state()
+    game_state = GameStateResponse(
+        id=1, game_type="chess", status="in_progress", board_state=state, current_turn=1,
+        player_number=1, valid_moves=engine.get_valid_moves(state, 1), is_your_turn=True, winner_id=None,
+    )
+    standings = {
+        "season_id": 1, "season_name": "Summer", "league_name": "Tuesday Night", "sport_name": "Bowling",
+        "scoring_type": "points",
+        "standings": [
+            {
+                "team_id": None, "team_name": None, "user_id": i, "user_name": f"Player {i}",
+                "total_points": 1000 - i, "games_played": 12, "average_points": round((1000 - i) / 12, 2),
+                "rank": i + 1,
+            }
+            for i in range(rows)
+        ],
+    }
+    venues = paginate([fake(VenueRead, rows, i) for i in range(rows)], 10 * rows, 1, rows)
+    schedule = ScheduleResponse(days={
+        f"Day {d}": fake(ScheduleResponse.model_fields["days"].annotation, rows // 7 or 1)["key0"] for d in range(7)
+    })
+    return {
+        "/channels/{slug}": (ChannelDetailResponse, fake(ChannelDetailResponse, rows // 4 or 1), True),
+        "/channels/{slug}/schedule": (ScheduleResponse, schedule, True),
+        "/standings/seasons/{id}": (None, standings, True),
+        "/online-games/{id}": (GameStateResponse, game_state, True),
+        "/venues": (PaginatedResponse[VenueRead], venues, True),
+    }
+
+
+def rate(fn, seconds: float) -> float:
+    fn()
+    calls, started = 0, time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < seconds:
+        fn()
+        calls += 1
+    return calls / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100, help="items in each list")
+    parser.add_argument("--seconds", type=float, default=1.0, help="time per measurement")
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    print(f"{'endpoint':28} {'bytes':>8} {'fastapi/s':>10} {'to_json/s':>10} {'fast/s':>10} {'speedup':>8}")
+    for endpoint, (model, content, served_directly) in payloads(args.rows).items():
+        field = create_model_field("Response_bench", model, mode="serialization") if model else None
+
+        def serialize():
+            return loop.run_until_complete(serialize_response(field=field, response_content=content))
+
+        def fastapi_default() -> bytes:
+            return JSONResponse(serialize()).body
+
+        def fast() -> bytes:
+            # Cached endpoints encode the handler's result once per fill; the
+            # schedule and game state return FastJSONResponse(model).
+            if served_directly:
+                return render_json(content)
+            return FastJSONResponse(serialize()).body
+
+        size = len(fast())
+        baseline = rate(fastapi_default, args.seconds)
+        pydantic = rate(lambda: to_json(content), args.seconds)
+        ours = rate(fast, args.seconds)
+        print(f"{endpoint:28} {size:>8} {baseline:>10.0f} {pydantic:>10.0f} {ours:>10.0f} {ours / baseline:>7.1f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Compare query plans and timings for the hot filters before and after 0002.
+
+Builds a throwaway SQLite database at the baseline migration, fills the hot
+tables with synthetic rows, and runs each query with EXPLAIN QUERY PLAN and a
+timing loop. It then upgrades to head (the composite indexes), runs ANALYZE
+and repeats the same queries.
+
+    python scripts/bench_query_plans.py [--rows 50000] [--repeat 200]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import insert, text
+
+from app.db import ALEMBIC_INI, BASELINE_REVISION, create_sqlite_engine
+from app.models import (
+    ChannelContentType,
+    ChannelFeedEntry,
+    Game,
+    GameStatus,
+    Notification,
+    NotificationType,
+    OnlineGame,
+    OnlineGameMatch,
+    OnlineGameStatus,
+    OnlineGameType,
+)
+
+QUERIES = {
+    "unread notifications": (
+        "SELECT * FROM notification WHERE user_id = :user_id AND is_read = 0 "
+        "ORDER BY created_at DESC LIMIT 20",
+        {"user_id": 7},
+    ),
+    "season schedule": (
+        "SELECT * FROM game WHERE season_id = :season_id AND status = 'scheduled' "
+        "ORDER BY start_time LIMIT 50",
+        {"season_id": 3},
+    ),
+    "open online games": (
+        "SELECT * FROM online_game WHERE status = 'waiting' AND game_type = 'chess' "
+        "ORDER BY created_at DESC LIMIT 20",
+        {},
+    ),
+    "matchmaking queue": (
+        "SELECT * FROM online_game_match WHERE game_type = 'chess' AND is_searching = 1 "
+        "ORDER BY created_at LIMIT 1",
+        {},
+    ),
+    "channel feed": (
+        "SELECT * FROM channel_feed_entry WHERE channel_id = :channel_id "
+        "ORDER BY is_pinned DESC, priority DESC, created_at DESC LIMIT 20",
+        {"channel_id": 5},
+    ),
+}
+
+
+def seed(conn, rows: int) -> None:
+    rng = random.Random(42)
+    start = datetime(2024, 1, 1)
+
+    def when() -> datetime:
+        return start + timedelta(minutes=rng.randrange(500_000))
+
+    conn.execute(insert(Notification.__table__), [
+        {
+            "user_id": rng.randrange(1, 200), "notification_type": NotificationType.game_result,
+            "title": "t", "message": "m", "is_read": rng.random() < 0.8, "created_at": when(),
+        }
+        for _ in range(rows)
+    ])
+    conn.execute(insert(Game.__table__), [
+        {
+            "season_id": rng.randrange(1, 50), "status": rng.choice(list(GameStatus)),
+            "start_time": when(), "created_at": when(),
+        }
+        for _ in range(rows)
+    ])
+    conn.execute(insert(OnlineGame.__table__), [
+        {
+            "game_type": rng.choice(list(OnlineGameType)), "status": rng.choice(list(OnlineGameStatus)),
+            "player1_id": rng.randrange(1, 200), "is_ranked": False, "created_at": when(),
+        }
+        for _ in range(rows)
+    ])
+    conn.execute(insert(OnlineGameMatch.__table__), [
+        {
+            "user_id": rng.randrange(1, 200), "game_type": rng.choice(list(OnlineGameType)),
+            "is_searching": rng.random() < 0.1, "elo_rating": 1200, "created_at": when(),
+        }
+        for _ in range(rows)
+    ])
+    conn.execute(insert(ChannelFeedEntry.__table__), [
+        {
+            "channel_id": rng.randrange(1, 20), "content_type": rng.choice(list(ChannelContentType)),
+            "title": "t", "priority": rng.randrange(5), "is_pinned": rng.random() < 0.02,
+            "is_featured": False, "visibility": "public", "created_at": when(),
+        }
+        for _ in range(rows)
+    ])
+
+
+def measure(engine, repeat: int) -> dict[str, tuple[list[str], float]]:
+    results = {}
+    with engine.connect() as conn:
+        for name, (sql, params) in QUERIES.items():
+            plan = [row[-1] for row in conn.execute(text("EXPLAIN QUERY PLAN " + sql), params)]
+            started = time.perf_counter()
+            for _ in range(repeat):
+                conn.execute(text(sql), params).all()
+            results[name] = (plan, (time.perf_counter() - started) / repeat * 1000)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000, help="rows per table")
+    parser.add_argument("--repeat", type=int, default=200, help="executions per query")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_sqlite_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        config = AlembicConfig(str(ALEMBIC_INI))
+
+        with engine.begin() as conn:
+            config.attributes["connection"] = conn
+            command.upgrade(config, BASELINE_REVISION)
+            seed(conn, args.rows)
+            conn.exec_driver_sql("ANALYZE")
+        before = measure(engine, args.repeat)
+
+        with engine.begin() as conn:
+            config.attributes["connection"] = conn
+            command.upgrade(config, "head")
+            conn.exec_driver_sql("ANALYZE")
+        after = measure(engine, args.repeat)
+        engine.dispose()
+
+    for name in QUERIES:
+        (plan_before, ms_before), (plan_after, ms_after) = before[name], after[name]
+        print(f"{name}: {ms_before:.3f} ms -> {ms_after:.3f} ms ({ms_before / ms_after:.1f}x)")
+        print(f"  before: {' / '.join(plan_before)}")
+        print(f"  after:  {' / '.join(plan_after)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Per-request overhead of the request-id/security-header middleware.
+
+Compares the old ``@app.middleware("http")`` function (BaseHTTPMiddleware)
+with RequestIdMiddleware, each wrapping the same trivial Starlette route.
+Requests are driven straight through the ASGI interface, so the numbers are
+middleware cost plus a minimal app, with no HTTP client or server in the way.
+
+    python scripts/bench_request_id_middleware.py [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from app.core.config import settings
+from app.core.logging import generate_request_id, request_id_var
+from app.core.middleware import RequestIdMiddleware
+
+
+async def add_request_id_and_security_headers(request: Request, call_next):
+    """The middleware as it was in app/main.py."""
+    request_id = request.headers.get("X-Request-ID") or generate_request_id()
+    request_id_var.set(request_id)
+
+    response: Response = await call_next(request)
+
+    response.headers["X-Request-ID"] = request_id
+    response.headers["X-Content-Type-Options"] = "nosniff"
+    response.headers["X-Frame-Options"] = "DENY"
+    response.headers["X-XSS-Protection"] = "1; mode=block"
+    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+
+    if settings.environment == "production":
+        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+
+    return response
+
+
+async def endpoint(request: Request) -> JSONResponse:
+    return JSONResponse({"ok": True})
+
+
+def build(middleware: Middleware) -> Starlette:
+    return Starlette(routes=[Route("/", endpoint)], middleware=[middleware])
+
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/",
+    "raw_path": b"/",
+    "query_string": b"",
+    "root_path": "",
+    "headers": [(b"host", b"bench")],
+    "client": ("127.0.0.1", 1234),
+    "server": ("bench", 80),
+}
+
+
+async def run(app: Starlette, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):
+        await app(dict(SCOPE), receive, send)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+
+    apps = {
+        "none (baseline)": Starlette(routes=[Route("/", endpoint)]),
+        "BaseHTTPMiddleware": build(Middleware(BaseHTTPMiddleware, dispatch=add_request_id_and_security_headers)),
+        "RequestIdMiddleware": build(Middleware(RequestIdMiddleware)),
+    }
+    for name, app in apps.items():
+        print(f"{name:>20}: {await run(app, args.requests):7.1f} us/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,35 +1,62 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session, SQLModel, create_engine
-from sqlmodel.pool import StaticPool
 
 from app.main import app
-from app.db import get_session
+from app import db
 from app.core import limiter as limiter_module
+from app.core.cache import auth_cache, entity_cache, list_cache
+from app.core.config import settings
+
+# Fail any test request that repeats one statement shape more than this
+# many times, so new N+1 loops show up in the suite.
+settings.sql_repeat_threshold = 10
+settings.sql_repeat_action = "raise"
+
+
+@pytest.fixture(name="database_path")
+def database_path_fixture(tmp_path):
+    # A file rather than an in-memory database, so the sync and async
+    # engines see the same data.
+    return tmp_path / "test.db"
 
 
 @pytest.fixture(name="session")
-def session_fixture():
+def session_fixture(database_path):
     engine = create_engine(
-        "sqlite://",
+        f"sqlite:///{database_path}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
     SQLModel.metadata.create_all(engine)
     with Session(engine) as session:
         yield session
+    engine.dispose()
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session):
-    def get_session_override():
-        return session
-
+def client_fixture(session: Session, database_path, monkeypatch):
     original_enabled = limiter_module.limiter.enabled
     limiter_module.limiter.enabled = False
 
-    app.dependency_overrides[get_session] = get_session_override
+    list_cache.clear()
+    entity_cache.clear()
+    auth_cache.clear()
+
+    # Point the app's engines at the test database rather than overriding
+    # get_session/get_async_session, so requests run on the real
+    # RoutingSession classes with their routing info and commit hooks.
+    test_engine = create_engine(f"sqlite:///{database_path}", connect_args={"check_same_thread": False})
+    # TestClient runs each request on a fresh event loop, so async
+    # connections must not be pooled across requests.
+    test_async_engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
+    for name in ("engine", "writer_engine"):
+        monkeypatch.setattr(db, name, test_engine)
+    for name in ("async_engine", "async_writer_engine"):
+        monkeypatch.setattr(db, name, test_async_engine)
+
     client = TestClient(app)
     yield client
-    app.dependency_overrides.clear()
     limiter_module.limiter.enabled = original_enabled
+    test_engine.dispose()
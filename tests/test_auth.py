@@ -1,5 +1,12 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlmodel import select
+
+from app.core.cache import auth_cache
+from app.deps import load_user, user_cache_key
+from app.models import User
+from tests.test_leagues import get_auth_header
 
 
 def test_register_user(client: TestClient):
@@ -146,3 +153,74 @@ def test_get_current_user(client: TestClient):
 def test_get_current_user_no_token(client: TestClient):
     response = client.get("/users/me")
     assert response.status_code == 401
+
+
+def test_repeat_requests_skip_the_user_lookup(client: TestClient):
+    headers = get_auth_header(client)
+
+    first = client.get("/users/me", headers=headers)
+    second = client.get("/users/me", headers=headers)
+
+    assert second.json() == first.json()
+    assert 'desc="0 queries"' in second.headers["server-timing"]
+
+
+def test_profile_change_evicts_cached_user(client: TestClient):
+    headers = get_auth_header(client)
+    client.get("/users/me", headers=headers)
+
+    client.post(
+        "/users/me/locations",
+        json={"label": "Home", "city": "Tempe", "state": "AZ", "latitude": 33.4, "longitude": -111.9, "is_primary": True},
+        headers=headers,
+    )
+
+    assert client.get("/users/me", headers=headers).json()["city"] == "Tempe"
+
+
+def test_deactivated_user_is_rejected_immediately(client: TestClient, session):
+    headers = get_auth_header(client)
+    assert client.get("/users/me", headers=headers).status_code == 200
+
+    user = session.exec(select(User).where(User.email == "testuser@example.com")).one()
+    user.is_active = False
+    session.add(user)
+    session.commit()
+
+    assert client.get("/users/me", headers=headers).status_code == 401
+
+
+def test_cached_user_leaves_out_the_password_hash(client: TestClient, session):
+    headers = get_auth_header(client)
+    assert client.get("/users/me", headers=headers).status_code == 200
+
+    user = session.exec(select(User).where(User.email == "testuser@example.com")).one()
+    snapshot = auth_cache.get(user_cache_key(user.id))
+    assert snapshot["email"] == "testuser@example.com"
+    assert "hashed_password" not in snapshot
+    # A user merged from the snapshot can still be written back.
+    session.expunge(user)
+    cached = load_user(session, user.id)
+    cached.full_name = "Renamed"
+    session.commit()
+    session.refresh(cached)
+    assert cached.full_name == "Renamed"
+    assert cached.hashed_password.startswith("$2")
+
+
+def test_writes_recheck_a_user_deactivated_by_another_worker(client: TestClient, session):
+    headers = get_auth_header(client)
+    assert client.get("/users/me", headers=headers).status_code == 200
+
+    # A Core UPDATE on another connection, like a write handled by another
+    # worker: nothing evicts this worker's snapshot.
+    with session.get_bind().begin() as conn:
+        conn.execute(update(User).where(User.email == "testuser@example.com").values(is_active=False))
+
+    assert client.get("/users/me", headers=headers).status_code == 200
+    response = client.post(
+        "/users/me/locations",
+        json={"label": "Home", "city": "Tempe", "state": "AZ", "latitude": 33.4, "longitude": -111.9, "is_primary": True},
+        headers=headers,
+    )
+    assert response.status_code == 401
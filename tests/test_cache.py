@@ -0,0 +1,448 @@
+import asyncio
+import gzip
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlmodel import Session, select
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app import db
+from app.core import cache as cache_module
+from app.core.cache import (
+    CachedPayload,
+    CachePolicy,
+    LIST_CACHE_POLICIES,
+    LocalBackend,
+    SingleFlight,
+    SQLiteBackend,
+    TieredBackend,
+    cache_key,
+    invalidate_channel_pages,
+    invalidate_entity_cache,
+    list_cache,
+    list_tags,
+    load_cached_list,
+    set_cached_entity,
+)
+from app.core.config import settings
+from app.core import warmup as warmup_module
+from app.core.warmup import warm_caches, warmup_status
+from app.db import create_sqlite_engine
+from app.main import app
+from app.models import Channel, NotificationType, User
+from app.routers.notifications import create_notification
+from tests.test_leagues import create_sport, create_venue, get_auth_header
+
+
+def make_worker(path, ttl: float = 60) -> TieredBackend:
+    return TieredBackend(LocalBackend(max_bytes=100_000, ttl=ttl), SQLiteBackend(str(path), "list", ttl))
+
+
+def test_tiered_cache_shares_entries_between_workers(tmp_path):
+    path = tmp_path / "cache.db"
+    worker_a = make_worker(path)
+    worker_b = make_worker(path)
+
+    worker_a.set("games:abc", {"items": [1, 2, 3]})
+
+    assert worker_b.get("games:abc") == {"items": [1, 2, 3]}
+
+
+def test_tiered_cache_invalidation_reaches_other_workers_l1(tmp_path):
+    path = tmp_path / "cache.db"
+    worker_a = make_worker(path)
+    worker_b = make_worker(path)
+
+    worker_a.set("games:abc", {"items": [1]})
+    worker_a.set("teams:abc", {"items": [2]})
+    assert worker_b.get("games:abc") is not None
+    assert worker_b.get("teams:abc") is not None
+
+    worker_a.delete_prefix("games:")
+
+    assert worker_b.get("games:abc") is None
+    assert worker_b.get("teams:abc") == {"items": [2]}
+
+
+def test_entity_write_through_reaches_other_workers_l1(tmp_path, monkeypatch):
+    path = tmp_path / "cache.db"
+    worker_a = make_worker(path)
+    worker_b = make_worker(path)
+    monkeypatch.setattr(cache_module, "entity_cache", worker_a)
+
+    set_cached_entity("games", 1, {"home_score": 1})
+    assert worker_b.get("games:1").body == b'{"home_score":1}'
+
+    set_cached_entity("games", 1, {"home_score": 2})
+
+    assert worker_b.get("games:1").body == b'{"home_score":2}'
+
+
+def test_invalidating_entity_zero_keeps_its_neighbours(monkeypatch):
+    monkeypatch.setattr(cache_module, "entity_cache", LocalBackend(max_bytes=100_000, ttl=60))
+    set_cached_entity("games", 0, {"id": 0})
+    set_cached_entity("games", 1, {"id": 1})
+
+    invalidate_entity_cache("games", 0)
+
+    assert cache_module.entity_cache.get("games:0") is None
+    assert cache_module.entity_cache.get("games:1") is not None
+
+
+def test_sqlite_backend_prefix_is_not_a_like_pattern(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "cache.db"), "list", 60)
+    backend.set("posts_feed:1", "a")
+    backend.set("posts:1", "b")
+
+    backend.delete_prefix("posts_")
+
+    assert backend.get("posts_feed:1") is None
+    assert backend.get("posts:1") == "b"
+
+
+def test_tag_invalidation_only_evicts_matching_pages():
+    backend = LocalBackend(max_bytes=100_000, ttl=60)
+    backend.set("games:s12", "season 12", list_tags("games", season=12))
+    backend.set("games:s13", "season 13", list_tags("games", season=13))
+    backend.set("games:all", "every season", list_tags("games", season=None))
+
+    backend.delete_tags(["games:*", "games:season:12"])
+
+    assert backend.get("games:s12") is None
+    assert backend.get("games:all") is None
+    assert backend.get("games:s13") == "season 13"
+
+
+def test_tag_invalidation_reaches_other_workers_l1(tmp_path):
+    path = tmp_path / "cache.db"
+    worker_a = make_worker(path)
+    worker_b = make_worker(path)
+
+    worker_a.set("games:s12", "season 12", ["games:season:12"])
+    worker_a.set("games:s13", "season 13", ["games:season:13"])
+    assert worker_b.get("games:s12") == "season 12"
+    assert worker_b.get("games:s13") == "season 13"
+
+    worker_a.delete_tags(["games:season:12"])
+
+    assert worker_b.get("games:s12") is None
+    assert worker_b.get("games:s13") == "season 13"
+
+
+def test_entries_expire_at_their_own_ttl(tmp_path):
+    def ttl_for(key: str) -> float:
+        return 0.05 if key.startswith("channels:") else 60
+
+    local = LocalBackend(max_bytes=100_000, ttl=60, name="ttl_test", ttl_for=ttl_for)
+    shared = SQLiteBackend(str(tmp_path / "cache.db"), "list", 60, ttl_for)
+    for backend in (local, shared):
+        backend.set("channels:a", "page", ["channels:*"])
+        backend.set("sports:a", "page")
+    time.sleep(0.1)
+    local.set("sports:b", "page")
+
+    assert len(local) == 2
+    assert "channels:*" not in local._tag_keys
+    assert shared.get("channels:a") is None
+    assert shared.get("sports:a") == "page"
+
+
+def test_evicted_entries_leave_the_tag_index():
+    backend = LocalBackend(max_bytes=10, ttl=60)
+    backend.set("a", b"1111", ["t"])
+    backend.set("b", b"2222", ["t"])
+    backend.set("c", b"3333", ["t"])
+
+    assert backend.get("a") is None
+    assert backend._tag_keys["t"] == {"b", "c"}
+
+
+def test_cached_page_is_served_as_identical_bytes(client):
+    list_cache.clear()
+    headers = get_auth_header(client)
+    client.post("/venues", json={"name": "Cached Venue", "venue_type": "golf_course"}, headers=headers)
+
+    miss = client.get("/venues")
+    hit = client.get("/venues")
+
+    assert hit.status_code == 200
+    assert hit.headers["content-type"] == "application/json"
+    assert hit.content == miss.content
+
+
+def test_concurrent_misses_compute_once():
+    list_cache.clear()
+    calls = []
+    release = threading.Event()
+
+    def compute(session):
+        calls.append(1)
+        release.wait(timeout=5)
+        return {"items": [], "total": 0}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(load_cached_list, "games:flight", Session(), compute) for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        bodies = {f.result().body for f in futures}
+
+    assert len(calls) == 1
+    assert bodies == {b'{"items":[],"total":0}'}
+
+
+def test_single_flight_shares_async_result():
+    flights = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def run():
+        return await asyncio.gather(*[flights.do_async("k", compute) for _ in range(5)])
+
+    assert asyncio.run(run()) == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_followers_survive_a_cancelled_leader():
+    flights = SingleFlight()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "value"
+
+    async def run():
+        leader = asyncio.create_task(flights.do_async("k", compute))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flights.do_async("k", compute)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        return results, leader.cancelled()
+
+    results, leader_cancelled = asyncio.run(run())
+
+    assert leader_cancelled
+    assert results == ["value"] * 3
+    assert len(calls) == 2
+
+
+def test_stale_page_is_served_while_refresh_is_scheduled(session, monkeypatch):
+    list_cache.clear()
+    monkeypatch.setitem(LIST_CACHE_POLICIES, "venues", CachePolicy(soft_ttl=10, hard_ttl=100))
+    list_cache.set("venues:swr", CachedPayload(b'"stale"', time.time() - 50))
+
+    response = load_cached_list("venues:swr", session, lambda s: "fresh")
+
+    assert response.body == b'"stale"'
+    assert response.background is not None
+    response.background.func(*response.background.args)
+    assert list_cache.get("venues:swr").body == b'"fresh"'
+
+
+def test_page_past_hard_ttl_is_recomputed(session, monkeypatch):
+    list_cache.clear()
+    monkeypatch.setitem(LIST_CACHE_POLICIES, "venues", CachePolicy(soft_ttl=10, hard_ttl=100))
+    list_cache.set("venues:swr", CachedPayload(b'"expired"', time.time() - 500))
+
+    response = load_cached_list("venues:swr", session, lambda s: "fresh")
+
+    assert response.body == b'"fresh"'
+    assert response.background is None
+
+
+def test_cache_metrics_are_exported(client):
+    list_cache.clear()
+    client.get("/sports")
+    client.get("/sports")
+
+    body = client.get("/metrics").text
+
+    assert 'cache_hits_total{cache="list",prefix="sports",tier="local"}' in body
+    assert 'cache_misses_total{cache="list",prefix="sports",tier="local"}' in body
+    assert 'cache_entries{cache="list",prefix="sports"} 1.0' in body
+
+
+def test_local_cache_evicts_least_recently_used_within_byte_budget():
+    backend = LocalBackend(max_bytes=1000, ttl=60)
+    backend.set("venues:big", b"x" * 600)
+    backend.set("seasons:small", b"y" * 100)
+    backend.get("venues:big")
+    backend.set("venues:other", b"z" * 400)
+
+    assert backend.get("seasons:small") is None
+    assert backend.get("venues:big") is not None
+    assert backend.currsize == 1000
+
+
+def test_value_larger_than_budget_is_not_cached():
+    backend = LocalBackend(max_bytes=10, ttl=60)
+    backend.set("venues:huge", b"x" * 11)
+
+    assert backend.get("venues:huge") is None
+    assert len(backend) == 0
+
+
+def test_matching_etag_gets_not_modified(client):
+    first = client.get("/games")
+    etag = first.headers["etag"]
+
+    second = client.get("/games", headers={"If-None-Match": etag})
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert first.headers["cache-control"] == "no-cache"
+
+
+def test_cached_page_is_stored_and_served_precompressed(client, monkeypatch):
+    monkeypatch.setattr(settings, "compression_min_bytes", 0)
+    plain = client.get("/games", headers={"Accept-Encoding": "identity"})
+    cache_id = "games:" + cache_key(season_id=None, status=None, page=1, page_size=20, total="exact", cursor=None)
+
+    hit = client.get("/games", headers={"Accept-Encoding": "gzip"})
+    revalidated = client.get("/games", headers={"Accept-Encoding": "gzip", "If-None-Match": hit.headers["etag"]})
+
+    assert dict(list_cache.get(cache_id).encoded)["gzip"] == gzip.compress(plain.content, compresslevel=9, mtime=0)
+    assert hit.headers["content-encoding"] == "gzip"
+    assert hit.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    assert hit.content == plain.content
+    assert revalidated.status_code == 304
+
+
+def test_browse_pages_may_be_reused_by_clients(client):
+    response = client.get("/sports")
+
+    assert response.headers["cache-control"] == "private, max-age=300, stale-while-revalidate=3300"
+
+
+def test_new_notification_changes_unread_count_etag(client, session):
+    headers = get_auth_header(client)
+    first = client.get("/notifications/unread-count", headers=headers)
+    assert first.json() == {"unread_count": 0}
+
+    user = session.exec(select(User).where(User.email == "testuser@example.com")).one()
+    create_notification(session, user.id, NotificationType.new_league, "Hello", "World")
+    session.commit()
+
+    second = client.get("/notifications/unread-count", headers={**headers, "If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert second.json() == {"unread_count": 1}
+
+
+def test_warm_up_prefills_hot_pages(client):
+    asyncio.run(warm_caches(app, ["/sports", "/channels", "/channels/featured/events", "/venues", "/leagues"]))
+
+    assert warmup_status["state"] == "done"
+    assert warmup_status["failed"] == []
+    assert len(list_cache) == 5
+    assert client.get("/health").json()["cache_warmup"]["state"] == "done"
+
+
+def test_hanging_warm_up_path_times_out(monkeypatch):
+    async def hang(request):
+        await asyncio.sleep(60)
+
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    monkeypatch.setattr(settings, "cache_warmup_timeout_s", 0.05)
+    slow_app = Starlette(routes=[Route("/hang", hang), Route("/ok", ok)])
+
+    asyncio.run(warm_caches(slow_app, ["/hang", "/ok"]))
+
+    assert warmup_status["state"] == "failed"
+    assert warmup_status["failed"] == ["/hang"]
+    assert warmup_status["warmed"] == ["/ok"]
+
+
+def test_health_is_unavailable_before_warm_up_takes_its_first_step(tmp_path, monkeypatch):
+    async def not_started_yet(app, paths):
+        await asyncio.Event().wait()
+
+    # Startup migrates the database, so give it an empty one.
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'startup.db'}")
+    for name in ("engine", "writer_engine"):
+        monkeypatch.setattr(db, name, engine)
+    monkeypatch.setattr(warmup_module, "warm_caches", not_started_yet)
+    monkeypatch.setitem(warmup_status, "state", "pending")
+
+    with TestClient(app) as started:
+        response = started.get("/health")
+
+    assert response.status_code == 503
+    assert response.json()["cache_warmup"]["state"] == "running"
+    engine.dispose()
+
+
+def test_warm_up_without_paths_is_skipped(client):
+    asyncio.run(warm_caches(app, []))
+
+    assert client.get("/health").status_code == 200
+    assert warmup_status["state"] == "skipped"
+
+
+def test_channel_pages_reflect_game_and_subscription_writes(client, session):
+    headers = get_auth_header(client)
+    venue = create_venue(client, headers)
+    sport = create_sport(client, headers)
+    league = client.post(
+        "/leagues", json={"name": "Weeknight", "venue_id": venue["id"], "sport_id": sport["id"]}, headers=headers
+    ).json()
+    season = client.post("/seasons", json={"league_id": league["id"], "name": "Spring"}, headers=headers).json()
+    session.add(Channel(sport_id=sport["id"], slug="golf", title="Golf"))
+    session.commit()
+
+    assert client.get("/channels/golf").json()["live_events"] == []
+    assert client.get("/channels").json()["items"][0]["live_events_count"] == 0
+
+    client.post("/games", json={"season_id": season["id"], "status": "in_progress"}, headers=headers)
+    client.post("/channels/golf/subscribe", json={}, headers=headers)
+
+    assert len(client.get("/channels/golf").json()["live_events"]) == 1
+    listed = client.get("/channels").json()["items"][0]
+    assert listed["live_events_count"] == 1
+    assert listed["subscriber_count"] == 1
+
+
+def test_featured_events_reflect_online_game_and_tournament_writes(client):
+    host = get_auth_header(client)
+    guest = get_auth_header(client, "guest@example.com")
+    featured = client.get("/channels/featured/events").json()
+    assert featured["total_live"] == 0 and featured["upcoming"] == []
+
+    game = client.post("/online-games", json={"game_type": "chess"}, headers=host).json()
+    client.post(f"/online-games/{game['id']}/join", headers=guest)
+    client.post("/tournaments", json={"name": "Open", "game_type": "chess"}, headers=host)
+
+    featured = client.get("/channels/featured/events").json()
+    assert [e["event_type"] for e in featured["live"]] == ["online_game"]
+    assert [e["title"] for e in featured["upcoming"]] == ["Open"]
+
+    client.post(f"/online-games/{game['id']}/resign", headers=guest)
+
+    assert client.get("/channels/featured/events").json()["total_live"] == 0
+
+
+def test_channel_page_invalidation_is_tag_based(tmp_path, monkeypatch):
+    worker_a = make_worker(tmp_path / "cache.db")
+    worker_b = make_worker(tmp_path / "cache.db")
+    monkeypatch.setattr(cache_module, "list_cache", worker_a)
+    worker_a.set("channel_detail:golf", "page", list_tags("channel_detail", slug="golf") + list_tags("channel_pages"))
+    worker_a.set("channel_detailed:x", "unrelated")
+    assert worker_b.get("channel_detail:golf") == "page"
+
+    invalidate_channel_pages()
+
+    assert worker_b.get("channel_detail:golf") is None
+    assert worker_b.get("channel_detailed:x") == "unrelated"
+    assert {kind for _, kind, _ in worker_a.l2.invalidations_since(0)} == {"tag"}
@@ -0,0 +1,267 @@
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from cachetools import TTLCache
+from prometheus_client import REGISTRY
+from sqlalchemy import event, inspect
+from sqlmodel import Session, SQLModel, select
+
+from app import db
+from app.core.config import settings
+from app.core.pool_stats import long_held_connections
+from app.db import ReplicaSet, RoutingSession, async_database_url, create_sqlite_engine, writer_pool_args
+from app.models import Sport, SportCategory, User, UserFollow
+from tests.test_leagues import get_auth_header
+
+
+def test_async_database_url_picks_asyncio_driver():
+    assert async_database_url("sqlite:///./league.db") == "sqlite+aiosqlite:///./league.db"
+    assert async_database_url("postgresql://u:p@db/league") == "postgresql+asyncpg://u:p@db/league"
+    assert async_database_url("postgresql+psycopg2://u:p@db/league") == "postgresql+asyncpg://u:p@db/league"
+    assert async_database_url("postgres://u:p@db/league") == "postgresql+asyncpg://u:p@db/league"
+
+
+def test_async_read_endpoints_see_sync_writes(client):
+    headers = get_auth_header(client)
+    assert client.get("/notifications/unread-count", headers=headers).json() == {"unread_count": 0}
+    assert client.get("/online-games", headers=headers).json()["total"] == 0
+
+    client.post("/online-games", json={"game_type": "chess"}, headers=headers)
+
+    assert client.get("/online-games", headers=headers).json()["total"] == 1
+
+
+def test_follow_racing_a_duplicate_returns_conflict(client):
+    headers = get_auth_header(client)
+    get_auth_header(client, "other@example.com")
+    raced = []
+
+    # Another request inserts the same follow between our check and our insert.
+    @event.listens_for(db.writer_engine, "before_cursor_execute")
+    def insert_first(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO user_follow") and not raced:
+            raced.append(True)
+            with Session(db.writer_engine) as other:
+                other.add(UserFollow(follower_id=1, following_id=2))
+                other.commit()
+
+    response = client.post("/users/2/follow", headers=headers)
+    event.remove(db.writer_engine, "before_cursor_execute", insert_first)
+
+    assert response.status_code == 409
+    assert client.get("/users/2", headers=headers).json()["follower_count"] == 1
+
+
+def test_in_memory_sqlite_is_rejected():
+    for url in ("sqlite://", "sqlite:///:memory:", "sqlite:///file:league?mode=memory&cache=shared&uri=true"):
+        with pytest.raises(ValueError, match="in-memory"):
+            db.check_database_url(url)
+    db.check_database_url("sqlite:///./league.db")
+
+
+def test_sqlite_connections_get_the_performance_profile(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == settings.sqlite_busy_timeout_ms
+        assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2
+
+
+def test_migrations_build_the_model_schema(tmp_path, monkeypatch):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    monkeypatch.setattr(db, "writer_engine", engine)
+
+    db.init_db()
+
+    with engine.connect() as conn:
+        assert compare_metadata(MigrationContext.configure(conn), SQLModel.metadata) == []
+        indexes = {ix["name"] for ix in inspect(conn).get_indexes("notification")}
+    assert "ix_notification_user_read_created" in indexes
+
+
+def test_init_db_stamps_and_upgrades_a_create_all_database(tmp_path, monkeypatch):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    monkeypatch.setattr(db, "writer_engine", engine)
+    db.init_db()
+    # Roll back to what create_all() built before migrations existed,
+    # including a duplicated follow the new unique constraint forbids.
+    with engine.begin() as conn:
+        config = db.AlembicConfig(str(db.ALEMBIC_INI))
+        config.attributes["connection"] = conn
+        db.command.downgrade(config, db.BASELINE_REVISION)
+        conn.exec_driver_sql("DROP TABLE alembic_version")
+    with Session(engine) as session:
+        session.add_all([User(email="a@example.com", hashed_password="x"), User(email="b@example.com", hashed_password="x")])
+        session.add_all([UserFollow(follower_id=1, following_id=2), UserFollow(follower_id=1, following_id=2)])
+        session.commit()
+
+    db.init_db()
+
+    with Session(engine) as session:
+        assert len(session.exec(select(UserFollow)).all()) == 1
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT version_num FROM alembic_version").scalar() == "0002"
+
+
+def make_routed_engines(tmp_path, monkeypatch):
+    url = f"sqlite:///{tmp_path / 'routed.db'}"
+    reader = create_sqlite_engine(url)
+    writer = create_sqlite_engine(url, **writer_pool_args)
+    SQLModel.metadata.create_all(writer)
+    monkeypatch.setattr(db, "engine", reader)
+    monkeypatch.setattr(db, "writer_engine", writer)
+    return reader, writer
+
+
+def test_routing_session_sends_writes_and_later_reads_to_writer(tmp_path, monkeypatch):
+    reader, writer = make_routed_engines(tmp_path, monkeypatch)
+    used = []
+    event.listen(reader, "before_cursor_execute", lambda *args: used.append("reader"))
+    event.listen(writer, "before_cursor_execute", lambda *args: used.append("writer"))
+
+    with RoutingSession() as session:
+        session.exec(select(Sport)).all()
+        session.add(Sport(name="Golf", category=SportCategory.golf))
+        session.commit()
+        session.exec(select(Sport)).all()
+
+    assert used == ["reader", "writer", "writer"]
+
+
+def test_concurrent_writers_queue_instead_of_failing(tmp_path, monkeypatch):
+    make_routed_engines(tmp_path, monkeypatch)
+
+    def write(i: int) -> None:
+        with RoutingSession() as session:
+            session.add(Sport(name=f"Sport {i}", category=SportCategory.golf))
+            session.commit()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(write, range(40)))
+
+    with RoutingSession() as session:
+        assert len(session.exec(select(Sport)).all()) == 40
+
+
+def make_replicated_db(tmp_path, monkeypatch, replica_count: int = 1) -> list:
+    reader, writer = make_routed_engines(tmp_path, monkeypatch)
+    replica_set = ReplicaSet([f"sqlite:///{tmp_path / f'replica{i}.db'}" for i in range(replica_count)])
+    for i, replica in enumerate(replica_set.replicas):
+        SQLModel.metadata.create_all(replica.engine)
+        with Session(replica.engine) as session:
+            session.add(Sport(name=f"replica {i}", category=SportCategory.golf))
+            session.commit()
+    monkeypatch.setattr(db, "replicas", replica_set)
+    monkeypatch.setattr(db, "_recent_writers", TTLCache(maxsize=100, ttl=60))
+    return replica_set.replicas
+
+
+def sport_names(**info) -> list[str]:
+    with RoutingSession(info=info) as session:
+        return [s.name for s in session.exec(select(Sport)).all()]
+
+
+def test_reads_go_to_replicas_round_robin(tmp_path, monkeypatch):
+    make_replicated_db(tmp_path, monkeypatch, replica_count=2)
+
+    assert {sport_names()[0], sport_names()[0]} == {"replica 0", "replica 1"}
+
+
+def test_non_get_requests_read_from_primary(tmp_path, monkeypatch):
+    make_replicated_db(tmp_path, monkeypatch)
+
+    assert sport_names(primary=True) == []
+
+
+def test_client_that_wrote_reads_from_primary_within_window(tmp_path, monkeypatch):
+    make_replicated_db(tmp_path, monkeypatch)
+
+    with RoutingSession(info={"client_key": "alice", "primary": True}) as session:
+        session.add(Sport(name="primary", category=SportCategory.golf))
+        session.commit()
+
+    assert sport_names(client_key="alice") == ["primary"]
+    assert sport_names(client_key="bob") == ["replica 0"]
+
+
+def test_app_writes_mark_the_client_as_a_recent_writer(client, monkeypatch):
+    monkeypatch.setattr(db, "_recent_writers", TTLCache(maxsize=100, ttl=60))
+    headers = get_auth_header(client)
+    key = hashlib.sha256(headers["Authorization"].encode()).hexdigest()
+    assert not db.wrote_recently(key)
+
+    client.post("/sports", json={"name": "Golf", "category": "golf"}, headers=headers)
+
+    assert db.wrote_recently(key)
+
+
+def test_lagging_replica_does_not_refill_the_list_cache(client, tmp_path, monkeypatch):
+    replica_set = ReplicaSet([f"sqlite:///{tmp_path / 'stale.db'}"])
+    SQLModel.metadata.create_all(replica_set.replicas[0].engine)
+    monkeypatch.setattr(db, "replicas", replica_set)
+    monkeypatch.setattr(db, "_recent_writers", TTLCache(maxsize=100, ttl=60))
+    headers = get_auth_header(client)
+    # Another client, so its reads are not pinned to the primary by the writes above.
+    reader = {"Authorization": "Bearer someone-else"}
+    assert client.get("/sports", headers=reader).json()["total"] == 0
+
+    # The write invalidates the cached page; the replica never sees it.
+    client.post("/sports", json={"name": "Golf", "category": "golf"}, headers=headers)
+
+    assert [s["name"] for s in client.get("/sports", headers=reader).json()["items"]] == ["Golf"]
+    assert [s["name"] for s in client.get("/sports", headers=headers).json()["items"]] == ["Golf"]
+    replica_set.replicas[0].engine.dispose()
+
+
+def test_dead_replica_is_ejected_and_readmitted(tmp_path, monkeypatch):
+    replica, = make_replicated_db(tmp_path, monkeypatch)
+    replica_set = db.replicas
+    healthy_engine = replica.engine
+
+    replica.engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    replica_set.check_health()
+
+    assert replica.healthy is False
+    assert sport_names() == []
+
+    replica.engine = healthy_engine
+    replica_set.check_health()
+
+    assert replica.healthy is True
+    assert sport_names() == ["replica 0"]
+
+
+def test_pool_metrics_report_checked_out_connections(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'pooled.db'}", pool_logging_name="test_pool")
+
+    with engine.connect():
+        assert REGISTRY.get_sample_value("db_pool_checked_out", {"pool": "test_pool"}) == 1
+        assert REGISTRY.get_sample_value("db_pool_size", {"pool": "test_pool"}) == 5
+
+    assert REGISTRY.get_sample_value("db_pool_checked_out", {"pool": "test_pool"}) == 0
+    assert REGISTRY.get_sample_value("db_pool_checkout_seconds_count", {"pool": "test_pool"}) == 1
+    engine.dispose()
+
+
+def test_pool_debug_mode_reports_where_long_held_connections_came_from(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "db_pool_debug", True)
+    monkeypatch.setattr(settings, "db_pool_hold_warning_s", 0)
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'leaky.db'}", pool_logging_name="leaky")
+
+    conn = engine.connect()
+    held = [c for c in long_held_connections() if c["pool"] == "leaky"]
+    assert len(held) == 1
+    assert "test_db.py" in held[0]["checkout_site"]
+
+    with caplog.at_level(logging.WARNING, logger="app.core.pool_stats"):
+        conn.close()
+
+    assert not [c for c in long_held_connections() if c["pool"] == "leaky"]
+    assert any(getattr(r, "pool", None) == "leaky" for r in caplog.records)
+    engine.dispose()
@@ -213,7 +213,7 @@ def test_update_league_partial(client: TestClient):
 def test_health_endpoint(client: TestClient):
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"ok": True}
+    assert response.json()["ok"] is True
 
 
 def test_ai_policy_endpoint(client: TestClient):
@@ -223,3 +223,22 @@ def test_ai_policy_endpoint(client: TestClient):
     assert "data_sent" in data
     assert "data_never_sent" in data
     assert "policy_version" in data
+
+
+def test_get_league_reflects_update_and_delete(client: TestClient):
+    headers = get_auth_header(client)
+    venue = create_venue(client, headers, "Cached Detail Venue")
+    sport = create_sport(client, headers, "Cached Detail Sport")
+    league = client.post(
+        "/leagues",
+        json={"name": "Cached League", "venue_id": venue["id"], "sport_id": sport["id"]},
+        headers=headers
+    ).json()
+
+    assert client.get(f"/leagues/{league['id']}").json()["name"] == "Cached League"
+
+    client.patch(f"/leagues/{league['id']}", json={"name": "Renamed League"}, headers=headers)
+    assert client.get(f"/leagues/{league['id']}").json()["name"] == "Renamed League"
+
+    client.delete(f"/leagues/{league['id']}", headers=headers)
+    assert client.get(f"/leagues/{league['id']}").status_code == 404
@@ -0,0 +1,110 @@
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.config import settings
+from app.core.middleware import CompressionMiddleware, RequestIdMiddleware
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_request_metrics_use_the_route_template(client):
+    labels = {"method": "GET", "endpoint": "/games/{game_id}"}
+    before = sample("http_requests_total", status="404", **labels)
+    latency_before = sample("http_request_duration_seconds_count", **labels)
+
+    client.get("/games/1")
+    client.get("/games/2")
+
+    assert sample("http_requests_total", status="404", **labels) == before + 2
+    assert sample("http_request_duration_seconds_count", **labels) == latency_before + 2
+    assert REGISTRY.get_sample_value("http_requests_total", {"method": "GET", "endpoint": "/games/1", "status": "404"}) is None
+
+
+def test_response_size_and_in_flight_gauge(client):
+    labels = {"method": "GET", "endpoint": "/sports"}
+    size_before = sample("http_response_size_bytes_sum", **labels)
+
+    response = client.get("/sports")
+
+    assert sample("http_response_size_bytes_sum", **labels) == size_before + len(response.content)
+    assert sample("http_requests_in_progress", method="GET") == 0
+
+
+def test_unknown_paths_share_one_series(client):
+    before = sample("http_requests_total", method="GET", endpoint="unmatched", status="404")
+
+    client.get("/no/such/path/123")
+
+    assert sample("http_requests_total", method="GET", endpoint="unmatched", status="404") == before + 1
+
+
+def test_request_id_and_security_headers(client):
+    response = client.get("/sports")
+
+    assert len(response.headers["x-request-id"]) > 0
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
+    assert "strict-transport-security" not in response.headers
+
+
+def test_client_request_id_is_echoed(client):
+    response = client.get("/sports", headers={"X-Request-ID": "abc-123"})
+
+    assert response.headers["x-request-id"] == "abc-123"
+
+
+def test_hsts_in_production(monkeypatch):
+    monkeypatch.setattr(settings, "environment", "production")
+    app = Starlette(routes=[Route("/", lambda request: PlainTextResponse("ok"))])
+    app.add_middleware(RequestIdMiddleware)
+
+    response = TestClient(app).get("/")
+
+    assert response.headers["strict-transport-security"] == "max-age=31536000; includeSubDomains"
+
+
+def compressing_app(response) -> TestClient:
+    app = Starlette(routes=[Route("/", lambda request: response)])
+    app.add_middleware(CompressionMiddleware)
+    return TestClient(app)
+
+
+def test_large_text_responses_are_gzipped():
+    client = compressing_app(PlainTextResponse("league " * 500))
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < 3500
+    assert response.text == "league " * 500
+
+
+def test_small_and_binary_responses_are_left_alone():
+    small = compressing_app(PlainTextResponse("ok")).get("/", headers={"Accept-Encoding": "gzip"})
+    binary = compressing_app(Response(b"\0" * 5000, media_type="image/png")).get("/", headers={"Accept-Encoding": "gzip"})
+    refused = compressing_app(PlainTextResponse("x" * 5000)).get("/", headers={"Accept-Encoding": "gzip;q=0"})
+
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in binary.headers
+    assert "content-encoding" not in refused.headers
+
+
+def test_streamed_responses_are_compressed_incrementally():
+    async def chunks():
+        for i in range(50):
+            yield f"chunk {i} ".encode() * 20
+
+    response = compressing_app(StreamingResponse(chunks(), media_type="text/plain")).get(
+        "/", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.content == b"".join(f"chunk {i} ".encode() * 20 for i in range(50))
@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from cachetools import TTLCache
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app import schemas
+from app.core.cache import list_cache
+from app.models import Game, GameStatus, Sport, SportCategory
+
+
+def add_games(session, count: int) -> None:
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        # Every third game is unscheduled and pairs share a start time, so
+        # the cursor has to break ties on later keys and step over NULLs.
+        start_time = None if i % 3 == 0 else start + timedelta(days=i // 2)
+        session.add(Game(season_id=1, status=GameStatus.scheduled, start_time=start_time, created_at=start))
+    session.commit()
+
+
+def test_cursor_walk_matches_page_order(client, session):
+    add_games(session, 23)
+
+    paged = []
+    for page in (1, 2, 3):
+        body = client.get("/games", params={"page": page, "page_size": 10}).json()
+        paged += [g["id"] for g in body["items"]]
+
+    walked = []
+    body = client.get("/games", params={"page_size": 10}).json()
+    walked += [g["id"] for g in body["items"]]
+    while body["next_cursor"]:
+        body = client.get("/games", params={"page_size": 10, "cursor": body["next_cursor"]}).json()
+        assert body["page"] is None
+        walked += [g["id"] for g in body["items"]]
+
+    assert len(paged) == 23
+    assert walked == paged
+
+
+def test_last_page_has_no_next_cursor(client, session):
+    add_games(session, 10)
+
+    body = client.get("/games", params={"page_size": 10}).json()
+
+    assert len(body["items"]) == 10
+    assert body["next_cursor"] is None
+
+
+def test_malformed_cursor_is_rejected(client):
+    response = client.get("/games", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_total_none_skips_the_count_and_reports_has_more(client, session):
+    add_games(session, 23)
+
+    first = client.get("/games", params={"page_size": 10, "total": "none"}).json()
+    last = client.get("/games", params={"page": 3, "page_size": 10, "total": "none"}).json()
+
+    assert first["total"] is None and first["pages"] is None
+    assert first["has_more"] is True
+    assert len(last["items"]) == 3
+    assert last["has_more"] is False
+
+
+def test_offset_only_lists_report_has_more(client, session):
+    for name in ("Golf", "Bowling", "Tennis"):
+        session.add(Sport(name=name, category=SportCategory.other))
+    session.commit()
+
+    body = client.get("/sports", params={"page_size": 2, "total": "none"}).json()
+
+    assert [s["name"] for s in body["items"]] == ["Bowling", "Golf"]
+    assert body["has_more"] is True
+    assert body["total"] is None
+
+
+def test_estimated_total_is_served_from_the_count_cache(client, session, monkeypatch):
+    monkeypatch.setattr(schemas, "_count_cache", TTLCache(maxsize=100, ttl=60))
+    add_games(session, 5)
+    assert client.get("/games", params={"total": "estimate"}).json()["total"] == 5
+
+    add_games(session, 1)
+    list_cache.clear()
+
+    assert client.get("/games", params={"total": "estimate"}).json()["total"] == 5
+    assert client.get("/games", params={"total": "exact"}).json()["total"] == 6
+
+
+def test_sync_and_async_estimates_share_the_count_cache(session, database_path, monkeypatch):
+    monkeypatch.setattr(schemas, "_count_cache", TTLCache(maxsize=100, ttl=60))
+    count_stmt = select(func.count()).select_from(Game).where(Game.season_id == 1)
+    add_games(session, 5)
+    assert schemas.count_total(session, count_stmt, schemas.TotalMode.estimate) == 5
+
+    add_games(session, 1)
+
+    async def count_async() -> tuple[int | None, int | None]:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
+        async with AsyncSession(engine) as async_session:
+            estimate = await schemas.count_total_async(async_session, count_stmt, schemas.TotalMode.estimate)
+            exact = await schemas.count_total_async(async_session, count_stmt, schemas.TotalMode.exact)
+        await engine.dispose()
+        return estimate, exact
+
+    assert asyncio.run(count_async()) == (5, 6)
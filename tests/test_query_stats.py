@@ -0,0 +1,93 @@
+import logging
+
+import pytest
+from sqlmodel import Session, SQLModel, select
+
+from app.core import query_stats
+from app.core.config import settings
+from app.core.query_stats import (
+    QueryStats,
+    RepeatedQueryError,
+    query_stats_var,
+    redact_parameters,
+    statement_shape,
+)
+from app.db import create_sqlite_engine
+from app.models import Sport, SportCategory
+
+
+def test_response_reports_db_time_and_statement_count(client):
+    response = client.get("/sports")
+
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="2 queries"' in response.headers["server-timing"]
+
+
+def test_db_histograms_are_labelled_by_route_template(client):
+    client.get("/games/12345")
+
+    body = client.get("/metrics").text
+
+    assert 'db_queries_per_request_count{method="GET",route="/games/{game_id}"}' in body
+    assert 'db_time_per_request_seconds_count{method="GET",route="/games/{game_id}"}' in body
+
+
+def test_statement_shape_ignores_in_list_length():
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?)") == statement_shape(
+        "SELECT *\n  FROM t WHERE id IN (?, ?, ?, ?)"
+    )
+
+
+def test_repeated_statement_fails_in_strict_mode(session):
+    token = query_stats_var.set(QueryStats())
+    try:
+        with pytest.raises(RepeatedQueryError):
+            for sport_id in range(20):
+                session.get(Sport, sport_id)
+    finally:
+        query_stats_var.reset(token)
+
+
+
+def test_redact_parameters_hides_strings():
+    assert redact_parameters((3, "secret@example.com", None)) == [3, "<str>", None]
+    assert redact_parameters({"email": "a@b.c", "id": 1}) == {"email": "<str>", "id": 1}
+
+
+def test_slow_query_is_logged_with_route_and_plan_once(client, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 0.000001)
+    monkeypatch.setattr(query_stats, "_explained_shapes", set())
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        client.get("/games/12345")
+        client.get("/games/12346")
+
+    slow = [r for r in caplog.records if getattr(r, "event", None) == "slow_query" and "FROM game" in r.statement]
+    assert len(slow) == 2
+    assert slow[0].route == "/games/{game_id}"
+    assert slow[0].request_id
+    assert slow[0].parameters[0] == 12345
+    assert slow[0].plan and "game" in " ".join(slow[0].plan).lower()
+    # The plan is captured once per statement shape.
+    assert slow[1].plan is None
+
+
+def test_failed_explain_leaves_the_transaction_usable(tmp_path, monkeypatch, caplog):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'explain.db'}")
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 0.000001)
+    monkeypatch.setattr(query_stats, "_explained_shapes", set())
+    monkeypatch.setattr(query_stats, "_EXPLAIN_PREFIX", {"sqlite": "EXPLAIN NONSENSE "})
+
+    with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+        with Session(engine) as session:
+            session.add(Sport(name="Golf", category=SportCategory.golf))
+            session.flush()
+            assert session.exec(select(Sport)).one().name == "Golf"
+            session.commit()
+
+    plans = [r.plan for r in caplog.records if getattr(r, "event", None) == "slow_query" and r.plan]
+    assert plans and plans[0][0].startswith("EXPLAIN failed")
+    with Session(engine) as session:
+        assert session.exec(select(Sport.name)).all() == ["Golf"]
+    engine.dispose()
@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+from enum import Enum
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.core.responses import render_json
+
+
+class Colour(str, Enum):
+    red = "red"
+
+
+class Item(BaseModel):
+    name: str
+    colour: Colour
+    at: datetime
+
+
+def test_render_json_matches_pydantic_for_models_and_plain_data():
+    item = Item(name="ü", colour=Colour.red, at=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    plain = {"at": datetime(2024, 1, 1, 12, 30, 0, 500), "colour": Colour.red, 1: None}
+
+    assert render_json(item) == to_json(item)
+    assert render_json({"items": [item], "total": 1}) == to_json({"items": [item], "total": 1})
+    assert render_json(plain) == to_json(plain)
+
+
+def test_app_responses_are_compact_json(client):
+    response = client.get("/sports")
+
+    assert response.headers["content-type"] == "application/json"
+    assert b": " not in response.content and b", " not in response.content
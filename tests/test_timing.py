@@ -0,0 +1,51 @@
+import asyncio
+
+from prometheus_client import REGISTRY
+
+from app.core.timing import RequestTimings, request_timings_var, span
+from tests.test_leagues import get_auth_header
+
+
+def test_span_times_blocks_and_functions_without_double_counting():
+    @span("engine")
+    def outer():
+        with span("engine"):
+            return inner()
+
+    @span("engine")
+    def inner():
+        return 42
+
+    @span("auth")
+    async def load():
+        return "user"
+
+    timings = RequestTimings()
+    recorded = []
+    timings.add = lambda name, elapsed: recorded.append(name)
+    token = request_timings_var.set(timings)
+    try:
+        assert outer() == 42
+        assert asyncio.run(load()) == "user"
+        with span("render"):
+            pass
+    finally:
+        request_timings_var.reset(token)
+
+    assert recorded == ["engine", "auth", "render"]
+    assert outer() == 42  # outside a request it is a no-op
+
+
+def test_server_timing_carries_spans_next_to_db(client):
+    headers = get_auth_header(client)
+    game_id = client.post("/online-games", json={"game_type": "chess"}, headers=headers).json()["id"]
+    labels = {"method": "GET", "route": "/online-games/{game_id}"}
+    before = REGISTRY.get_sample_value("request_span_seconds_count", {**labels, "span": "engine"}) or 0
+
+    response = client.get(f"/online-games/{game_id}", headers=headers)
+
+    [server_timing] = response.headers.get_list("server-timing")
+    entries = [entry.split(";")[0] for entry in server_timing.split(", ")]
+    assert entries[0] == "db"
+    assert {"auth", "engine", "render", "total"} <= set(entries)
+    assert REGISTRY.get_sample_value("request_span_seconds_count", {**labels, "span": "engine"}) == before + 1